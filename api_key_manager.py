@@ -91,6 +91,13 @@ class APIKeyManager:
         then falls back to embedded keys for supported services.
         If found, also sets the environment variable.
         """
+        return self.get_keys([service])[service]
+
+    def get_keys(self, services) -> dict:
+        """Get several API keys, reading the key file at most once.
+
+        Each key is resolved the same way as get_key().
+        """
         env_mapping = {
             "steamgriddb": "SGDB_API_KEY",
             "igdb_client_id": "IGDB_CLIENT_ID",
@@ -98,29 +105,37 @@ class APIKeyManager:
             "thegamesdb": "TGDB_API_KEY"
         }
 
-        env_key = env_mapping.get(service)
-
-        # Environment variables take precedence
-        if env_key and os.environ.get(env_key):
-            return os.environ.get(env_key, "")
-
-        # Fall back to stored keys
-        keys = self.load_keys()
-        stored_key = keys.get(service, "")
-
-        # If we found a stored key, also set the environment variable
-        if stored_key and env_key:
-            os.environ[env_key] = stored_key
-            return stored_key
-
-        # Fall back to embedded keys for supported services
-        if service == "thegamesdb":
-            embedded_key = _get_embedded_tgdb_key()
-            if embedded_key and env_key:
-                os.environ[env_key] = embedded_key
-            return embedded_key
-
-        return stored_key
+        keys = None
+        result = {}
+        for service in services:
+            env_key = env_mapping.get(service)
+
+            # Environment variables take precedence
+            if env_key and os.environ.get(env_key):
+                result[service] = os.environ.get(env_key, "")
+                continue
+
+            # Fall back to stored keys
+            if keys is None:
+                keys = self.load_keys()
+            stored_key = keys.get(service, "")
+
+            # If we found a stored key, also set the environment variable
+            if stored_key and env_key:
+                os.environ[env_key] = stored_key
+                result[service] = stored_key
+                continue
+
+            # Fall back to embedded keys for supported services
+            if service == "thegamesdb":
+                embedded_key = _get_embedded_tgdb_key()
+                if embedded_key and env_key:
+                    os.environ[env_key] = embedded_key
+                result[service] = embedded_key
+                continue
+
+            result[service] = stored_key
+        return result
 
     def set_key(self, service: str, key: str):
         """Set a specific API key."""
@@ -4,11 +4,14 @@ Allows browsing and replacing existing assets on connected Android devices via A
 """
 import os
 import re
+import logging
 import sys
+import time
 import subprocess
 import shutil
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from pathlib import Path
-from typing import List, Optional, Tuple, Dict
+from typing import Callable, Iterable, Iterator, List, Optional, Set, Tuple, Dict
 
 from PySide6.QtCore import Qt, QThread, Signal
 from PySide6.QtWidgets import (
@@ -20,6 +23,8 @@ from PySide6.QtWidgets import (
 
 from adb_setup import is_adb_installed
 
+logger = logging.getLogger(__name__)
+
 
 def get_subprocess_kwargs():
     """Get platform-specific subprocess kwargs to hide console windows on Windows."""
@@ -47,42 +52,65 @@ def normalize_game_name(name: str) -> str:
     return normalized.lower().strip()
 
 
-def find_matching_local_folder(device_game_name: str, local_folders: List[Path]) -> Optional[Path]:
-    """Find a local folder that matches the device game name using fuzzy matching."""
-    device_normalized = normalize_game_name(device_game_name)
+def index_game_names(values: Iterable, name_of: Callable[[object], str] = str) -> List[Tuple[object, str, Set[str]]]:
+    """Normalize game names once for repeated matching.
+
+    Returns (value, normalized_name, word_set) tuples for use with best_name_match.
+    """
+    indexed = []
+    for value in values:
+        normalized = normalize_game_name(name_of(value))
+        indexed.append((value, normalized, set(normalized.split())))
+    return indexed
+
+
+def best_name_match(name: str, candidates: List[Tuple[object, str, Set[str]]]) -> Optional[object]:
+    """Find the candidate that best matches a game name using fuzzy matching.
+
+    Candidates come from index_game_names, so each one is only normalized once.
+    """
+    target_normalized = normalize_game_name(name)
+    target_words = set(target_normalized.split())
 
     best_match = None
     best_score = 0
 
-    for folder in local_folders:
-        local_normalized = normalize_game_name(folder.name)
-
+    for value, normalized, words in candidates:
         # Exact match after normalization
-        if device_normalized == local_normalized:
-            return folder
+        if target_normalized == normalized:
+            return value
 
         # Check if one contains the other
-        if device_normalized in local_normalized or local_normalized in device_normalized:
+        if target_normalized in normalized or normalized in target_normalized:
             # Score based on length similarity
-            score = min(len(device_normalized), len(local_normalized)) / max(len(device_normalized), len(local_normalized))
+            score = min(len(target_normalized), len(normalized)) / max(len(target_normalized), len(normalized))
             if score > best_score:
                 best_score = score
-                best_match = folder
+                best_match = value
 
         # Check word overlap
-        device_words = set(device_normalized.split())
-        local_words = set(local_normalized.split())
-        if device_words and local_words:
-            overlap = len(device_words & local_words)
-            total = len(device_words | local_words)
+        if target_words and words:
+            overlap = len(target_words & words)
+            total = len(target_words | words)
             score = overlap / total if total > 0 else 0
             if score > best_score and score >= 0.5:  # At least 50% word overlap
                 best_score = score
-                best_match = folder
+                best_match = value
 
     return best_match if best_score >= 0.5 else None
 
 
+def find_matching_local_folder(device_game_name: str, local_folders: List[Path]) -> Optional[Path]:
+    """Find a local folder that matches the device game name using fuzzy matching."""
+    return best_name_match(device_game_name, index_game_names(local_folders, lambda f: f.name))
+
+
+def list_game_files(folder) -> List[str]:
+    """List the paths of the files directly inside a game folder."""
+    with os.scandir(folder) as entries:
+        return [entry.path for entry in entries if entry.is_file()]
+
+
 def get_adb_path() -> Optional[str]:
     """Find ADB executable path."""
     adb_path = shutil.which("adb")
@@ -105,17 +133,17 @@ def list_device_directory(adb_path: str, device_path: str) -> List[str]:
             [adb_path, "shell", f'ls -1 "{device_path}"'],
             timeout=30, **kwargs
         )
-        print(f"[DEBUG] ls '{device_path}' returncode={result.returncode}")
+        logger.debug("ls '%s' returncode=%s", device_path, result.returncode)
         if result.stderr:
-            print(f"[DEBUG] ls stderr: {result.stderr[:200]}")
+            logger.debug("ls stderr: %s", result.stderr[:200])
         if result.returncode == 0:
             items = result.stdout.strip().split('\n')
             clean_items = [item.strip() for item in items if item.strip()]
-            print(f"[DEBUG] Found {len(clean_items)} items in {device_path}")
+            logger.debug("Found %d items in %s", len(clean_items), device_path)
             return clean_items
         return []
     except Exception as e:
-        print(f"[DEBUG] list_device_directory exception: {e}")
+        logger.debug("list_device_directory exception: %s", e)
         return []
 
 
@@ -129,10 +157,10 @@ def check_path_is_directory(adb_path: str, device_path: str) -> bool:
             timeout=10, **kwargs
         )
         is_dir = "yes" in result.stdout
-        print(f"[DEBUG] check_path_is_directory '{device_path}' = {is_dir}")
+        logger.debug("check_path_is_directory '%s' = %s", device_path, is_dir)
         return is_dir
     except Exception as e:
-        print(f"[DEBUG] check_path_is_directory exception: {e}")
+        logger.debug("check_path_is_directory exception: %s", e)
         return False
 
 
@@ -154,9 +182,9 @@ class DeviceScanThread(QThread):
 
             # List platform folders
             self.progress.emit("Scanning platforms...")
-            print(f"[DEBUG] Scanning base path: {self.device_base_path}")
+            logger.debug("Scanning base path: %s", self.device_base_path)
             platforms = list_device_directory(self.adb_path, self.device_base_path)
-            print(f"[DEBUG] Found platforms: {platforms}")
+            logger.debug("Found platforms: %s", platforms)
 
             for platform in platforms:
                 if not platform:
@@ -173,10 +201,10 @@ class DeviceScanThread(QThread):
                         [self.adb_path, "shell", f'ls -la "{platform_path}"'],
                         timeout=60, **kwargs
                     )
-                    print(f"[DEBUG] ls -la {platform_path} returncode={result.returncode}")
+                    logger.debug("ls -la %s returncode=%s", platform_path, result.returncode)
 
                     if result.returncode != 0:
-                        print(f"[DEBUG] ls -la failed: {result.stderr[:200] if result.stderr else 'no stderr'}")
+                        logger.debug("ls -la failed: %s", result.stderr[:200] if result.stderr else "no stderr")
                         continue
 
                     # Parse ls -la output to find directories
@@ -196,7 +224,7 @@ class DeviceScanThread(QThread):
                                 if name and name not in ('.', '..'):
                                     games.append(name)
 
-                    print(f"[DEBUG] Found {len(games)} game folders in {platform}")
+                    logger.debug("Found %d game folders in %s", len(games), platform)
 
                     if games:
                         assets[platform] = []
@@ -211,10 +239,10 @@ class DeviceScanThread(QThread):
                             })
 
                 except subprocess.TimeoutExpired:
-                    print(f"[DEBUG] Timeout scanning {platform}")
+                    logger.debug("Timeout scanning %s", platform)
                     continue
                 except Exception as e:
-                    print(f"[DEBUG] Error scanning {platform}: {e}")
+                    logger.debug("Error scanning %s: %s", platform, e)
                     continue
 
             self.finished.emit(assets)
@@ -224,51 +252,126 @@ class DeviceScanThread(QThread):
 
 
 class DevicePushThread(QThread):
-    """Thread for pushing assets to device."""
+    """Thread for pushing assets to device.
+
+    Files that go into the same device folder are sent with a single
+    ``adb push`` so ADB reuses one sync session per game folder instead of
+    opening a new transport for every file. Batches are pushed concurrently
+    by a small thread pool.
+    """
     progress = Signal(int, int, str)
     finished = Signal(int, int, list)  # copied, errors, list of successfully pushed game folders
     error = Signal(str)
 
-    def __init__(self, adb_path: str, items: List[Tuple[str, str]]):
+    # Per-file timeout, scaled by batch size for grouped pushes
+    PUSH_TIMEOUT = 60
+    # Files below this size ride along in grouped pushes; larger ones go alone
+    SMALL_FILE_BYTES = 64 * 1024
+
+    # Concurrent adb pushes; the adb server handles several transfers at once
+    MAX_WORKERS = 4
+    # Minimum seconds between progress signals, so the GUI isn't flooded
+    PROGRESS_INTERVAL = 0.05
+
+    def __init__(self, adb_path: str, games: List[Tuple[str, List[str]]], total: int,
+                 max_workers: int = MAX_WORKERS):
         super().__init__()
         self.adb_path = adb_path
-        self.items = items  # List of (local_path, device_path) tuples
+        self.games = games  # List of (device_game_prefix, local_file_paths) per game folder
+        self.total = total
+        self.max_workers = max(1, max_workers)
+
+    @classmethod
+    def _iter_batches(cls, games: List[Tuple[str, List[str]]]) -> Iterator[Tuple[str, List[str]]]:
+        """Yield (device_target, local_paths) push batches one game at a time.
+
+        A game's small files keep their local names, so they share a single
+        push into the game's device folder. Large files are pushed alone to
+        their exact device path.
+        """
+        for device_game_prefix, local_paths in games:
+            small = []
+            for local_path in local_paths:
+                try:
+                    if os.path.getsize(local_path) >= cls.SMALL_FILE_BYTES:
+                        yield device_game_prefix + os.path.basename(local_path), [local_path]
+                        continue
+                except OSError:
+                    pass  # Let adb report the problem
+                small.append(local_path)
+            if len(small) == 1:
+                yield device_game_prefix + os.path.basename(small[0]), small
+            elif small:
+                yield device_game_prefix.rstrip("/"), small
+
+    def _push(self, local_paths: List[str], device_target: str) -> bool:
+        """Run one adb push for the given files. Returns True on success."""
+        kwargs = get_subprocess_kwargs()
+        result = subprocess.run(
+            [self.adb_path, "push", *local_paths, device_target],
+            timeout=self.PUSH_TIMEOUT * len(local_paths), **kwargs
+        )
+        if result.returncode != 0:
+            logger.warning("Push failed: %s", result.stderr)
+        return result.returncode == 0
+
+    def _push_batch(self, device_target: str, local_paths: List[str]) -> List[str]:
+        """Push one batch and return the local paths that made it to the device."""
+        logger.debug("Pushing %d FILE(S) from: %s -> TO: %s",
+                     len(local_paths), os.path.dirname(local_paths[0]), device_target)
+
+        try:
+            # adb push handles paths with spaces correctly
+            if self._push(local_paths, device_target):
+                return local_paths
+            if len(local_paths) > 1:
+                # Retry one by one so a single bad file doesn't fail the folder
+                return [p for p in local_paths
+                        if self._push([p], f"{device_target}/{os.path.basename(p)}")]
+        except Exception as e:
+            logger.warning("Push exception: %s", e)
+        return []
 
     def run(self):
         """Push asset FILES to existing device folders (not creating new folders)."""
         try:
             copied = 0
             errors = 0
-            total = len(self.items)
+            done = 0
+            total = self.total
             successful_folders = set()  # Track which LOCAL game folders were fully pushed
 
-            for i, (local_path, device_path) in enumerate(self.items):
-                self.progress.emit(i + 1, total, Path(local_path).name)
-                print(f"[DEBUG] Pushing FILE: {local_path}")
-                print(f"[DEBUG]      -> TO: {device_path}")
-
-                try:
-                    # Push file to existing device folder
-                    # adb push handles paths with spaces correctly
-                    kwargs = get_subprocess_kwargs()
-                    result = subprocess.run(
-                        [self.adb_path, "push", local_path, device_path],
-                        timeout=60, **kwargs
-                    )
-
-                    if result.returncode == 0:
-                        copied += 1
+            last_progress = 0.0
+
+            batches = self._iter_batches(self.games)
+            pending = {}
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                while True:
+                    # Keep a couple of batches queued per worker; the rest are built as these finish
+                    for device_target, local_paths in batches:
+                        future = executor.submit(self._push_batch, device_target, local_paths)
+                        pending[future] = local_paths
+                        if len(pending) >= self.max_workers * 2:
+                            break
+                    if not pending:
+                        break
+
+                    # Results are collected on this thread, so the counters need no lock
+                    completed, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in completed:
+                        local_paths = pending.pop(future)
+                        pushed = future.result()
+
+                        done += len(local_paths)
+                        copied += len(pushed)
+                        errors += len(local_paths) - len(pushed)
                         # Track the parent game folder (local) for deletion later
-                        game_folder = str(Path(local_path).parent)
-                        successful_folders.add(game_folder)
-                        print(f"[DEBUG] Push success: {Path(local_path).name}")
-                    else:
-                        errors += 1
-                        print(f"[DEBUG] Push failed: {result.stderr}")
+                        successful_folders.update(str(Path(p).parent) for p in pushed)
 
-                except Exception as e:
-                    errors += 1
-                    print(f"[DEBUG] Push exception: {e}")
+                        now = time.monotonic()
+                        if done == total or now - last_progress >= self.PROGRESS_INTERVAL:
+                            last_progress = now
+                            self.progress.emit(done, total, Path(local_paths[-1]).name)
 
             self.finished.emit(copied, errors, list(successful_folders))
 
@@ -276,6 +379,32 @@ class DevicePushThread(QThread):
             self.error.emit(str(e))
 
 
+class LocalDeleteThread(QThread):
+    """Thread for deleting local game folders after they were pushed."""
+    finished = Signal(int, int)  # deleted, errors
+
+    def __init__(self, folders: List[str]):
+        super().__init__()
+        self.folders = folders
+
+    def run(self):
+        """Remove each folder, treating already-missing folders as done."""
+        deleted_count = 0
+        delete_errors = 0
+
+        for folder_path in self.folders:
+            try:
+                shutil.rmtree(folder_path)
+                deleted_count += 1
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning("Error deleting %s: %s", folder_path, e)
+                delete_errors += 1
+
+        self.finished.emit(deleted_count, delete_errors)
+
+
 class DeviceAssetDialog(QDialog):
     """Dialog for managing assets on connected Android device.
 
@@ -298,6 +427,18 @@ class DeviceAssetDialog(QDialog):
         self.device_base_path = self.device_base_path.rstrip("/")
         self.adb_path = get_adb_path()
         self.device_assets = {}
+        # Built once per device scan and shared by the local -> device matchers
+        self._device_name_index: Dict[str, List[str]] = {}
+        self._device_norm_index: Dict[str, List[Tuple[object, str, Set[str]]]] = {}
+        # Lowercased name -> device name, checked before any fuzzy scoring
+        self._device_name_lc: Dict[str, Dict[str, str]] = {}
+        # How many lookups were resolved by the hash lookup vs. fuzzy scoring
+        self._match_stats = {"fast": 0, "fuzzy": 0}
+        self._device_match_cache: Dict[Tuple[str, str], Optional[str]] = {}
+        # Device game -> local folder matches, cleared whenever either side reloads
+        self._local_match_cache: Dict[Tuple[str, str], Optional[Path]] = {}
+        # Platform -> (folder names, normalized folder index), listed once with scandir
+        self._local_folder_index: Dict[str, Tuple[Set[str], List[Tuple[object, str, Set[str]]]]] = {}
 
         self._setup_ui()
         self._check_adb()
@@ -468,6 +609,22 @@ class DeviceAssetDialog(QDialog):
     def _on_scan_finished(self, assets: dict):
         """Handle scan completion."""
         self.device_assets = assets
+        self._device_name_index = {
+            platform: [g["name"] for g in games] for platform, games in assets.items()
+        }
+        self._device_norm_index = {
+            platform: index_game_names(names) for platform, names in self._device_name_index.items()
+        }
+        self._device_name_lc = {}
+        for platform, names in self._device_name_index.items():
+            lookup = self._device_name_lc[platform] = {}
+            for name in reversed(names):
+                lookup[name.lower()] = name  # First name wins for case-only duplicates
+            lookup.update((name, name) for name in names)  # Exact names always win
+        self._match_stats = {"fast": 0, "fuzzy": 0}
+        self._device_match_cache = {}
+        self._local_match_cache = {}
+        self._local_folder_index = {}
         self.btn_scan.setEnabled(True)
         self.progress_bar.setVisible(False)
 
@@ -511,6 +668,8 @@ class DeviceAssetDialog(QDialog):
     def _load_local_assets(self):
         """Load local output assets."""
         self.local_tree.clear()
+        self._local_match_cache = {}
+        self._local_folder_index = {}
 
         output_path = Path(self.output_dir)
         if not output_path.exists():
@@ -569,27 +728,46 @@ class DeviceAssetDialog(QDialog):
         has_selection = len(selected) > 0
         self.btn_replace_selected.setEnabled(has_selection)
 
-    def _get_checked_local_items(self) -> Tuple[List[Tuple[str, str]], List[str], List[str]]:
-        """Get list of checked local items with fuzzy matching to device folders.
+    def _match_device_game(self, platform_name: str, local_game_name: str) -> Optional[str]:
+        """Get the device folder name for a local game, or None if nothing matches.
+
+        Results are cached until the next device scan.
+        """
+        key = (platform_name, local_game_name)
+        if key not in self._device_match_cache:
+            lookup = self._device_name_lc.get(platform_name, {})
+            # First try exact / case-insensitive match, then fuzzy matching
+            match = lookup.get(local_game_name) or lookup.get(local_game_name.lower())
+            if match:
+                self._match_stats["fast"] += 1
+            else:
+                self._match_stats["fuzzy"] += 1
+                match = best_name_match(local_game_name, self._device_norm_index.get(platform_name, []))
+            self._device_match_cache[key] = match
+        return self._device_match_cache[key]
+
+    def _get_checked_local_items(self) -> Tuple[List[Tuple[str, List[str]]], int, List[str], List[str]]:
+        """Get checked local items with fuzzy matching to device folders.
 
         Returns:
-            Tuple of (items, matched_games, unmatched_games)
-            - items: List of (local_path, device_path) tuples
+            Tuple of (games, file_count, matched_games, unmatched_games)
+            - games: List of (device_game_prefix, local_file_paths) per game
+            - file_count: Total number of files across games
             - matched_games: List of "local_name -> device_name" strings
             - unmatched_games: List of local game names with no device match
         """
-        items = []
+        games = []
+        file_count = 0
         matched_games = []
         unmatched_games = []
 
         for i in range(self.local_tree.topLevelItemCount()):
             platform_item = self.local_tree.topLevelItem(i)
             platform_name = platform_item.text(0)
+            device_platform_prefix = self.device_base_path + "/" + platform_name + "/"
 
             # Get device game folders for this platform
-            device_game_names = []
-            if platform_name in self.device_assets:
-                device_game_names = [g["name"] for g in self.device_assets[platform_name]]
+            device_game_names = self._device_name_index.get(platform_name)
 
             for j in range(platform_item.childCount()):
                 game_item = platform_item.child(j)
@@ -601,89 +779,51 @@ class DeviceAssetDialog(QDialog):
 
                     # Try to find matching device folder
                     if device_game_names:
-                        # First try exact match
-                        if local_game_name not in device_game_names:
-                            # Try fuzzy matching
-                            local_normalized = normalize_game_name(local_game_name)
-                            best_match = None
-                            best_score = 0
-
-                            for device_name in device_game_names:
-                                device_normalized = normalize_game_name(device_name)
-
-                                # Exact match after normalization
-                                if local_normalized == device_normalized:
-                                    best_match = device_name
-                                    best_score = 1.0
-                                    break
-
-                                # Check if one contains the other
-                                if local_normalized in device_normalized or device_normalized in local_normalized:
-                                    score = min(len(local_normalized), len(device_normalized)) / max(len(local_normalized), len(device_normalized))
-                                    if score > best_score:
-                                        best_score = score
-                                        best_match = device_name
-
-                                # Check word overlap
-                                local_words = set(local_normalized.split())
-                                device_words = set(device_normalized.split())
-                                if local_words and device_words:
-                                    overlap = len(local_words & device_words)
-                                    total = len(local_words | device_words)
-                                    score = overlap / total if total > 0 else 0
-                                    if score > best_score and score >= 0.5:
-                                        best_score = score
-                                        best_match = device_name
-
-                            if best_match and best_score >= 0.5:
-                                device_game_name = best_match
-                                matched_games.append(f"{local_game_name} -> {device_game_name}")
-                                print(f"[DEBUG] Checked item match: '{local_game_name}' -> '{device_game_name}'")
-                            else:
-                                unmatched_games.append(f"{platform_name}/{local_game_name}")
-                                continue  # Skip unmatched games
-                        else:
+                        device_game_name = self._match_device_game(platform_name, local_game_name)
+                        if device_game_name is None:
+                            unmatched_games.append(f"{platform_name}/{local_game_name}")
+                            continue  # Skip unmatched games
+                        if device_game_name == local_game_name:
                             matched_games.append(f"{local_game_name} (exact)")
-
-                    device_game_path = f"{self.device_base_path}/{platform_name}/{device_game_name}"
+                        else:
+                            matched_games.append(f"{local_game_name} -> {device_game_name}")
+                            logger.debug("Checked item match: '%s' -> '%s'", local_game_name, device_game_name)
 
                     # Add all files in the game folder
-                    for file_path in local_game_path.iterdir():
-                        if file_path.is_file():
-                            items.append((
-                                str(file_path),
-                                f"{device_game_path}/{file_path.name}"
-                            ))
+                    local_files = list_game_files(local_game_path)
+                    games.append((device_platform_prefix + device_game_name + "/", local_files))
+                    file_count += len(local_files)
 
-        return items, matched_games, unmatched_games
+        return games, file_count, matched_games, unmatched_games
 
-    def _get_all_local_items_with_matching(self) -> Tuple[List[Tuple[str, str]], List[str], List[str]]:
-        """Get list of all local items with fuzzy matching to device folders.
+    def _get_all_local_items_with_matching(self) -> Tuple[List[Tuple[str, List[str]]], int, List[str], List[str]]:
+        """Get all local items with fuzzy matching to device folders.
 
         Returns:
-            Tuple of (items, matched_games, unmatched_games)
-            - items: List of (local_path, device_path) tuples
+            Tuple of (games, file_count, matched_games, unmatched_games)
+            - games: List of (device_game_prefix, local_file_paths) per game
+            - file_count: Total number of files across games
             - matched_games: List of "local_name -> device_name" strings
             - unmatched_games: List of local game names with no device match
         """
-        items = []
+        games = []
+        file_count = 0
         matched_games = []
         unmatched_games = []
 
         output_path = Path(self.output_dir)
         if not output_path.exists():
-            return items, matched_games, unmatched_games
+            return games, file_count, matched_games, unmatched_games
 
         for platform_folder in output_path.iterdir():
             if not platform_folder.is_dir():
                 continue
 
             platform_name = platform_folder.name
+            device_platform_prefix = self.device_base_path + "/" + platform_name + "/"
 
             # Get device game folders for this platform
-            device_game_names = []
-            if platform_name in self.device_assets:
-                device_game_names = [g["name"] for g in self.device_assets[platform_name]]
+            device_game_names = self._device_name_index.get(platform_name)
 
             for game_folder in platform_folder.iterdir():
                 if not game_folder.is_dir():
@@ -694,68 +834,64 @@ class DeviceAssetDialog(QDialog):
 
                 # Try to find matching device folder
                 if device_game_names:
-                    # First try exact match
-                    if local_game_name not in device_game_names:
-                        # Try fuzzy matching
-                        local_normalized = normalize_game_name(local_game_name)
-                        best_match = None
-                        best_score = 0
-
-                        for device_name in device_game_names:
-                            device_normalized = normalize_game_name(device_name)
-
-                            # Exact match after normalization
-                            if local_normalized == device_normalized:
-                                best_match = device_name
-                                best_score = 1.0
-                                break
-
-                            # Check if one contains the other
-                            if local_normalized in device_normalized or device_normalized in local_normalized:
-                                score = min(len(local_normalized), len(device_normalized)) / max(len(local_normalized), len(device_normalized))
-                                if score > best_score:
-                                    best_score = score
-                                    best_match = device_name
-
-                            # Check word overlap
-                            local_words = set(local_normalized.split())
-                            device_words = set(device_normalized.split())
-                            if local_words and device_words:
-                                overlap = len(local_words & device_words)
-                                total = len(local_words | device_words)
-                                score = overlap / total if total > 0 else 0
-                                if score > best_score and score >= 0.5:
-                                    best_score = score
-                                    best_match = device_name
-
-                        if best_match and best_score >= 0.5:
-                            device_game_name = best_match
-                            matched_games.append(f"{local_game_name} -> {device_game_name}")
-                            print(f"[DEBUG] Push match: '{local_game_name}' -> '{device_game_name}'")
-                        else:
-                            unmatched_games.append(f"{platform_name}/{local_game_name}")
-                            continue  # Skip unmatched games
-                    else:
+                    device_game_name = self._match_device_game(platform_name, local_game_name)
+                    if device_game_name is None:
+                        unmatched_games.append(f"{platform_name}/{local_game_name}")
+                        continue  # Skip unmatched games
+                    if device_game_name == local_game_name:
                         matched_games.append(f"{local_game_name} (exact)")
+                    else:
+                        matched_games.append(f"{local_game_name} -> {device_game_name}")
+                        logger.debug("Push match: '%s' -> '%s'", local_game_name, device_game_name)
+
+                device_game_prefix = device_platform_prefix + device_game_name + "/"
+                logger.debug("Device target folder: %s", device_game_prefix)
+
+                local_files = list_game_files(game_folder)
+                games.append((device_game_prefix, local_files))
+                file_count += len(local_files)
+
+        return games, file_count, matched_games, unmatched_games
+
+    def _match_local_folder(self, platform: str, game_name: str) -> Optional[Path]:
+        """Get the local output folder for a device game, or None if nothing matches.
 
-                device_game_path = f"{self.device_base_path}/{platform_name}/{device_game_name}"
-                print(f"[DEBUG] Device target folder: {device_game_path}")
+        Results are cached until the device or local assets are reloaded.
+        """
+        key = (platform, game_name)
+        if key in self._local_match_cache:
+            return self._local_match_cache[key]
+
+        if platform not in self._local_folder_index:
+            local_platform_path = Path(self.output_dir) / platform
+            try:
+                with os.scandir(local_platform_path) as entries:
+                    local_folders = [Path(e.path) for e in entries if e.is_dir()]
+            except OSError:
+                local_folders = []
+            self._local_folder_index[platform] = (
+                {f.name for f in local_folders},
+                index_game_names(local_folders, lambda f: f.name),
+            )
+        folder_names, folder_index = self._local_folder_index[platform]
 
-                for file_path in game_folder.iterdir():
-                    if file_path.is_file():
-                        target_path = f"{device_game_path}/{file_path.name}"
-                        print(f"[DEBUG]   File: {file_path.name} -> {target_path}")
-                        items.append((
-                            str(file_path),
-                            target_path
-                        ))
+        # First try exact match
+        if game_name in folder_names:
+            local_game_path = Path(self.output_dir) / platform / game_name
+        else:
+            # Try fuzzy matching with local folders
+            local_game_path = best_name_match(game_name, folder_index)
+            if local_game_path:
+                logger.debug("Fuzzy matched '%s' -> '%s'", game_name, local_game_path.name)
 
-        return items, matched_games, unmatched_games
+        self._local_match_cache[key] = local_game_path
+        return local_game_path
 
     def _replace_selected(self):
         """Replace selected items on device with local versions."""
         # Find selected device items and match with local
-        selected_items = []
+        games = []
+        file_count = 0
         matched_games = []
         unmatched_games = []
 
@@ -764,33 +900,19 @@ class DeviceAssetDialog(QDialog):
             if data and data.get("type") == "game":
                 platform = data.get("platform")
                 game_name = data.get("name")
-                device_game_path = data.get("path")
-
-                # First try exact match
-                local_game_path = Path(self.output_dir) / platform / game_name
-
-                if not local_game_path.exists():
-                    # Try fuzzy matching with local folders
-                    local_platform_path = Path(self.output_dir) / platform
-                    if local_platform_path.exists():
-                        local_folders = [f for f in local_platform_path.iterdir() if f.is_dir()]
-                        matched_folder = find_matching_local_folder(game_name, local_folders)
-                        if matched_folder:
-                            local_game_path = matched_folder
-                            print(f"[DEBUG] Fuzzy matched '{game_name}' -> '{matched_folder.name}'")
-
-                if local_game_path.exists():
+                device_game_prefix = data.get("path") + "/"
+
+                local_game_path = self._match_local_folder(platform, game_name)
+
+                if local_game_path:
                     matched_games.append(f"{game_name} -> {local_game_path.name}")
-                    for file_path in local_game_path.iterdir():
-                        if file_path.is_file():
-                            selected_items.append((
-                                str(file_path),
-                                f"{device_game_path}/{file_path.name}"
-                            ))
+                    local_files = list_game_files(local_game_path)
+                    games.append((device_game_prefix, local_files))
+                    file_count += len(local_files)
                 else:
                     unmatched_games.append(game_name)
 
-        if not selected_items:
+        if not file_count:
             msg = "No matching local assets found for selected device games.\n\n"
             if unmatched_games:
                 msg += f"Unmatched games ({len(unmatched_games)}):\n"
@@ -802,7 +924,7 @@ class DeviceAssetDialog(QDialog):
             return
 
         # Show confirmation with match details
-        msg = f"Replace {len(selected_items)} files on device?\n\n"
+        msg = f"Replace {file_count} files on device?\n\n"
         msg += f"Matched {len(matched_games)} games:\n"
         for match in matched_games[:5]:
             msg += f"  - {match}\n"
@@ -819,7 +941,7 @@ class DeviceAssetDialog(QDialog):
         )
 
         if reply == QMessageBox.Yes:
-            self._push_items(selected_items)
+            self._push_items(games, file_count)
 
     def _push_all_local(self):
         """Push all local assets to device."""
@@ -833,9 +955,11 @@ class DeviceAssetDialog(QDialog):
             )
             return
 
-        items, matched_games, unmatched_games = self._get_all_local_items_with_matching()
+        games, file_count, matched_games, unmatched_games = self._get_all_local_items_with_matching()
+        logger.debug("Device matching since last scan: %d by name lookup, %d by fuzzy scoring",
+                     self._match_stats["fast"], self._match_stats["fuzzy"])
 
-        if not items:
+        if not file_count:
             msg = "No matching local assets found to push.\n\n"
             if unmatched_games:
                 msg += f"Unmatched games ({len(unmatched_games)}):\n"
@@ -847,7 +971,7 @@ class DeviceAssetDialog(QDialog):
             return
 
         # Show confirmation with match details
-        msg = f"Push {len(items)} files to device?\n\n"
+        msg = f"Push {file_count} files to device?\n\n"
         msg += f"Matched {len(matched_games)} games:\n"
         for match in matched_games[:5]:
             msg += f"  - {match}\n"
@@ -864,18 +988,18 @@ class DeviceAssetDialog(QDialog):
         )
 
         if reply == QMessageBox.Yes:
-            self._push_items(items)
+            self._push_items(games, file_count)
 
-    def _push_items(self, items: List[Tuple[str, str]]):
-        """Push items to device."""
+    def _push_items(self, games: List[Tuple[str, List[str]]], total: int):
+        """Push the files of each (device_game_prefix, local_file_paths) game to device."""
         self.btn_replace_selected.setEnabled(False)
         self.btn_push_all.setEnabled(False)
         self.btn_scan.setEnabled(False)
         self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, len(items))
+        self.progress_bar.setRange(0, total)
         self.progress_bar.setValue(0)
 
-        self.push_thread = DevicePushThread(self.adb_path, items)
+        self.push_thread = DevicePushThread(self.adb_path, games, total)
         self.push_thread.progress.connect(self._on_push_progress)
         self.push_thread.finished.connect(self._on_push_finished)
         self.push_thread.error.connect(self._on_push_error)
@@ -888,27 +1012,24 @@ class DeviceAssetDialog(QDialog):
 
     def _on_push_finished(self, copied: int, errors: int, successful_folders: list):
         """Handle push completion."""
-        self.btn_replace_selected.setEnabled(True)
-        self.btn_push_all.setEnabled(True)
-        self.btn_scan.setEnabled(True)
-        self.progress_bar.setVisible(False)
-
-        deleted_count = 0
-        delete_errors = 0
-
         # Delete local folders if checkbox is checked
         if self.delete_after_push.isChecked() and successful_folders:
             self.status_label.setText(f"Pushed {copied} files. Deleting local folders...")
 
-            for folder_path in successful_folders:
-                try:
-                    folder = Path(folder_path)
-                    if folder.exists() and folder.is_dir():
-                        shutil.rmtree(folder)
-                        deleted_count += 1
-                except Exception as e:
-                    print(f"Error deleting {folder_path}: {e}")
-                    delete_errors += 1
+            self.delete_thread = LocalDeleteThread(successful_folders)
+            self.delete_thread.finished.connect(
+                lambda deleted_count, delete_errors: self._finish_push(copied, errors, deleted_count, delete_errors)
+            )
+            self.delete_thread.start()
+        else:
+            self._finish_push(copied, errors, 0, 0)
+
+    def _finish_push(self, copied: int, errors: int, deleted_count: int, delete_errors: int):
+        """Re-enable controls and report push and delete results."""
+        self.btn_replace_selected.setEnabled(True)
+        self.btn_push_all.setEnabled(True)
+        self.btn_scan.setEnabled(True)
+        self.progress_bar.setVisible(False)
 
         # Build status message
         status_parts = [f"Pushed {copied} files to device"]
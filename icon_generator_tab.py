@@ -2,15 +2,20 @@
 Icon Generator Tab - extracted from original ui_app.py
 This is the main icon generation interface moved into a tab widget.
 """
+import os
+import shlex
 import sys
 import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from io import BytesIO
 
-import yaml
 from PIL import Image
-from PySide6.QtCore import Qt, Signal, QObject, QSize, QUrl, Slot
-from PySide6.QtGui import QIcon, QDesktopServices, QPixmap
+from PySide6.QtCore import Qt, Signal, QObject, QSize, QTimer, QUrl, QRunnable, QThreadPool
+from PySide6.QtGui import QIcon, QDesktopServices, QImageReader, QPixmap, QPixmapCache
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
     QLabel, QPushButton, QListWidget, QListWidgetItem,
@@ -26,6 +31,66 @@ from options_dialog import OptionsDialog
 from app_paths import get_borders_dir, get_config_path
 
 
+# Letter filter choices for "Filter by Letter" search mode
+LETTER_FILTER_ITEMS = ["All", *map(chr, range(ord('A'), ord('Z') + 1)), "0-9", "#"]
+
+# Publisher tabs in the platform picker; "All" lists every platform
+PUBLISHER_TABS = ("All", "Nintendo", "Sony", "Microsoft", "Sega", "Google")
+
+# Platform type order used by the type-based sort modes
+TYPE_ORDER = {"console": 0, "handheld": 1, "hybrid": 2, "mobile": 3, "unknown": 4}
+
+# Sort key per platform sort mode; unknown modes fall back to "Name"
+PLATFORM_SORT_KEYS = {
+    "Name": lambda p: (p["id"],),
+    "Type then Release Year": lambda p: (TYPE_ORDER.get(p["type"], 99), p["year"], p["id"]),
+    "Type": lambda p: (TYPE_ORDER.get(p["type"], 99), p["id"]),
+    "Release Year": lambda p: (p["year"], p["id"]),
+    "Release Year then Type": lambda p: (p["year"], TYPE_ORDER.get(p["type"], 99), p["id"]),
+}
+
+# Short display names for platform IDs in the platform picker
+NAME_ABBREVIATIONS = {
+    "GAME_BOY_ADVANCE": "GBA",
+    "GAME_BOY_COLOR": "GBC",
+    "GAME_BOY": "GB",
+    "GAME_GEAR": "GG",
+    "NINTENDO_3DS": "3DS",
+    "NINTENDO_DS": "DS",
+    "NINTENDO_64": "N64",
+    "PLAYSTATION_VITA": "PS Vita",
+    "PLAYSTATION_2": "PS2",
+    "PLAYSTATION_3": "PS3",
+    "PLAYSTATION_4": "PS4",
+    "PLAYSTATION_5": "PS5",
+    "PLAYSTATION_PORTABLE": "PSP",
+    "PLAYSTATION": "PS1",
+    "SEGA_GENESIS": "Genesis",
+    "SEGA_DREAMCAST": "Dreamcast",
+    "SEGA_MASTER_SYSTEM": "Master System",
+    "SUPER_NINTENDO": "SNES",
+    "NEO_GEO_POCKET_COLOR": "NGPC",
+}
+
+# Generated asset files pushed to the device (matched against lowercased names)
+DEVICE_ASSET_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+# Display names for art source provider IDs in the source priority list
+PROVIDER_DISPLAY_NAMES = {
+    "steamgriddb": "SteamGridDB",
+    "libretro": "Libretro Thumbnails",
+    "igdb": "IGDB (Twitch)",
+    "thegamesdb": "TheGamesDB",
+    "steam": "Steam Store"
+}
+
+
+@lru_cache(maxsize=256)
+def platform_display_name(plat_id: str) -> str:
+    """Display name for a platform ID: its abbreviation, or the ID with spaces."""
+    return NAME_ABBREVIATIONS.get(plat_id, plat_id.replace("_", " "))
+
+
 class BackendCallbacks(QObject):
     # Backend emits progress as (done, total) and log lines as strings
     progress = Signal(int, int)
@@ -35,14 +100,89 @@ class BackendCallbacks(QObject):
     request_selection = Signal(str, str, list)  # title, platform, artwork_options
 
 
+class PlatformIconLoader(QRunnable):
+    """Decode platform list icons on the thread pool."""
+
+    def __init__(self, tab: "IconGeneratorTab", generation: int, icon_paths, size: int):
+        super().__init__()
+        self._tab = tab
+        self._generation = generation
+        self._icon_paths = icon_paths  # [(plat_id, path)]
+        self._size = size
+
+    def run(self):
+        images = []
+        for plat_id, path in self._icon_paths:
+            reader = QImageReader(str(path))
+            source_size = reader.size()
+            if source_size.isValid():
+                reader.setScaledSize(source_size.scaled(self._size, self._size, Qt.KeepAspectRatio))
+            image = reader.read()
+            if not image.isNull():
+                images.append((plat_id, path, image))
+        try:
+            self._tab.platform_icons_ready.emit(self._generation, images)
+        except RuntimeError:
+            pass  # Tab was deleted while loading
+
+
+class SearchRunnable(QRunnable):
+    """Run a SteamGridDB name search on the thread pool."""
+
+    def __init__(self, tab: "IconGeneratorTab", generation: int, api_key: str, term: str,
+                 cancel: threading.Event):
+        super().__init__()
+        self._tab = tab
+        self._generation = generation
+        self._api_key = api_key
+        self._term = term
+        self._cancel = cancel  # Set when a newer search supersedes this one
+
+    def run(self):
+        try:
+            results = run_backend.search_autocomplete(
+                api_key=self._api_key,
+                base_url="https://www.steamgriddb.com/api/v2",
+                term=self._term,
+                timeout_s=30
+            )
+        except Exception as e:
+            results = {"error": str(e)}
+
+        if self._cancel.is_set():
+            return
+        try:
+            self._tab.search_finished.emit(self._generation, self._term, results)
+        except RuntimeError:
+            pass  # Tab was deleted while searching
+
+
 class IconGeneratorTab(QWidget):
     """Main icon generator tab widget."""
 
+    # Emitted from the worker thread to show the artwork picker on the GUI thread
+    selection_requested = Signal(str, str, object, object)  # title, platform, options, result queue
+    # Emitted from PlatformIconLoader with [(plat_id, path, QImage)] for a platform list build
+    platform_icons_ready = Signal(int, object)  # generation, images
+    # Emitted from SearchRunnable when a SteamGridDB name search returns
+    search_finished = Signal(int, str, object)  # generation, search term, results
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         self._cancel_token = None
         self._worker_thread = None
+        self._ci_dir_cache = {}  # directory -> (mtime_ns, {name: path}, {lowercase name: path})
+        self.selection_requested.connect(self._show_selection_dialog)
+        self._platform_items = {}  # plat_id -> [QListWidgetItem] across all tabs
+        self._platform_icon_generation = 0
+        self._platform_icon_cache = {}  # icon path -> (icons dir mtime_ns, QIcon)
+        self._platform_icons_mtime = None  # mtime_ns of the icons dir in the last reload
+        self._selected_platforms = set()  # plat_ids checked in any tab
+        self._platform_game_counts = {}  # plat_id -> games listed in config, from the last reload
+        self._options_dialog = None  # Created on first open_options() and reused afterwards
+        self.platform_icons_ready.connect(self._on_platform_icons_ready)
+        self.search_finished.connect(self._on_search_complete)
 
         root = QVBoxLayout(self)
         root.setContentsMargins(10, 10, 10, 10)
@@ -62,6 +202,8 @@ class IconGeneratorTab(QWidget):
         self.source_priority = SourcePriorityWidget()  # Hidden, managed by options dialog
         self.fallback_settings = {}  # Fallback icon settings, managed by options dialog
         self.custom_border_settings = {}  # Custom border settings, managed by options dialog
+        self._cached_settings = None  # Built by _get_effective_settings, reset when options change
+        self.source_priority.orderChanged.connect(lambda _order: self._invalidate_settings())
 
         # Search/Filter row
         row_filter = QHBoxLayout()
@@ -76,8 +218,18 @@ class IconGeneratorTab(QWidget):
         self.search_input.setVisible(True)  # Visible by default since Search by Name is default
         row_filter.addWidget(self.search_input, 1)
 
+        # Search once typing pauses instead of needing a click per query;
+        # rapid keystrokes coalesce into a single API request
+        self._search_debounce = QTimer(self)
+        self._search_debounce.setSingleShot(True)
+        self._search_debounce.setInterval(250)
+        self._search_debounce.timeout.connect(self._on_search_text_settled)
+        self.search_input.textChanged.connect(lambda _text: self._search_debounce.start())
+        self._search_generation = 0
+        self._search_cancel = None  # Cancel event of the latest SearchRunnable
+
         self.letter_filter = QComboBox()
-        self.letter_filter.addItems(["All"] + [chr(i) for i in range(ord('A'), ord('Z')+1)] + ["0-9", "#"])
+        self.letter_filter.addItems(LETTER_FILTER_ITEMS)
         self.letter_filter.setVisible(False)
         row_filter.addWidget(self.letter_filter)
 
@@ -141,8 +293,16 @@ class IconGeneratorTab(QWidget):
         self.progress.setValue(0)
         left.addWidget(self.progress)
 
-        # Hidden log storage (for logs dialog)
-        self.log_content = ""
+        # Progress from fast jobs is applied at most ~30 times a second; the
+        # latest value is flushed when the throttle window ends
+        self._pending_progress = None
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(33)
+        self._progress_timer.timeout.connect(self._flush_progress)
+
+        # Hidden log storage (for logs dialog), bounded to the most recent lines
+        self.log_content = deque(maxlen=20000)
 
         # Split view: Search Results on top, Preview on bottom
         splitter = QSplitter(Qt.Vertical)
@@ -161,34 +321,7 @@ class IconGeneratorTab(QWidget):
         self.search_results_list = QListWidget()
         self.search_results_list.setSelectionMode(QListWidget.SingleSelection)
         self.search_results_list.setAlternatingRowColors(False)  # Disable for cleaner look
-        self.search_results_list.setStyleSheet("""
-            QListWidget {
-                background-color: #1e2127;
-                border: 1px solid #3a3d42;
-                border-radius: 6px;
-                outline: none;
-                padding: 4px;
-            }
-            QListWidget::item {
-                padding: 10px 12px;
-                margin: 2px 0;
-                border-radius: 4px;
-                background-color: #2a2d32;
-                color: #e0e0e0;
-            }
-            QListWidget::item:hover {
-                background-color: #353840;
-                border: 1px solid #4a4d52;
-            }
-            QListWidget::item:selected {
-                background-color: #3d7eff;
-                color: white;
-                border: 1px solid #5a8fff;
-            }
-            QListWidget::item:selected:hover {
-                background-color: #4a88ff;
-            }
-        """)
+        self.search_results_list.setObjectName("search_results")  # Styled in iisu_theme*.qss
         self.search_results_list.setMinimumHeight(150)
         search_results_layout.addWidget(self.search_results_list, 1)  # Give it stretch
 
@@ -229,9 +362,11 @@ class IconGeneratorTab(QWidget):
 
         left.addWidget(splitter, 1)
 
-        # Track preview items
-        self.preview_items = []
+        # Preview cells are created on demand up to the limit, then reused as a
+        # ring buffer: the oldest cell gets the newest icon, with no relayout
+        self.preview_cells = []
         self.max_preview_items = 50  # Limit to last 50 generated icons
+        self._preview_write_idx = 0
 
         # ---------- Right column ----------
         right = QVBoxLayout()
@@ -244,13 +379,7 @@ class IconGeneratorTab(QWidget):
         row_sort.addWidget(QLabel("Sort:"))
 
         self.sort_mode = QComboBox()
-        self.sort_mode.addItems([
-            "Name",
-            "Type then Release Year",
-            "Type",
-            "Release Year",
-            "Release Year then Type"
-        ])
+        self.sort_mode.addItems(list(PLATFORM_SORT_KEYS))
         self.sort_mode.currentIndexChanged.connect(self._on_sort_changed)
         row_sort.addWidget(self.sort_mode)
 
@@ -262,8 +391,7 @@ class IconGeneratorTab(QWidget):
         self.platform_lists = {}  # Store list widgets for each tab
 
         # Create tabs for each publisher
-        publishers = ["All", "Nintendo", "Sony", "Microsoft", "Sega", "Google"]
-        for publisher in publishers:
+        for publisher in PUBLISHER_TABS:
             platform_list = QListWidget()
             platform_list.setSelectionMode(QListWidget.NoSelection)
             platform_list.setViewMode(QListWidget.IconMode)
@@ -274,6 +402,7 @@ class IconGeneratorTab(QWidget):
             platform_list.setIconSize(QSize(96, 96))
             platform_list.setSpacing(10)
             platform_list.itemClicked.connect(self.toggle_platform)
+            platform_list.itemChanged.connect(self._on_platform_item_changed)
 
             self.publisher_tabs.addTab(platform_list, publisher)
             self.platform_lists[publisher] = platform_list
@@ -301,42 +430,30 @@ class IconGeneratorTab(QWidget):
         Called from worker thread, so must use thread-safe Qt mechanisms.
         Returns selected index, None if skipped, -1 if cancelled all.
         """
-        from artwork_picker_dialog import ArtworkPickerDialog
         from queue import Queue
-        from PySide6.QtCore import QCoreApplication
 
         self.append_log(f"[INTERACTIVE] Request for {title} with {len(artwork_options)} options")
 
-        # Store data in instance variables so main thread can access them
-        self._dialog_title = title
-        self._dialog_platform = platform
-        self._dialog_options = artwork_options
-        self._dialog_result = Queue()
-
-        # Use QMetaObject.invokeMethod to run on main thread
-        from PySide6.QtCore import QMetaObject, Qt
-        QMetaObject.invokeMethod(
-            self,
-            "_show_selection_dialog_on_main_thread",
-            Qt.ConnectionType.BlockingQueuedConnection
-        )
+        # The request carries its own arguments and result queue, so nothing is
+        # shared through instance attributes; the signal is queued to the GUI thread
+        result_queue = Queue()
+        self.selection_requested.emit(title, platform, artwork_options, result_queue)
 
-        # Get result from queue
-        result = self._dialog_result.get()
+        # Block this worker until the dialog answers
+        result = result_queue.get()
         self.append_log(f"[INTERACTIVE] Got result: {result}")
         return result
 
-    @Slot()
-    def _show_selection_dialog_on_main_thread(self):
-        """Show dialog on main thread - called via invokeMethod."""
+    def _show_selection_dialog(self, title: str, platform: str, artwork_options, result_queue):
+        """Show the artwork picker on the main thread and post the choice to result_queue."""
         from artwork_picker_dialog import ArtworkPickerDialog
         try:
-            self.append_log(f"[INTERACTIVE] Showing dialog for {self._dialog_title}")
+            self.append_log(f"[INTERACTIVE] Showing dialog for {title}")
 
             dialog = ArtworkPickerDialog(
-                title=self._dialog_title,
-                platform=self._dialog_platform,
-                artwork_options=self._dialog_options,
+                title=title,
+                platform=platform,
+                artwork_options=artwork_options,
                 parent=self
             )
 
@@ -345,84 +462,105 @@ class IconGeneratorTab(QWidget):
             selected = dialog.get_selected_index()
 
             self.append_log(f"[INTERACTIVE] Dialog result: exec={dialog_result}, selected={selected}")
-            self._dialog_result.put(selected)
+            result_queue.put(selected)
 
         except Exception as e:
             import traceback
             self.append_log(f"[ERROR] Dialog exception: {e}")
             self.append_log(f"[ERROR] Traceback: {traceback.format_exc()}")
-            self._dialog_result.put(None)
+            result_queue.put(None)
 
     # ---------- UI helpers ----------
-    def _find_file_case_insensitive(self, directory: Path, filename: str) -> Path:
-        """Find a file in directory with case-insensitive matching."""
-        if not directory.exists():
+    @property
+    def config_path(self) -> str:
+        return self._config_path
+
+    @config_path.setter
+    def config_path(self, value):
+        # Resolve the Path once here rather than in every config read/write
+        self._config_path = str(value)
+        self._cfg_path = Path(self._config_path).expanduser()
+
+    def _list_dir_cached(self, directory: Path):
+        """Return ({name: path}, {lowercase name: path}) for directory, or None if unreadable."""
+        try:
+            mtime = directory.stat().st_mtime_ns
+        except OSError:
             return None
 
-        # Try exact match first
-        exact_path = directory / filename
-        if exact_path.exists():
-            return exact_path
-
-        # Try case-insensitive match
-        filename_lower = filename.lower()
-        for file in directory.iterdir():
-            if file.name.lower() == filename_lower:
-                return file
-
-        return None
+        # One listing per directory, reused until its mtime changes
+        # (entries added, removed or renamed)
+        cached = self._ci_dir_cache.get(directory)
+        if cached is None or cached[0] != mtime:
+            exact = {}
+            lowered = {}
+            with os.scandir(directory) as it:
+                for entry in it:
+                    path = Path(entry.path)
+                    exact[entry.name] = path
+                    lowered.setdefault(entry.name.lower(), path)
+            cached = (mtime, exact, lowered)
+            self._ci_dir_cache[directory] = cached
+
+        return cached[1], cached[2]
 
     def append_log(self, msg: str):
         """Append log message to internal storage."""
-        self.log_content += msg + "\n"
+        self.log_content.append(msg)
 
     def add_preview_icon(self, icon_path: str):
         """Add a generated icon to the live preview grid."""
         from pathlib import Path
 
         path = Path(icon_path)
-        if not path.exists():
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
             return
 
-        # Create preview item
-        preview_item = QLabel()
-        preview_item.setFixedSize(128, 128)
-        preview_item.setScaledContents(True)
-        preview_item.setFrameShape(QFrame.Box)
-        preview_item.setLineWidth(2)
-        preview_item.setStyleSheet("QLabel { border: 2px solid #3A4048; border-radius: 8px; }")
-
-        # Load and set pixmap
-        pixmap = QPixmap(str(path))
-        if not pixmap.isNull():
-            preview_item.setPixmap(pixmap)
-            preview_item.setToolTip(path.stem)
-
-            # Add to grid (5 columns)
-            row = len(self.preview_items) // 5
-            col = len(self.preview_items) % 5
-            self.preview_grid_layout.addWidget(preview_item, row, col)
-
-            self.preview_items.append(preview_item)
-
-            # Limit preview items (remove oldest if exceeds max)
-            if len(self.preview_items) > self.max_preview_items:
-                old_item = self.preview_items.pop(0)
-                self.preview_grid_layout.removeWidget(old_item)
-                old_item.deleteLater()
-
-                # Rebuild grid layout
-                for i, item in enumerate(self.preview_items):
-                    r = i // 5
-                    c = i % 5
-                    self.preview_grid_layout.addWidget(item, r, c)
+        # Keyed by mtime too, so a regenerated icon at the same path is re-read
+        cache_key = f"preview:{path}:{mtime}"
+        pixmap = QPixmapCache.find(cache_key)
+        if pixmap is None or pixmap.isNull():
+            # Decode straight to cell size rather than keeping the full-resolution
+            # icon around and scaling it down on every paint
+            reader = QImageReader(str(path))
+            size = reader.size()
+            if size.isValid():
+                reader.setScaledSize(size.scaled(128, 128, Qt.KeepAspectRatio))
+            image = reader.read()
+            if image.isNull():
+                return
+            pixmap = QPixmap.fromImage(image)
+            QPixmapCache.insert(cache_key, pixmap)
+
+        idx = self._preview_write_idx
+        if idx == len(self.preview_cells):
+            # Grow the grid (5 columns) until it reaches the limit
+            preview_item = QLabel()
+            preview_item.setFixedSize(128, 128)
+            preview_item.setScaledContents(True)
+            preview_item.setFrameShape(QFrame.Box)
+            preview_item.setLineWidth(2)
+            preview_item.setStyleSheet("QLabel { border: 2px solid #3A4048; border-radius: 8px; }")
+            self.preview_grid_layout.addWidget(preview_item, idx // 5, idx % 5)
+            self.preview_cells.append(preview_item)
+
+        preview_item = self.preview_cells[idx]
+        preview_item.setPixmap(pixmap)
+        preview_item.setToolTip(path.stem)
+        preview_item.show()
+
+        self._preview_write_idx = (idx + 1) % self.max_preview_items
 
     def clear_preview(self):
         """Clear all preview icons."""
-        for item in self.preview_items:
-            self.preview_grid_layout.removeWidget(item)
-            item.deleteLater()
-        self.preview_items.clear()
+        # Keep the cells for reuse; they reappear as new icons arrive
+        for preview_item in self.preview_cells:
+            preview_item.clear()
+            preview_item.setToolTip("")
+            preview_item.hide()
+        self._preview_write_idx = 0
 
     def _on_search_mode_changed(self, index):
         """Show/hide search controls based on selected mode."""
@@ -466,21 +604,14 @@ class IconGeneratorTab(QWidget):
 
         log_view = QTextEdit()
         log_view.setReadOnly(True)
-        log_view.setPlainText(self.log_content if self.log_content else "No logs yet.")
-        log_view.setStyleSheet("""
-            QTextEdit {
-                background-color: #1a1d21;
-                color: #e0e0e0;
-                font-family: monospace;
-                font-size: 11px;
-            }
-        """)
+        log_view.setPlainText("\n".join(self.log_content) or "No logs yet.")
+        log_view.setObjectName("log_view")  # Styled in iisu_theme*.qss
         layout.addWidget(log_view)
 
         # Buttons
         button_box = QDialogButtonBox()
         clear_btn = button_box.addButton("Clear", QDialogButtonBox.ActionRole)
-        clear_btn.clicked.connect(lambda: (setattr(self, 'log_content', ''), log_view.clear()))
+        clear_btn.clicked.connect(lambda: (self.log_content.clear(), log_view.clear()))
         button_box.addButton(QDialogButtonBox.Close)
         button_box.rejected.connect(dialog.reject)
         layout.addWidget(button_box)
@@ -502,87 +633,74 @@ class IconGeneratorTab(QWidget):
             self.search_status.setText("SteamGridDB API key required. Set it in Settings (gear icon).")
             return
 
+        self._search_debounce.stop()
+
+        # Only the most recent search may update the results list
+        self._search_generation += 1
+        generation = self._search_generation
+
         # Clear previous results
         self.search_results_list.clear()
         self.search_status.setText("Searching SteamGridDB...")
         self.btn_search.setEnabled(False)
 
-        # Run search in background thread
-        def do_search():
-            try:
-                results = run_backend.search_autocomplete(
-                    api_key=api_key,
-                    base_url="https://www.steamgriddb.com/api/v2",
-                    term=search_term,
-                    timeout_s=30
-                )
-                return results
-            except Exception as e:
-                return {"error": str(e)}
+        # Run search on the shared thread pool; a superseded search is told to
+        # drop its results instead of delivering them
+        if self._search_cancel is not None:
+            self._search_cancel.set()
+        self._search_cancel = threading.Event()
+        QThreadPool.globalInstance().start(
+            SearchRunnable(self, generation, api_key, search_term, self._search_cancel))
+
+    def _on_search_complete(self, generation: int, search_term: str, results):
+        """Show name search results from SearchRunnable."""
+        if generation != self._search_generation:
+            return  # Superseded by a newer search
+        self._search_cancel = None
+        self.btn_search.setEnabled(True)
+
+        if isinstance(results, dict) and "error" in results:
+            self.search_status.setText(f"Search error: {results['error']}")
+            return
 
-        def on_search_complete(results):
-            self.btn_search.setEnabled(True)
+        if not results:
+            self.search_status.setText(f"No games found for '{search_term}'")
+            return
 
-            if isinstance(results, dict) and "error" in results:
-                self.search_status.setText(f"Search error: {results['error']}")
-                return
+        # Store results and populate list with repaints suspended
+        self.search_results_data = results
+        self.search_results_list.setUpdatesEnabled(False)
+        for game in results:
+            game_name = game.get("name", "Unknown")
+            game_id = game.get("id", "")
+            release_date = game.get("release_date")
+            year = ""
+            if release_date:
+                try:
+                    year = f" ({time.gmtime(release_date).tm_year})"
+                except (OverflowError, OSError, TypeError, ValueError):
+                    pass
 
-            if not results:
-                self.search_status.setText(f"No games found for '{search_term}'")
-                return
+            item_text = f"{game_name}{year}"
+            item = QListWidgetItem(item_text)
+            item.setData(Qt.UserRole, {
+                "name": game_name,
+                "game_id": game_id,
+                "sgdb_data": game
+            })
+            self.search_results_list.addItem(item)
+        self.search_results_list.setUpdatesEnabled(True)
+
+        self.search_status.setText(f"Found {len(results)} games. Select one and click 'Start Processing'")
 
-            # Store results and populate list
-            self.search_results_data = results
-            for game in results:
-                game_name = game.get("name", "Unknown")
-                game_id = game.get("id", "")
-                release_date = game.get("release_date")
-                year = ""
-                if release_date:
-                    try:
-                        from datetime import datetime
-                        year = f" ({datetime.fromtimestamp(release_date).year})"
-                    except:
-                        pass
-
-                item_text = f"{game_name}{year}"
-                item = QListWidgetItem(item_text)
-                item.setData(Qt.UserRole, {
-                    "name": game_name,
-                    "game_id": game_id,
-                    "sgdb_data": game
-                })
-                self.search_results_list.addItem(item)
-
-            self.search_status.setText(f"Found {len(results)} games. Select one and click 'Start Processing'")
-
-        # Use QThread for background search
-        from PySide6.QtCore import QThread, Signal
-
-        class SearchThread(QThread):
-            finished = Signal(object)
-
-            def __init__(self, search_func):
-                super().__init__()
-                self.search_func = search_func
-
-            def run(self):
-                result = self.search_func()
-                self.finished.emit(result)
-
-        self._search_thread = SearchThread(do_search)
-        self._search_thread.finished.connect(on_search_complete)
-        self._search_thread.start()
+    def _on_search_text_settled(self):
+        """Run a name search after the user stops typing."""
+        if self.search_mode.currentText() == "Search by Name" and self.search_input.text().strip():
+            self._perform_search()
 
     def _get_selected_platforms(self):
-        """Get list of currently selected platform IDs."""
-        selected = []
-        for platform_list in self.platform_lists.values():
-            for i in range(platform_list.count()):
-                item = platform_list.item(i)
-                if item.data(Qt.UserRole + 1):  # Selected state
-                    selected.append(item.data(Qt.UserRole))
-        return selected
+        """Get list of currently selected platform IDs, in platform list order."""
+        return [plat_id for plat_id in self._platform_items if plat_id in self._selected_platforms]
 
     def _show_processing_options_dialog(self, selected_game_names, search_input_text, platforms, total_games_estimate):
         """Show dialog to choose what to process."""
@@ -672,13 +790,18 @@ class IconGeneratorTab(QWidget):
 
     def open_options(self):
         """Open options dialog."""
-        dialog = OptionsDialog(
-            parent=self,
+        # Reuse the dialog between opens so its tabs aren't rebuilt every time
+        dialog_args = dict(
             config_path=self.config_path,
             workers=self.workers_value,
             limit=self.limit_value,
             source_priority_widget=self.source_priority
         )
+        if self._options_dialog is None:
+            self._options_dialog = OptionsDialog(parent=self, **dialog_args)
+        else:
+            self._options_dialog.refresh_state(**dialog_args)
+        dialog = self._options_dialog
 
         # Set current custom border settings if available
         if self.custom_border_settings:
@@ -700,16 +823,32 @@ class IconGeneratorTab(QWidget):
 
             # Update custom border settings
             self.custom_border_settings = dialog.get_custom_border_settings()
+            self._invalidate_settings()
 
             # Reload platforms if config changed
             self.load_platforms_from_config()
 
+    def _invalidate_settings(self):
+        """Drop the cached job settings after the options change."""
+        self._cached_settings = None
+
+    def _get_effective_settings(self) -> dict:
+        """Job settings managed by the options dialog; the source order is built once per change."""
+        if self._cached_settings is None:
+            self._cached_settings = {"source_order": self.source_priority.get_source_order()}
+        # The main window assigns these attributes directly, so read them live
+        return dict(
+            self._cached_settings,
+            fallback_settings=self.fallback_settings,
+            custom_border_settings=self.custom_border_settings,
+        )
+
     def browse_config(self):
         """This method is kept for compatibility but now opens options dialog."""
         self.open_options()
 
     def load_platforms_from_config(self):
-        cfg_path = Path(self.config_path)
+        cfg_path = self._cfg_path
         if not cfg_path.exists():
             for platform_list in self.platform_lists.values():
                 platform_list.clear()
@@ -717,8 +856,8 @@ class IconGeneratorTab(QWidget):
             return
 
         try:
-            with open(cfg_path, "r", encoding="utf-8") as f:
-                cfg = yaml.safe_load(f) or {}
+            # Cached by mtime/size, so sort-mode changes don't re-parse the file
+            cfg = run_backend.load_yaml(cfg_path)
         except Exception as e:
             self.append_log(f"Failed to load config: {e}")
             return
@@ -726,14 +865,12 @@ class IconGeneratorTab(QWidget):
         platforms_cfg = cfg.get("platforms", {})
         platform_icons_dir = Path(cfg.get("paths", {}).get("platform_icons_dir", "./platform_icons"))
 
-        # Clear all tabs
-        for platform_list in self.platform_lists.values():
-            platform_list.clear()
-
         # Build platform data with metadata
         platform_data = []
+        self._platform_game_counts = {}
         for plat_id, plat_config in platforms_cfg.items():
             publisher = plat_config.get("publisher", "Unknown")
+            self._platform_game_counts[plat_id] = len(plat_config.get("games") or [])
             year = plat_config.get("year", 9999)
             plat_type = plat_config.get("type", "unknown")
 
@@ -745,53 +882,28 @@ class IconGeneratorTab(QWidget):
                 "config": plat_config
             })
 
-        # Build sort key based on selected sort mode
-        def get_sort_key(platform):
-            type_order = {"console": 0, "handheld": 1, "hybrid": 2, "mobile": 3, "unknown": 4}
-            sort_text = self.sort_mode.currentText()
-
-            if sort_text == "Name":
-                return (platform["id"],)
-            elif sort_text == "Type then Release Year":
-                return (type_order.get(platform["type"], 99), platform["year"], platform["id"])
-            elif sort_text == "Type":
-                return (type_order.get(platform["type"], 99), platform["id"])
-            elif sort_text == "Release Year":
-                return (platform["year"], platform["id"])
-            elif sort_text == "Release Year then Type":
-                return (platform["year"], type_order.get(platform["type"], 99), platform["id"])
-
-            return (platform["id"],)  # Fallback
+        # Resolve the sort key once for the selected sort mode
+        sort_key = PLATFORM_SORT_KEYS.get(self.sort_mode.currentText(), PLATFORM_SORT_KEYS["Name"])
+        platform_data.sort(key=sort_key)
 
-        platform_data.sort(key=get_sort_key)
-
-        # Check which platforms have borders
+        # Check which platforms have borders against one cached listing of the
+        # borders folder instead of a stat per platform
         borders_dir = get_borders_dir()
-
-        # Platform name abbreviations
-        name_abbreviations = {
-            "GAME_BOY_ADVANCE": "GBA",
-            "GAME_BOY_COLOR": "GBC",
-            "GAME_BOY": "GB",
-            "GAME_GEAR": "GG",
-            "NINTENDO_3DS": "3DS",
-            "NINTENDO_DS": "DS",
-            "NINTENDO_64": "N64",
-            "PLAYSTATION_VITA": "PS Vita",
-            "PLAYSTATION_2": "PS2",
-            "PLAYSTATION_3": "PS3",
-            "PLAYSTATION_4": "PS4",
-            "PLAYSTATION_5": "PS5",
-            "PLAYSTATION_PORTABLE": "PSP",
-            "PLAYSTATION": "PS1",
-            "SEGA_GENESIS": "Genesis",
-            "SEGA_DREAMCAST": "Dreamcast",
-            "SEGA_MASTER_SYSTEM": "Master System",
-            "SUPER_NINTENDO": "SNES",
-            "NEO_GEO_POCKET_COLOR": "NGPC",
-        }
-
-        # Add platforms to appropriate tabs
+        border_listing = self._list_dir_cached(borders_dir)
+        border_names = border_listing[0] if border_listing else {}
+
+        # Same for platform icons: one listing (exact and lowercase names) for
+        # the whole loop rather than a directory stat per platform
+        icon_names, icon_names_lower = self._list_dir_cached(platform_icons_dir) or ({}, {})
+        self._platform_icons_mtime = self._ci_dir_cache.get(platform_icons_dir, (None,))[0]
+
+        # Build items for every tab first, then insert each tab's items in one
+        # pass; icons are decoded afterwards on the thread pool
+        self._platform_icon_generation += 1
+        self._platform_items = {}
+        self._selected_platforms.clear()
+        tab_items = {publisher: [] for publisher in self.platform_lists}
+        icon_paths = []
         for plat in platform_data:
             plat_id = plat["id"]
             publisher = plat["publisher"]
@@ -800,12 +912,13 @@ class IconGeneratorTab(QWidget):
             # Check if platform has a border (skip if not)
             # Use border_file from config if specified, otherwise fall back to {plat_id}.png
             border_filename = plat_config.get("border_file", f"{plat_id}.png")
-            border_path = borders_dir / border_filename
-            if not border_path.exists():
+            # Names missing from the listing still get a stat, which keeps
+            # case-insensitive filesystems and subfolder paths working
+            if border_filename not in border_names and not (borders_dir / border_filename).exists():
                 continue  # Skip platforms without borders
 
             # Simplify platform name
-            display_name = name_abbreviations.get(plat_id, plat_id.replace("_", " "))
+            display_name = platform_display_name(plat_id)
 
             # Create item
             item = QListWidgetItem()
@@ -819,33 +932,81 @@ class IconGeneratorTab(QWidget):
 
             # Try to find platform icon
             icon_filename = f"{plat_id}.png"
-            icon_path = self._find_file_case_insensitive(platform_icons_dir, icon_filename)
-
-            if icon_path and icon_path.exists():
-                icon = QIcon(str(icon_path))
-                item.setIcon(icon)
+            icon_path = icon_names.get(icon_filename) or icon_names_lower.get(icon_filename.lower())
+
+            if icon_path:
+                # Icons decoded by an earlier reload are reused while the icons
+                # folder is unchanged; the rest go to PlatformIconLoader
+                cached = self._platform_icon_cache.get(icon_path)
+                if cached and cached[0] == self._platform_icons_mtime:
+                    item.setIcon(cached[1])
+                else:
+                    icon_paths.append((plat_id, icon_path))
 
             # Add to "All" tab
-            item_all = item.clone()
-            self.platform_lists["All"].addItem(item_all)
+            items = [item]
+            tab_items["All"].append(item)
 
-            # Add to publisher-specific tab
-            if publisher in self.platform_lists:
+            # Add to publisher-specific tab; the copy only carries text, flags
+            # and data until the shared icon arrives from PlatformIconLoader
+            if publisher in tab_items and publisher != "All":
                 item_pub = item.clone()
-                self.platform_lists[publisher].addItem(item_pub)
+                items.append(item_pub)
+                tab_items[publisher].append(item_pub)
+
+            self._platform_items[plat_id] = items
+
+        # Clear and refill each tab in one repaint-free, signal-free pass
+        for publisher, items in tab_items.items():
+            platform_list = self.platform_lists[publisher]
+            platform_list.setUpdatesEnabled(False)
+            platform_list.blockSignals(True)
+            try:
+                platform_list.clear()
+                for item in items:
+                    platform_list.addItem(item)
+            finally:
+                platform_list.blockSignals(False)
+                platform_list.setUpdatesEnabled(True)
+
+        if icon_paths:
+            icon_size = self.platform_lists["All"].iconSize()
+            QThreadPool.globalInstance().start(PlatformIconLoader(
+                self, self._platform_icon_generation, icon_paths,
+                max(icon_size.width(), icon_size.height())))
 
         # Also load source order
         self.load_source_order_from_config()
 
+    def _on_platform_icons_ready(self, generation: int, images):
+        """Apply icons decoded by PlatformIconLoader to the platform lists."""
+        if generation != self._platform_icon_generation:
+            return  # Lists were rebuilt since this load was started
+
+        # setIcon emits itemChanged; block it so _on_platform_item_changed
+        # doesn't run for every icon
+        for platform_list in self.platform_lists.values():
+            platform_list.setUpdatesEnabled(False)
+            platform_list.blockSignals(True)
+        try:
+            for plat_id, path, image in images:
+                icon = QIcon(QPixmap.fromImage(image))
+                self._platform_icon_cache[path] = (self._platform_icons_mtime, icon)
+                for item in self._platform_items.get(plat_id, ()):
+                    item.setIcon(icon)
+        finally:
+            for platform_list in self.platform_lists.values():
+                platform_list.blockSignals(False)
+                platform_list.setUpdatesEnabled(True)
+
     def load_source_order_from_config(self):
         """Load source priority from config file."""
-        cfg_path = Path(self.config_path)
+        cfg_path = self._cfg_path
         if not cfg_path.exists():
             return
 
         try:
-            with open(cfg_path, "r", encoding="utf-8") as f:
-                cfg = yaml.safe_load(f) or {}
+            cfg = run_backend.load_yaml(cfg_path)
 
             art_sources = cfg.get("art_sources", {})
 
@@ -855,40 +1016,31 @@ class IconGeneratorTab(QWidget):
             providers = art_sources.get("providers", [])
 
             # Add display names
-            display_map = {
-                "steamgriddb": "SteamGridDB",
-                "libretro": "Libretro Thumbnails",
-                "igdb": "IGDB (Twitch)",
-                "thegamesdb": "TheGamesDB",
-                "steam": "Steam Store"
-            }
-
             for p in providers:
-                p["display_name"] = display_map.get(p["id"], p["id"])
+                p["display_name"] = PROVIDER_DISPLAY_NAMES.get(p["id"], p["id"])
 
             self.source_priority.set_source_order(providers)
+            self._invalidate_settings()
 
         except Exception as e:
             self.append_log(f"Failed to load source priority: {e}")
 
     def _save_export_settings_to_config(self, export_settings: dict):
         """Save export format settings to config file."""
-        cfg_path = Path(self.config_path)
+        cfg_path = self._cfg_path
         if not cfg_path.exists():
             return
 
         try:
             # Load current config
-            with open(cfg_path, "r", encoding="utf-8") as f:
-                cfg = yaml.safe_load(f) or {}
+            cfg = run_backend.load_yaml(cfg_path)
 
             # Update export format settings
             cfg["export_format"] = export_settings.get("format", "JPEG")
             cfg["jpeg_quality"] = export_settings.get("jpeg_quality", 95)
 
             # Write back
-            with open(cfg_path, "w", encoding="utf-8") as f:
-                yaml.dump(cfg, f, default_flow_style=False, sort_keys=False)
+            run_backend.save_yaml(cfg_path, cfg)
 
             self.append_log(f"[CONFIG] Export format set to {export_settings.get('format', 'JPEG')}")
 
@@ -900,15 +1052,14 @@ class IconGeneratorTab(QWidget):
         if source_order is None:
             source_order = self.source_priority.get_source_order()
 
-        cfg_path = Path(self.config_path)
+        cfg_path = self._cfg_path
         if not cfg_path.exists():
             QMessageBox.warning(self, "Config Error", "Config file not found.")
             return
 
         try:
             # Load current config
-            with open(cfg_path, "r", encoding="utf-8") as f:
-                cfg = yaml.safe_load(f) or {}
+            cfg = run_backend.load_yaml(cfg_path)
 
             # Update art_sources section
             sources = source_order
@@ -930,8 +1081,7 @@ class IconGeneratorTab(QWidget):
             cfg["art_sources"]["providers"] = sources_clean
 
             # Write back
-            with open(cfg_path, "w", encoding="utf-8") as f:
-                yaml.dump(cfg, f, default_flow_style=False, sort_keys=False)
+            run_backend.save_yaml(cfg_path, cfg)
 
             self.append_log("[CONFIG] Source priority saved to config.yaml")
             QMessageBox.information(self, "Success", "Source priority saved to config.yaml")
@@ -945,6 +1095,25 @@ class IconGeneratorTab(QWidget):
         # Could add validation or auto-save here
         pass
 
+    def _on_platform_item_changed(self, item: QListWidgetItem):
+        """Keep a platform's copies and the selected-platform set in step with its check state."""
+        plat_id = item.data(Qt.UserRole + 3)
+        siblings = self._platform_items.get(plat_id)
+        if not siblings:
+            return  # Item is still being built
+
+        # A platform is listed in "All" and in its publisher tab; both copies
+        # share one check state, so it reads the same on either tab
+        state = item.checkState()
+        for sibling in siblings:
+            if sibling is not item and sibling.checkState() != state:
+                sibling.setCheckState(state)
+
+        if state == Qt.Checked:
+            self._selected_platforms.add(plat_id)
+        else:
+            self._selected_platforms.discard(plat_id)
+
     def toggle_platform(self, item: QListWidgetItem):
         """Toggle platform checkbox when item is clicked."""
         current = item.checkState()
@@ -964,25 +1133,13 @@ class IconGeneratorTab(QWidget):
 
     # ---------- Job control ----------
     def start_job(self):
-        cfg_path = Path(self.config_path).expanduser()
+        cfg_path = self._cfg_path
         if not cfg_path.exists():
             QMessageBox.warning(self, "Config missing", "Please choose a valid config.yaml")
             return
 
         # Get selected platforms from all tabs
-        platforms = []
-        seen = set()  # Avoid duplicates
-        for platform_list in self.platform_lists.values():
-            for i in range(platform_list.count()):
-                item = platform_list.item(i)
-                if item.checkState() == Qt.Checked:
-                    # Get actual platform ID from UserRole + 3 (not the display name)
-                    plat_id = item.data(Qt.UserRole + 3)
-                    if not plat_id:  # Fallback to text if data not available
-                        plat_id = item.text()
-                    if plat_id not in seen:
-                        platforms.append(plat_id)
-                        seen.add(plat_id)
+        platforms = self._get_selected_platforms()
 
         if not platforms:
             QMessageBox.information(self, "No platforms selected", "Select at least one platform.")
@@ -1003,20 +1160,9 @@ class IconGeneratorTab(QWidget):
         # Get search input text
         search_input_text = self.search_input.text().strip()
 
-        # Count total games for "all" option (estimate from config)
-        try:
-            with open(cfg_path, "r", encoding="utf-8") as f:
-                cfg = yaml.safe_load(f) or {}
-            total_games = 0
-            for plat_id in platforms:
-                plat_cfg = cfg.get("platforms", {}).get(plat_id, {})
-                games = plat_cfg.get("games", [])
-                if games:
-                    total_games += len(games)
-                else:
-                    total_games += 100  # Estimate if no local list
-        except:
-            total_games = len(platforms) * 100  # Rough estimate
+        # Count total games for "all" option (estimate from the game counts
+        # noted when the platform list was loaded; 100 if no local list)
+        total_games = sum(self._platform_game_counts.get(plat_id) or 100 for plat_id in platforms)
 
         # Show processing options dialog
         choice, search_term = self._show_processing_options_dialog(
@@ -1055,7 +1201,8 @@ class IconGeneratorTab(QWidget):
         callbacks.preview.connect(self.add_preview_icon)  # Connect live preview
 
         # Get source configuration from widget
-        source_order_config = self.source_priority.get_source_order()
+        settings = self._get_effective_settings()
+        source_order_config = settings["source_order"]
 
         # Set letter filter if applicable
         letter_filter = None
@@ -1069,11 +1216,12 @@ class IconGeneratorTab(QWidget):
 
         def _run():
             try:
-                # Bridge backend callbacks (expects callables) -> Qt signals
+                # Bridge backend callbacks (expects callables) -> Qt signals;
+                # the backend already passes ints/str paths, so bind emit directly
                 cb_dict = {
-                    "progress": lambda done, total: callbacks.progress.emit(done, total),
+                    "progress": callbacks.progress.emit,
                     "log": lambda msg: callbacks.log.emit(str(msg)),
-                    "preview": lambda path: callbacks.preview.emit(str(path)),
+                    "preview": callbacks.preview.emit,
                     "request_selection": self._request_artwork_selection,
                 }
 
@@ -1091,8 +1239,8 @@ class IconGeneratorTab(QWidget):
                     download_heroes=self.download_heroes.isChecked(),
                     hero_count=1,
                     region_preference=region_pref,
-                    fallback_settings=self.fallback_settings,
-                    custom_border_settings=self.custom_border_settings
+                    fallback_settings=settings["fallback_settings"],
+                    custom_border_settings=settings["custom_border_settings"]
                 )
 
             except Exception as e:
@@ -1110,16 +1258,33 @@ class IconGeneratorTab(QWidget):
         self.btn_cancel.setEnabled(False)
 
     def on_progress(self, done: int, total: int):
+        self._pending_progress = (done, total)
+        # The last update always goes through so the bar doesn't stop short of 100%
+        if done >= total or not self._progress_timer.isActive():
+            self._flush_progress()
+
+    def _flush_progress(self):
+        """Show the latest progress update and open a new throttle window."""
+        if self._pending_progress is None:
+            return
+        done, total = self._pending_progress
+        self._pending_progress = None
+        self._progress_timer.start()
+
         if total <= 0:
             self.progress.setValue(0)
             self.progress.setFormat("Ready")
             return
         pct = int(round((done / total) * 100))
         pct = max(0, min(100, pct))
-        self.progress.setValue(pct)
+        if pct != self.progress.value():
+            self.progress.setValue(pct)
         self.progress.setFormat(f"{done}/{total} ({pct}%)")
 
     def on_finished(self, ok: bool, msg: str):
+        # Apply any throttled update now, before the final status replaces its format
+        self._flush_progress()
+        self._progress_timer.stop()
         self.append_log(f"[DONE] {msg}")
         self.btn_start.setEnabled(True)
         self.btn_cancel.setEnabled(False)
@@ -1173,14 +1338,13 @@ class IconGeneratorTab(QWidget):
 
     def open_output_dir(self):
         """Open output directory in file explorer."""
-        cfg_path = Path(self.config_path)
+        cfg_path = self._cfg_path
         if not cfg_path.exists():
             QMessageBox.warning(self, "Config Error", "Config file not found.")
             return
 
         try:
-            with open(cfg_path, "r", encoding="utf-8") as f:
-                cfg = yaml.safe_load(f) or {}
+            cfg = run_backend.load_yaml(cfg_path)
         except Exception as e:
             QMessageBox.warning(self, "Config Error", f"Failed to load config: {e}")
             return
@@ -1213,10 +1377,9 @@ class IconGeneratorTab(QWidget):
         device_base_path = self.device_settings.get("path", "/sdcard/Android/media/com.iisulauncher/iiSULauncher/assets/media/roms/consoles")
 
         # Get output directory
-        cfg_path = Path(self.config_path)
+        cfg_path = self._cfg_path
         try:
-            with open(cfg_path, "r", encoding="utf-8") as f:
-                cfg = yaml.safe_load(f) or {}
+            cfg = run_backend.load_yaml(cfg_path)
             output_dir = cfg_path.parent / cfg.get("paths", {}).get("output_dir", "./output")
         except:
             output_dir = cfg_path.parent / "output"
@@ -1232,54 +1395,88 @@ class IconGeneratorTab(QWidget):
         pushed = 0
         errors = 0
 
-        # Scan platform folders
-        for platform_dir in output_dir.iterdir():
-            if not platform_dir.is_dir():
-                continue
+        # Scan platform folders (scandir entries answer is_dir/is_file from
+        # the directory listing, without a stat per entry)
+        with os.scandir(output_dir) as platform_entries:
+            platform_dirs = [entry for entry in platform_entries if entry.is_dir()]
 
+        game_pushes = []  # (device_game_path, [asset DirEntry])
+        for platform_dir in platform_dirs:
             platform_name = platform_dir.name
 
             # Scan game folders within platform
-            for game_dir in platform_dir.iterdir():
-                if not game_dir.is_dir():
-                    continue
+            with os.scandir(platform_dir.path) as game_entries:
+                game_dirs = [entry for entry in game_entries if entry.is_dir()]
 
+            for game_dir in game_dirs:
                 game_name = game_dir.name
                 device_game_path = f"{device_base_path}/{platform_name}/{game_name}"
 
                 # Find all asset files to push
-                asset_files = []
-                for asset_file in game_dir.iterdir():
-                    if asset_file.is_file() and asset_file.suffix.lower() in ('.png', '.jpg', '.jpeg'):
-                        asset_files.append(asset_file)
-
-                if not asset_files:
-                    continue
+                with os.scandir(game_dir.path) as asset_entries:
+                    asset_files = [
+                        entry for entry in asset_entries
+                        if entry.name.lower().endswith(DEVICE_ASSET_EXTENSIONS) and entry.is_file()
+                    ]
+
+                if asset_files:
+                    game_pushes.append((device_game_path, asset_files))
+
+        # Create all game folders on device up front, several per adb shell
+        # call instead of one round trip per game
+        for i in range(0, len(game_pushes), 50):
+            folders = " ".join(shlex.quote(path) for path, _ in game_pushes[i:i + 50])
+            try:
+                subprocess.run(
+                    [adb_path, "-s", device_id, "shell", f"mkdir -p {folders}"],
+                    capture_output=True, text=True, timeout=30
+                )
+            except:
+                pass
 
-                # Create game folder on device if needed
+        def push_game(device_game_path, asset_files):
+            """Push one game's assets; returns (pushed, errors, log lines)."""
+            # Push the game's assets in one adb call into its folder
+            try:
+                result = subprocess.run(
+                    [adb_path, "-s", device_id, "push", *(entry.path for entry in asset_files), device_game_path],
+                    capture_output=True, text=True, timeout=30 * len(asset_files)
+                )
+                if result.returncode == 0:
+                    return len(asset_files), 0, []
+            except Exception:
+                pass
+
+            # Retry one by one so a single bad file doesn't fail the folder
+            game_pushed = 0
+            game_errors = 0
+            messages = []
+            for asset_file in asset_files:
                 try:
-                    subprocess.run(
-                        [adb_path, "-s", device_id, "shell", f'mkdir -p "{device_game_path}"'],
-                        capture_output=True, text=True, timeout=10
+                    result = subprocess.run(
+                        [adb_path, "-s", device_id, "push", asset_file.path, f"{device_game_path}/{asset_file.name}"],
+                        capture_output=True, text=True, timeout=30
                     )
-                except:
-                    pass
-
-                # Push each asset file
-                for asset_file in asset_files:
-                    try:
-                        result = subprocess.run(
-                            [adb_path, "-s", device_id, "push", str(asset_file), f"{device_game_path}/{asset_file.name}"],
-                            capture_output=True, text=True, timeout=30
-                        )
-                        if result.returncode == 0:
-                            pushed += 1
-                        else:
-                            errors += 1
-                            self.append_log(f"[DEVICE] Failed to push {asset_file.name}: {result.stderr}")
-                    except Exception as e:
-                        errors += 1
-                        self.append_log(f"[DEVICE] Error pushing {asset_file.name}: {e}")
+                    if result.returncode == 0:
+                        game_pushed += 1
+                    else:
+                        game_errors += 1
+                        messages.append(f"[DEVICE] Failed to push {asset_file.name}: {result.stderr}")
+                except Exception as e:
+                    game_errors += 1
+                    messages.append(f"[DEVICE] Error pushing {asset_file.name}: {e}")
+            return game_pushed, game_errors, messages
+
+        # Games are independent, so overlap their adb round trips; logging
+        # stays on this (GUI) thread
+        with ThreadPoolExecutor(max_workers=4) as ex:
+            futures = [ex.submit(push_game, path, files) for path, files in game_pushes]
+            for fut in as_completed(futures):
+                game_pushed, game_errors, messages = fut.result()
+                pushed += game_pushed
+                errors += game_errors
+                for message in messages:
+                    self.append_log(message)
 
         if pushed > 0:
             self.append_log(f"[DEVICE] Pushed {pushed} files to device ({errors} errors)")
@@ -3,9 +3,12 @@ Options Dialog for Icon Generator
 Handles configuration with categorized tabs and full settings persistence
 """
 import os
+import threading
+import time
+from functools import lru_cache
 from pathlib import Path
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import Qt, Signal, QRunnable, QThreadPool, QTimer
+from PySide6.QtGui import QAction, QColor, QIcon, QImageReader, QIntValidator, QPainter, QPen, QPixmap
 from PySide6.QtWidgets import (
     QDialog, QVBoxLayout, QHBoxLayout, QFormLayout,
     QLabel, QPushButton, QLineEdit, QSpinBox, QFileDialog,
@@ -17,11 +20,153 @@ from source_priority_widget import SourcePriorityWidget
 from api_key_manager import get_manager
 from rom_parser import get_available_drives, find_iisu_directory
 from device_asset_dialog import DeviceAssetDialog
+from run_backend import load_yaml
+
+# Tab indices; every tab but General is constructed the first time it is shown
+GENERAL_TAB = 0
+SOURCES_TAB = 1
+OUTPUT_TAB = 2
+PROCESSING_TAB = 3
+PLATFORMS_TAB = 4
+
+# Default start directory for Browse dialogs, resolved once
+HOME_DIR = str(Path.home())
+
+# File filter for the border and icon Browse dialogs
+IMAGE_FILE_FILTER = "Images (*.png *.jpg *.jpeg *.bmp);;All Files (*)"
+
+# API key rows on the General tab: (key manager service, label, placeholder, help link shown below the row)
+API_KEY_FIELDS = [
+    ("steamgriddb", "SteamGridDB:", "Enter SteamGridDB API key",
+     '<a href="https://www.steamgriddb.com/profile/preferences/api">Get API key</a>'),
+    ("igdb_client_id", "IGDB Client ID:", "Enter IGDB Client ID", None),
+    ("igdb_client_secret", "IGDB Secret:", "Enter IGDB Client Secret",
+     '<a href="https://api-docs.igdb.com/#account-creation">Get IGDB credentials</a>'),
+]
+
+# Seconds to wait on a path probe before treating the path as unavailable
+PATH_PROBE_TIMEOUT = 0.1
+
+# Seconds a drive listing is reused before the volumes are enumerated again
+DRIVES_CACHE_TTL = 10.0
+
+_drives_cache = (0.0, None)  # (timestamp, drives)
+
+
+def get_available_drives_cached():
+    """get_available_drives() reused for DRIVES_CACHE_TTL seconds across dialog opens."""
+    global _drives_cache
+    stamp, drives = _drives_cache
+    now = time.monotonic()
+    if drives is None or now - stamp > DRIVES_CACHE_TTL:
+        drives = get_available_drives()
+        _drives_cache = (now, drives)
+    return drives
+
+
+def password_toggle_icon() -> QIcon:
+    """Small eye glyph for the show/hide action on the API key fields."""
+    pixmap = QPixmap(16, 16)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    painter.setRenderHint(QPainter.Antialiasing)
+    painter.setPen(QPen(QColor("#888888"), 1.5))
+    painter.drawEllipse(1, 4, 14, 8)
+    painter.setBrush(QColor("#888888"))
+    painter.drawEllipse(6, 6, 4, 4)
+    painter.end()
+    return QIcon.fromTheme("view-reveal-symbolic", QIcon(pixmap))
+
+
+# Recently previewed borders; the mtime is part of the key so edited files are reloaded.
+# QPixmap is GUI-thread only, so this must not be called from the thread pool.
+@lru_cache(maxsize=32)
+def scaled_preview_pixmap(path: str, mtime_ns: int, width: int, height: int) -> QPixmap:
+    reader = QImageReader(path)
+    if not reader.canRead():
+        return QPixmap()
+    source_size = reader.size()
+    if source_size.isValid():
+        # Decode straight to the preview size instead of decoding the full image and scaling it
+        reader.setScaledSize(source_size.scaled(width, height, Qt.KeepAspectRatio))
+    image = reader.read()
+    if image.isNull():
+        return QPixmap()
+    if not source_size.isValid():
+        image = image.scaled(width, height, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+    return QPixmap.fromImage(image)
+
+
+class RomFolderSearchRunnable(QRunnable):
+    """Run find_iisu_directory() on the thread pool."""
+
+    def __init__(self, dialog: "OptionsDialog", generation: int):
+        super().__init__()
+        self._dialog = dialog
+        self._generation = generation
+
+    def run(self):
+        try:
+            drives = get_available_drives_cached()
+            found_path = find_iisu_directory([Path(drive_path) for drive_path, _ in drives])
+        except Exception:
+            found_path = None
+        try:
+            self._dialog.rom_folder_found.emit(self._generation, str(found_path) if found_path else "")
+        except RuntimeError:
+            pass  # Dialog was closed while searching
+
+
+def set_enabled_if_changed(widget: QWidget, enabled: bool):
+    """setEnabled() only when the widget's own setting differs, skipping the re-polish.
+
+    Checks WA_ForceDisabled, which reflects setEnabled() on this widget alone;
+    WA_Disabled is also set when a disabled parent disables the widget.
+    """
+    if widget.testAttribute(Qt.WA_ForceDisabled) == enabled:
+        widget.setEnabled(enabled)
+
+
+def path_exists_fast(path: str, timeout: float = PATH_PROBE_TIMEOUT) -> bool:
+    """os.path.exists() that gives up after timeout, e.g. on a disconnected network share."""
+    result = []
+    probe = threading.Thread(target=lambda: result.append(os.path.exists(path)), daemon=True)
+    probe.start()
+    probe.join(timeout)
+    return bool(result and result[0])
+
+
+class ConfigPlatformsRunnable(QRunnable):
+    """Read the platform keys from the config file on the thread pool."""
+
+    def __init__(self, dialog: "OptionsDialog", config_path: str):
+        super().__init__()
+        self._dialog = dialog
+        self._config_path = config_path
+
+    def run(self):
+        platform_keys = []
+        config_path = Path(self._config_path) if self._config_path else None
+        if config_path and config_path.exists():
+            try:
+                cfg = load_yaml(config_path)
+                platform_keys = sorted(cfg.get("platforms", {}).keys())
+            except Exception:
+                pass
+        try:
+            self._dialog.config_platforms_loaded.emit(platform_keys)
+        except RuntimeError:
+            pass  # Dialog was closed while loading
 
 
 class OptionsDialog(QDialog):
     """Options dialog for configuring Icon Generator settings with categorized tabs."""
 
+    # Emitted from RomFolderSearchRunnable with its search generation; empty string when nothing was found
+    rom_folder_found = Signal(int, str)
+    # Emitted from ConfigPlatformsRunnable with the sorted platform keys of the config
+    config_platforms_loaded = Signal(object)
+
     def __init__(self, parent=None, config_path="", workers=8, limit=0, source_priority_widget=None,
                  rom_directory_settings=None):
         super().__init__(parent)
@@ -35,6 +180,19 @@ class OptionsDialog(QDialog):
         self.limit_value = limit
         self.source_priority_widget_ref = source_priority_widget
 
+        self._reset_settings(rom_directory_settings)
+
+        self.rom_folder_found.connect(self._on_rom_folder_found)
+        self.config_platforms_loaded.connect(self._on_config_platforms_loaded)
+        self._config_platform_keys = None  # Filled in the background when the Output tab is built
+        self._last_browse_dir = {}  # Browse key -> directory the last pick came from
+        self._rom_search_generation = 0  # Bumped per search and per reopen; older results are dropped
+        self._password_toggle_icon = None  # Shared by the API key fields, built on first use
+
+        self._setup_ui()
+
+    def _reset_settings(self, rom_directory_settings=None):
+        """Set every stored settings dict back to its default."""
         # ROM directory settings
         self.rom_directory_settings = rom_directory_settings or {
             "mode": "manual",
@@ -90,7 +248,51 @@ class OptionsDialog(QDialog):
         # Custom platforms
         self.custom_platforms = {}
 
-        self._setup_ui()
+    def refresh_state(self, config_path="", workers=8, limit=0, source_priority_widget=None,
+                      rom_directory_settings=None):
+        """Reset the dialog for another open, reusing the widgets already built.
+
+        Takes the same arguments as the constructor; the set_* setters can then be applied as on
+        a fresh dialog. The config's platform list is read again since the file may have changed;
+        the drive list is re-read once its cache expires.
+        """
+        self.config_path_value = config_path
+        self.workers_value = workers
+        self.limit_value = limit
+        self.source_priority_widget_ref = source_priority_widget
+        self._reset_settings(rom_directory_settings)
+        self._config_platform_keys = None
+
+        self.config_path.setText(config_path)
+        self.rom_path.setText(self.rom_directory_settings.get("rom_path", ""))
+        self.remember_rom_path.setChecked(self.rom_directory_settings.get("remember_last_path", True))
+        # As on first open, the key fields are filled once the dialog has painted
+        self._api_keys_loaded = False
+        QTimer.singleShot(0, self._populate_api_keys)
+
+        # A search still running from the previous open reports into a dialog that has moved on
+        self._rom_search_generation += 1
+        self.rom_path.setPlaceholderText("Browse to select your ROM folder...")
+        self.btn_auto_detect.setEnabled(True)
+        self.btn_browse_rom.setEnabled(True)
+        self._update_drives_label()
+
+        if SOURCES_TAB in self._tab_built:
+            if source_priority_widget:
+                self.source_priority.set_source_order(source_priority_widget.get_source_order())
+            self.set_hero_settings(self.hero_settings)
+            self.set_fallback_settings(self.fallback_settings)
+            self.set_screenshot_settings(self.screenshot_settings)
+            self.set_logo_settings(self.logo_settings)
+        if PROCESSING_TAB in self._tab_built:
+            self.workers.setText(str(workers))
+            self.limit.setValue(limit)
+        self.set_device_settings(self.device_settings)
+        self.set_export_settings(self.export_settings)
+        self.set_custom_border_settings(self.custom_border_settings)
+        self.set_custom_platforms(self.custom_platforms)
+        if PLATFORMS_TAB in self._tab_built:
+            self._clear_new_platform_form()
 
     def _setup_ui(self):
         layout = QVBoxLayout(self)
@@ -99,12 +301,22 @@ class OptionsDialog(QDialog):
         # Create tab widget for categories
         self.tab_widget = QTabWidget()
 
-        # Create tabs
-        self.tab_widget.addTab(self._create_general_tab(), "General")
-        self.tab_widget.addTab(self._create_sources_tab(), "Sources")
-        self.tab_widget.addTab(self._create_output_tab(), "Output")
-        self.tab_widget.addTab(self._create_processing_tab(), "Processing")
-        self.tab_widget.addTab(self._create_platforms_tab(), "Platforms")
+        # Create tabs; only General is built up front, the rest on first activation
+        self._tab_builders = {
+            GENERAL_TAB: ("General", self._create_general_tab),
+            SOURCES_TAB: ("Sources", self._create_sources_tab),
+            OUTPUT_TAB: ("Output", self._create_output_tab),
+            PROCESSING_TAB: ("Processing", self._create_processing_tab),
+            PLATFORMS_TAB: ("Platforms", self._create_platforms_tab),
+        }
+        self._tab_built = set()
+        for index, (name, builder) in self._tab_builders.items():
+            if index == GENERAL_TAB:
+                self.tab_widget.addTab(builder(), name)
+                self._tab_built.add(index)
+            else:
+                self.tab_widget.addTab(QWidget(), name)
+        self.tab_widget.currentChanged.connect(self._ensure_tab_built)
 
         layout.addWidget(self.tab_widget, 1)
 
@@ -116,6 +328,56 @@ class OptionsDialog(QDialog):
         button_box.rejected.connect(self.reject)
         layout.addWidget(button_box)
 
+    def _ensure_tab_built(self, index: int):
+        """Swap the placeholder at index for the real tab the first time it is shown."""
+        if index < 0 or index in self._tab_built:
+            return
+        self._tab_built.add(index)
+        name, builder = self._tab_builders[index]
+        widget = builder()
+        current = self.tab_widget.currentIndex()
+        placeholder = self.tab_widget.widget(index)
+        self.tab_widget.blockSignals(True)
+        self.tab_widget.removeTab(index)
+        self.tab_widget.insertTab(index, widget, name)
+        self.tab_widget.setCurrentIndex(current)
+        self.tab_widget.blockSignals(False)
+        placeholder.deleteLater()
+
+        if index == PLATFORMS_TAB:
+            # Let the tab paint before the custom platforms list is filled
+            QTimer.singleShot(0, self._load_custom_platforms_list)
+
+    def _settings_checkbox(self, text: str, settings: dict, key: str, default: bool) -> QCheckBox:
+        checkbox = QCheckBox(text)
+        checkbox.setChecked(settings.get(key, default))
+        return checkbox
+
+    def _int_field(self, value: int, minimum: int, maximum: int) -> QLineEdit:
+        """Line edit accepting whole numbers in [minimum, maximum]; lighter than a QSpinBox."""
+        line_edit = QLineEdit(str(value))
+        line_edit.setValidator(QIntValidator(minimum, maximum, line_edit))
+        line_edit.setMaximumWidth(80)
+        return line_edit
+
+    def _int_value(self, line_edit: QLineEdit, default: int) -> int:
+        """Value of an _int_field, clamped to its range; default when empty."""
+        try:
+            value = int(line_edit.text())
+        except ValueError:
+            return default
+        validator = line_edit.validator()
+        return max(validator.bottom(), min(validator.top(), value))
+
+    def _inline_row(self, *widgets) -> QHBoxLayout:
+        """Margin-free HBox for a form row; widgets are (widget, stretch) pairs."""
+        row = QHBoxLayout()
+        row.setContentsMargins(0, 0, 0, 0)
+        row.setSpacing(6)
+        for widget, stretch in widgets:
+            row.addWidget(widget, stretch)
+        return row
+
     def _create_general_tab(self):
         """Create the General settings tab (API Keys, ROM Directory, Config)."""
         tab = QWidget()
@@ -132,61 +394,20 @@ class OptionsDialog(QDialog):
         api_layout = QFormLayout()
         api_layout.setSpacing(10)
 
-        key_manager = get_manager()
+        self.api_key_edits = {}
+        for service, label, placeholder, help_html in API_KEY_FIELDS:
+            line_edit = QLineEdit()
+            line_edit.setPlaceholderText(placeholder)
+            line_edit.setEchoMode(QLineEdit.Password)
+            self._attach_show_toggle(line_edit)
+            api_layout.addRow(label, line_edit)
+            self.api_key_edits[service] = line_edit
 
-        # SteamGridDB API Key
-        self.sgdb_key = QLineEdit()
-        self.sgdb_key.setPlaceholderText("Enter SteamGridDB API key")
-        self.sgdb_key.setEchoMode(QLineEdit.Password)
-        current_sgdb = key_manager.get_key("steamgriddb")
-        if current_sgdb:
-            self.sgdb_key.setText(current_sgdb)
-        sgdb_row = QHBoxLayout()
-        sgdb_row.addWidget(self.sgdb_key, 1)
-        btn_sgdb_show = QPushButton("Show")
-        btn_sgdb_show.setMaximumWidth(60)
-        btn_sgdb_show.clicked.connect(lambda: self._toggle_password_visibility(self.sgdb_key))
-        sgdb_row.addWidget(btn_sgdb_show)
-        api_layout.addRow("SteamGridDB:", sgdb_row)
-
-        sgdb_help = QLabel('<a href="https://www.steamgriddb.com/profile/preferences/api">Get API key</a>')
-        sgdb_help.setOpenExternalLinks(True)
-        sgdb_help.setStyleSheet("color: #00DDFF; font-size: 10px;")
-        api_layout.addRow("", sgdb_help)
-
-        # IGDB API Keys
-        self.igdb_client_id = QLineEdit()
-        self.igdb_client_id.setPlaceholderText("Enter IGDB Client ID")
-        self.igdb_client_id.setEchoMode(QLineEdit.Password)
-        current_igdb_id = key_manager.get_key("igdb_client_id")
-        if current_igdb_id:
-            self.igdb_client_id.setText(current_igdb_id)
-        igdb_id_row = QHBoxLayout()
-        igdb_id_row.addWidget(self.igdb_client_id, 1)
-        btn_igdb_id_show = QPushButton("Show")
-        btn_igdb_id_show.setMaximumWidth(60)
-        btn_igdb_id_show.clicked.connect(lambda: self._toggle_password_visibility(self.igdb_client_id))
-        igdb_id_row.addWidget(btn_igdb_id_show)
-        api_layout.addRow("IGDB Client ID:", igdb_id_row)
-
-        self.igdb_client_secret = QLineEdit()
-        self.igdb_client_secret.setPlaceholderText("Enter IGDB Client Secret")
-        self.igdb_client_secret.setEchoMode(QLineEdit.Password)
-        current_igdb_secret = key_manager.get_key("igdb_client_secret")
-        if current_igdb_secret:
-            self.igdb_client_secret.setText(current_igdb_secret)
-        igdb_secret_row = QHBoxLayout()
-        igdb_secret_row.addWidget(self.igdb_client_secret, 1)
-        btn_igdb_secret_show = QPushButton("Show")
-        btn_igdb_secret_show.setMaximumWidth(60)
-        btn_igdb_secret_show.clicked.connect(lambda: self._toggle_password_visibility(self.igdb_client_secret))
-        igdb_secret_row.addWidget(btn_igdb_secret_show)
-        api_layout.addRow("IGDB Secret:", igdb_secret_row)
-
-        igdb_help = QLabel('<a href="https://api-docs.igdb.com/#account-creation">Get IGDB credentials</a>')
-        igdb_help.setOpenExternalLinks(True)
-        igdb_help.setStyleSheet("color: #00DDFF; font-size: 10px;")
-        api_layout.addRow("", igdb_help)
+            if help_html:
+                help_label = QLabel(help_html)
+                help_label.setOpenExternalLinks(True)
+                help_label.setStyleSheet("color: #00DDFF; font-size: 10px;")
+                api_layout.addRow("", help_label)
 
         tgdb_note = QLabel("TheGamesDB: Using built-in API key")
         tgdb_note.setStyleSheet("color: #4CAF50; font-size: 11px;")
@@ -200,32 +421,23 @@ class OptionsDialog(QDialog):
         rom_layout = QFormLayout()
         rom_layout.setSpacing(10)
 
-        rom_path_row = QHBoxLayout()
         self.rom_path = QLineEdit(self.rom_directory_settings.get("rom_path", ""))
         self.rom_path.setPlaceholderText("Browse to select your ROM folder...")
-        rom_path_row.addWidget(self.rom_path, 1)
-        btn_browse_rom = QPushButton("Browse...")
-        btn_browse_rom.clicked.connect(self._browse_rom_path)
-        rom_path_row.addWidget(btn_browse_rom)
-        rom_layout.addRow("ROM Folder:", rom_path_row)
+        self.btn_browse_rom = QPushButton("Browse...")
+        self.btn_browse_rom.clicked.connect(self._browse_rom_path)
+        rom_layout.addRow("ROM Folder:", self._inline_row((self.rom_path, 1), (self.btn_browse_rom, 0)))
 
-        drives = get_available_drives()
-        if drives:
-            drives_text = ", ".join([d[1] for d in drives[:6]])
-            if len(drives) > 6:
-                drives_text += f" (+{len(drives) - 6} more)"
-            drives_label = QLabel(f"<span style='color: #888; font-size: 10px;'>Drives: {drives_text}</span>")
-            rom_layout.addRow("", drives_label)
-
-        auto_detect_row = QHBoxLayout()
-        btn_auto_detect = QPushButton("Search for ROM Folders")
-        btn_auto_detect.clicked.connect(self._auto_detect_rom_folder)
-        auto_detect_row.addWidget(btn_auto_detect)
+        self.drives_label = QLabel()
+        self._update_drives_label()
+        rom_layout.addRow("", self.drives_label)
+
+        self.btn_auto_detect = QPushButton("Search for ROM Folders")
+        self.btn_auto_detect.clicked.connect(self._auto_detect_rom_folder)
+        auto_detect_row = self._inline_row((self.btn_auto_detect, 0))
         auto_detect_row.addStretch()
         rom_layout.addRow("", auto_detect_row)
 
-        self.remember_rom_path = QCheckBox("Remember selected folder")
-        self.remember_rom_path.setChecked(self.rom_directory_settings.get("remember_last_path", True))
+        self.remember_rom_path = self._settings_checkbox("Remember selected folder", self.rom_directory_settings, "remember_last_path", True)
         rom_layout.addRow("", self.remember_rom_path)
 
         rom_group.setLayout(rom_layout)
@@ -236,13 +448,10 @@ class OptionsDialog(QDialog):
         config_layout = QFormLayout()
         config_layout.setSpacing(10)
 
-        config_row = QHBoxLayout()
         self.config_path = QLineEdit(self.config_path_value)
         btn_browse = QPushButton("Browse...")
         btn_browse.clicked.connect(self._browse_config)
-        config_row.addWidget(self.config_path, 1)
-        config_row.addWidget(btn_browse)
-        config_layout.addRow("Config File:", config_row)
+        config_layout.addRow("Config File:", self._inline_row((self.config_path, 1), (btn_browse, 0)))
 
         config_group.setLayout(config_layout)
         scroll_layout.addWidget(config_group)
@@ -253,8 +462,18 @@ class OptionsDialog(QDialog):
         tab_layout = QVBoxLayout(tab)
         tab_layout.setContentsMargins(0, 0, 0, 0)
         tab_layout.addWidget(scroll)
+
+        # The key fields are filled once the dialog has painted
+        self._api_keys_loaded = False
+        QTimer.singleShot(0, self._populate_api_keys)
         return tab
 
+    def _populate_api_keys(self):
+        keys = get_manager().get_keys(list(self.api_key_edits))
+        for service, line_edit in self.api_key_edits.items():
+            line_edit.setText(keys[service])
+        self._api_keys_loaded = True
+
     def _create_sources_tab(self):
         """Create the Sources settings tab (Priority, Hero, Screenshots, Logos)."""
         tab = QWidget()
@@ -287,18 +506,14 @@ class OptionsDialog(QDialog):
         hero_layout = QFormLayout()
         hero_layout.setSpacing(10)
 
-        self.hero_enabled = QCheckBox("Download hero images")
-        self.hero_enabled.setChecked(self.hero_settings.get("enabled", True))
+        self.hero_enabled = self._settings_checkbox("Download hero images", self.hero_settings, "enabled", True)
         self.hero_enabled.setToolTip("Download hero/banner images from SteamGridDB")
         hero_layout.addRow("", self.hero_enabled)
 
-        self.hero_count = QSpinBox()
-        self.hero_count.setRange(1, 5)
-        self.hero_count.setValue(self.hero_settings.get("count", 1))
+        self.hero_count = self._int_field(self.hero_settings.get("count", 1), 1, 5)
         hero_layout.addRow("Count per game:", self.hero_count)
 
-        self.hero_save_with_icons = QCheckBox("Save in same folder as icons")
-        self.hero_save_with_icons.setChecked(self.hero_settings.get("save_with_icons", True))
+        self.hero_save_with_icons = self._settings_checkbox("Save in same folder as icons", self.hero_settings, "save_with_icons", True)
         hero_layout.addRow("", self.hero_save_with_icons)
 
         hero_group.setLayout(hero_layout)
@@ -309,13 +524,10 @@ class OptionsDialog(QDialog):
         screenshot_layout = QFormLayout()
         screenshot_layout.setSpacing(10)
 
-        self.screenshot_enabled = QCheckBox("Download screenshots")
-        self.screenshot_enabled.setChecked(self.screenshot_settings.get("enabled", False))
+        self.screenshot_enabled = self._settings_checkbox("Download screenshots", self.screenshot_settings, "enabled", False)
         screenshot_layout.addRow("", self.screenshot_enabled)
 
-        self.screenshot_count = QSpinBox()
-        self.screenshot_count.setRange(1, 10)
-        self.screenshot_count.setValue(self.screenshot_settings.get("count", 3))
+        self.screenshot_count = self._int_field(self.screenshot_settings.get("count", 3), 1, 10)
         screenshot_layout.addRow("Count per game:", self.screenshot_count)
 
         screenshot_group.setLayout(screenshot_layout)
@@ -326,12 +538,10 @@ class OptionsDialog(QDialog):
         logo_layout = QFormLayout()
         logo_layout.setSpacing(10)
 
-        self.scrape_logos = QCheckBox("Scrape game logos")
-        self.scrape_logos.setChecked(self.logo_settings.get("scrape_logos", True))
+        self.scrape_logos = self._settings_checkbox("Scrape game logos", self.logo_settings, "scrape_logos", True)
         logo_layout.addRow("", self.scrape_logos)
 
-        self.logo_fallback_boxart = QCheckBox("Fall back to boxart if no logo found")
-        self.logo_fallback_boxart.setChecked(self.logo_settings.get("fallback_to_boxart", True))
+        self.logo_fallback_boxart = self._settings_checkbox("Fall back to boxart if no logo found", self.logo_settings, "fallback_to_boxart", True)
         logo_layout.addRow("", self.logo_fallback_boxart)
 
         logo_group.setLayout(logo_layout)
@@ -342,23 +552,20 @@ class OptionsDialog(QDialog):
         fallback_layout = QFormLayout()
         fallback_layout.setSpacing(10)
 
-        self.use_fallback = QCheckBox("Use platform icon when artwork not found")
-        self.use_fallback.setChecked(self.fallback_settings.get("use_platform_icon_fallback", False))
+        self.use_fallback = self._settings_checkbox("Use platform icon when artwork not found", self.fallback_settings, "use_platform_icon_fallback", False)
         fallback_layout.addRow("", self.use_fallback)
 
-        self.skip_scraping = QCheckBox("Skip scraping - always use platform icon")
-        self.skip_scraping.setChecked(self.fallback_settings.get("skip_scraping_use_platform_icon", False))
+        self.skip_scraping = self._settings_checkbox("Skip scraping - always use platform icon", self.fallback_settings, "skip_scraping_use_platform_icon", False)
         self.skip_scraping.toggled.connect(self._on_skip_scraping_changed)
+        self._on_skip_scraping_changed(self.skip_scraping.isChecked())
         fallback_layout.addRow("", self.skip_scraping)
 
-        fallback_path_row = QHBoxLayout()
         self.fallback_icons_path = QLineEdit()
         self.fallback_icons_path.setPlaceholderText("Default: fallback_icons folder")
-        fallback_path_row.addWidget(self.fallback_icons_path, 1)
+        self.fallback_icons_path.setText(self.fallback_settings.get("fallback_icons_path", ""))
         btn_browse_fallback = QPushButton("Browse...")
         btn_browse_fallback.clicked.connect(self._browse_fallback_icons)
-        fallback_path_row.addWidget(btn_browse_fallback)
-        fallback_layout.addRow("Fallback Folder:", fallback_path_row)
+        fallback_layout.addRow("Fallback Folder:", self._inline_row((self.fallback_icons_path, 1), (btn_browse_fallback, 0)))
 
         fallback_group.setLayout(fallback_layout)
         scroll_layout.addWidget(fallback_group)
@@ -393,9 +600,8 @@ class OptionsDialog(QDialog):
         self.export_format.currentTextChanged.connect(self._on_export_format_changed)
         export_layout.addRow("Image Format:", self.export_format)
 
-        self.jpeg_quality = QSpinBox()
-        self.jpeg_quality.setRange(1, 100)
-        self.jpeg_quality.setValue(self.export_settings.get("jpeg_quality", 95))
+        self.jpeg_quality = self._int_field(self.export_settings.get("jpeg_quality", 95), 1, 100)
+        self._on_export_format_changed(self.export_format.currentText())
         export_layout.addRow("JPEG Quality:", self.jpeg_quality)
 
         export_note = QLabel("<span style='color: #888; font-size: 10px;'>JPEG recommended for iiSU Launcher</span>")
@@ -409,8 +615,7 @@ class OptionsDialog(QDialog):
         device_layout = QFormLayout()
         device_layout.setSpacing(10)
 
-        self.copy_to_device = QCheckBox("Auto-copy to Android device after processing")
-        self.copy_to_device.setChecked(self.device_settings.get("enabled", False))
+        self.copy_to_device = self._settings_checkbox("Auto-copy to Android device after processing", self.device_settings, "enabled", False)
         device_layout.addRow("", self.copy_to_device)
 
         self.device_path = QLineEdit()
@@ -429,25 +634,22 @@ class OptionsDialog(QDialog):
         custom_border_layout = QFormLayout()
         custom_border_layout.setSpacing(10)
 
-        self.use_custom_border = QCheckBox("Use single custom border for ALL platforms")
-        self.use_custom_border.setChecked(self.custom_border_settings.get("enabled", False))
+        self.use_custom_border = self._settings_checkbox("Use single custom border for ALL platforms", self.custom_border_settings, "enabled", False)
         self.use_custom_border.toggled.connect(self._on_custom_border_toggled)
         custom_border_layout.addRow("", self.use_custom_border)
 
-        custom_border_path_row = QHBoxLayout()
         self.custom_border_path = QLineEdit()
         self.custom_border_path.setPlaceholderText("Select a custom border image...")
         self.custom_border_path.setText(self.custom_border_settings.get("path", ""))
-        custom_border_path_row.addWidget(self.custom_border_path, 1)
         self.btn_browse_custom_border = QPushButton("Browse...")
         self.btn_browse_custom_border.clicked.connect(self._browse_custom_border)
-        custom_border_path_row.addWidget(self.btn_browse_custom_border)
-        custom_border_layout.addRow("Global Border:", custom_border_path_row)
+        custom_border_layout.addRow("Global Border:", self._inline_row(
+            (self.custom_border_path, 1), (self.btn_browse_custom_border, 0)))
 
         self.custom_border_preview = QLabel()
         self.custom_border_preview.setFixedSize(96, 96)
+        self.custom_border_preview.setAlignment(Qt.AlignCenter)
         self.custom_border_preview.setStyleSheet("border: 2px solid #3A4048; border-radius: 8px; background: #1E2127;")
-        self.custom_border_preview.setScaledContents(True)
         self._update_custom_border_preview()
         custom_border_layout.addRow("Preview:", self.custom_border_preview)
 
@@ -455,7 +657,7 @@ class OptionsDialog(QDialog):
         per_platform_label = QLabel("<b>Per-Platform Borders</b>")
         custom_border_layout.addRow(per_platform_label)
 
-        per_platform_row = QHBoxLayout()
+        per_platform_row = self._inline_row()
         self.border_platform_combo = QComboBox()
         self.border_platform_combo.setMinimumWidth(150)
         self.border_platform_combo.currentIndexChanged.connect(self._on_border_platform_changed)
@@ -477,8 +679,8 @@ class OptionsDialog(QDialog):
 
         self.per_platform_border_preview = QLabel()
         self.per_platform_border_preview.setFixedSize(64, 64)
+        self.per_platform_border_preview.setAlignment(Qt.AlignCenter)
         self.per_platform_border_preview.setStyleSheet("border: 2px solid #3A4048; border-radius: 4px; background: #1E2127;")
-        self.per_platform_border_preview.setScaledContents(True)
         custom_border_layout.addRow("", self.per_platform_border_preview)
 
         custom_border_group.setLayout(custom_border_layout)
@@ -496,24 +698,20 @@ class OptionsDialog(QDialog):
         return tab
 
     def _create_processing_tab(self):
-        """Create the Processing settings tab (Workers, Limits)."""
-        tab = QWidget()
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setFrameShape(QScrollArea.NoFrame)
+        """Create the Processing settings tab (Workers, Limits).
 
-        scroll_widget = QWidget()
-        scroll_layout = QVBoxLayout(scroll_widget)
-        scroll_layout.setSpacing(16)
+        The content is a single short group, so unlike the other tabs it isn't wrapped in a scroll area.
+        """
+        tab = QWidget()
+        tab_layout = QVBoxLayout(tab)
+        tab_layout.setSpacing(16)
 
         # Processing Group
         processing_group = QGroupBox("Processing Settings")
         processing_layout = QFormLayout()
         processing_layout.setSpacing(10)
 
-        self.workers = QSpinBox()
-        self.workers.setRange(1, 64)
-        self.workers.setValue(self.workers_value)
+        self.workers = self._int_field(self.workers_value, 1, 64)
         self.workers.setToolTip("Number of concurrent workers for parallel processing")
         processing_layout.addRow("Workers:", self.workers)
 
@@ -528,14 +726,9 @@ class OptionsDialog(QDialog):
         processing_layout.addRow(processing_note)
 
         processing_group.setLayout(processing_layout)
-        scroll_layout.addWidget(processing_group)
+        tab_layout.addWidget(processing_group)
 
-        scroll_layout.addStretch()
-        scroll.setWidget(scroll_widget)
-
-        tab_layout = QVBoxLayout(tab)
-        tab_layout.setContentsMargins(0, 0, 0, 0)
-        tab_layout.addWidget(scroll)
+        tab_layout.addStretch()
         return tab
 
     def _create_platforms_tab(self):
@@ -581,32 +774,24 @@ class OptionsDialog(QDialog):
         self.new_platform_publisher.setPlaceholderText("e.g., Valve, Atari")
         platform_form.addRow("Publisher:", self.new_platform_publisher)
 
-        self.new_platform_year = QSpinBox()
-        self.new_platform_year.setRange(1970, 2030)
-        self.new_platform_year.setValue(2000)
+        self.new_platform_year = self._int_field(2000, 1970, 2030)
         platform_form.addRow("Year:", self.new_platform_year)
 
         self.new_platform_type = QComboBox()
         self.new_platform_type.addItems(["console", "handheld", "pc", "arcade", "mobile", "hybrid", "other"])
         platform_form.addRow("Type:", self.new_platform_type)
 
-        border_row = QHBoxLayout()
         self.new_platform_border = QLineEdit()
         self.new_platform_border.setPlaceholderText("Select or leave blank...")
-        border_row.addWidget(self.new_platform_border, 1)
         btn_browse_platform_border = QPushButton("Browse...")
         btn_browse_platform_border.clicked.connect(self._browse_new_platform_border)
-        border_row.addWidget(btn_browse_platform_border)
-        platform_form.addRow("Border File:", border_row)
+        platform_form.addRow("Border File:", self._inline_row((self.new_platform_border, 1), (btn_browse_platform_border, 0)))
 
-        icon_row = QHBoxLayout()
         self.new_platform_icon = QLineEdit()
         self.new_platform_icon.setPlaceholderText("Select or leave blank...")
-        icon_row.addWidget(self.new_platform_icon, 1)
         btn_browse_platform_icon = QPushButton("Browse...")
         btn_browse_platform_icon.clicked.connect(self._browse_new_platform_icon)
-        icon_row.addWidget(btn_browse_platform_icon)
-        platform_form.addRow("Platform Icon:", icon_row)
+        platform_form.addRow("Platform Icon:", self._inline_row((self.new_platform_icon, 1), (btn_browse_platform_icon, 0)))
 
         custom_platform_layout.addLayout(platform_form)
 
@@ -625,8 +810,6 @@ class OptionsDialog(QDialog):
         custom_platform_group.setLayout(custom_platform_layout)
         scroll_layout.addWidget(custom_platform_group)
 
-        self._load_custom_platforms_list()
-
         scroll_layout.addStretch()
         scroll.setWidget(scroll_widget)
 
@@ -637,13 +820,39 @@ class OptionsDialog(QDialog):
 
     # --- Helper Methods ---
 
-    def _browse_config(self):
-        path, _ = QFileDialog.getOpenFileName(
-            self, "Select Config File", str(Path.home()), "YAML (*.yaml *.yml)"
+    def _browse_start_dir(self, key: str, current_path: str = "") -> str:
+        """Start in the field's current path, else where this Browse last ended up, else home."""
+        if current_path and path_exists_fast(current_path):
+            return current_path
+        return self._last_browse_dir.get(key) or HOME_DIR
+
+    def _browse_dir(self, key: str, title: str, current_path: str = "") -> str:
+        path = QFileDialog.getExistingDirectory(
+            self, title, self._browse_start_dir(key, current_path), QFileDialog.ShowDirsOnly
         )
+        if path:
+            self._last_browse_dir[key] = path
+        return path
+
+    def _browse_file(self, key: str, title: str, file_filter: str, current_path: str = "") -> str:
+        path, _ = QFileDialog.getOpenFileName(self, title, self._browse_start_dir(key, current_path), file_filter)
+        if path:
+            self._last_browse_dir[key] = os.path.dirname(path)
+        return path
+
+    def _browse_config(self):
+        path = self._browse_file("config", "Select Config File", "YAML (*.yaml *.yml)")
         if path:
             self.config_path.setText(path)
 
+    def _attach_show_toggle(self, line_edit: QLineEdit):
+        if self._password_toggle_icon is None:
+            self._password_toggle_icon = password_toggle_icon()
+        action = QAction(self._password_toggle_icon, "Show", line_edit)
+        action.setToolTip("Show or hide the key")
+        action.triggered.connect(lambda: self._toggle_password_visibility(line_edit))
+        line_edit.addAction(action, QLineEdit.TrailingPosition)
+
     def _toggle_password_visibility(self, line_edit: QLineEdit):
         if line_edit.echoMode() == QLineEdit.Password:
             line_edit.setEchoMode(QLineEdit.Normal)
@@ -651,38 +860,51 @@ class OptionsDialog(QDialog):
             line_edit.setEchoMode(QLineEdit.Password)
 
     def _browse_rom_path(self):
-        current_path = self.rom_path.text()
-        start_dir = current_path if current_path and Path(current_path).exists() else str(Path.home())
-        path = QFileDialog.getExistingDirectory(self, "Select ROM Directory", start_dir, QFileDialog.ShowDirsOnly)
+        path = self._browse_dir("rom", "Select ROM Directory", self.rom_path.text())
         if path:
             self.rom_path.setText(path)
 
+    def _update_drives_label(self):
+        """Show the available drives under the ROM folder row, hiding the label when there are none."""
+        drives = get_available_drives_cached()
+        drives_text = ", ".join([d[1] for d in drives[:6]])
+        if len(drives) > 6:
+            drives_text += f" (+{len(drives) - 6} more)"
+        self.drives_label.setText(f"<span style='color: #888; font-size: 10px;'>Drives: {drives_text}</span>")
+        self.drives_label.setVisible(bool(drives))
+
     def _auto_detect_rom_folder(self):
-        QMessageBox.information(self, "Searching", "Searching for ROM folders...")
-        found_path = find_iisu_directory()
+        self.rom_path.setPlaceholderText("Searching for ROM folders...")
+        self.btn_auto_detect.setEnabled(False)
+        self.btn_browse_rom.setEnabled(False)
+        self._rom_search_generation += 1
+        QThreadPool.globalInstance().start(RomFolderSearchRunnable(self, self._rom_search_generation))
+
+    def _on_rom_folder_found(self, generation: int, found_path: str):
+        if generation != self._rom_search_generation:
+            return  # Result of a search started before the dialog was reopened
+        self.rom_path.setPlaceholderText("Browse to select your ROM folder...")
+        self.btn_auto_detect.setEnabled(True)
+        self.btn_browse_rom.setEnabled(True)
         if found_path:
-            self.rom_path.setText(str(found_path))
+            self.rom_path.setText(found_path)
             QMessageBox.information(self, "Found", f"Found ROM directory at:\n{found_path}")
         else:
             QMessageBox.information(self, "Not Found", "No ROM directories found. Use Browse to select manually.")
 
     def _on_skip_scraping_changed(self, checked: bool):
-        if checked:
+        if checked and self.use_fallback.isChecked():
             self.use_fallback.setChecked(False)
-            self.use_fallback.setEnabled(False)
-        else:
-            self.use_fallback.setEnabled(True)
+        set_enabled_if_changed(self.use_fallback, not checked)
 
     def _browse_fallback_icons(self):
-        current_path = self.fallback_icons_path.text()
-        start_dir = current_path if current_path and Path(current_path).exists() else str(Path.home())
-        path = QFileDialog.getExistingDirectory(self, "Select Fallback Icons Directory", start_dir, QFileDialog.ShowDirsOnly)
+        path = self._browse_dir("fallback_icons", "Select Fallback Icons Directory", self.fallback_icons_path.text())
         if path:
             self.fallback_icons_path.setText(path)
 
     def _on_export_format_changed(self, format_text: str):
         is_jpeg = format_text.upper() in ("JPEG", "JPG")
-        self.jpeg_quality.setEnabled(is_jpeg)
+        set_enabled_if_changed(self.jpeg_quality, is_jpeg)
 
     def _open_device_asset_dialog(self):
         config_path = Path(self.config_path_value) if self.config_path_value else Path(".")
@@ -691,42 +913,56 @@ class OptionsDialog(QDialog):
         dialog.exec()
 
     def _on_custom_border_toggled(self, checked: bool):
-        self.custom_border_path.setEnabled(checked)
-        self.btn_browse_custom_border.setEnabled(checked)
+        set_enabled_if_changed(self.custom_border_path, checked)
+        set_enabled_if_changed(self.btn_browse_custom_border, checked)
 
     def _browse_custom_border(self):
-        current_path = self.custom_border_path.text()
-        start_dir = current_path if current_path and Path(current_path).exists() else str(Path.home())
-        path, _ = QFileDialog.getOpenFileName(self, "Select Custom Border Image", start_dir, "Images (*.png *.jpg *.jpeg *.bmp);;All Files (*)")
+        path = self._browse_file("border", "Select Custom Border Image", IMAGE_FILE_FILTER,
+                                 self.custom_border_path.text())
         if path:
             self.custom_border_path.setText(path)
             self._update_custom_border_preview()
 
     def _update_custom_border_preview(self):
-        path = self.custom_border_path.text()
-        if path and Path(path).exists():
-            pixmap = QPixmap(path)
-            if not pixmap.isNull():
-                self.custom_border_preview.setPixmap(pixmap)
-                return
-        self.custom_border_preview.clear()
+        self._set_border_preview(self.custom_border_preview, self.custom_border_path.text())
 
-    def _load_platforms_for_border_selector(self):
-        import yaml
-        self.border_platform_combo.clear()
-        config_path = Path(self.config_path_value) if self.config_path_value else None
-        if config_path and config_path.exists():
+    def _set_border_preview(self, label: QLabel, path: str):
+        if path:
             try:
-                with open(config_path, "r", encoding="utf-8") as f:
-                    cfg = yaml.safe_load(f) or {}
-                platforms = cfg.get("platforms", {})
-                for platform_key in sorted(platforms.keys()):
-                    self.border_platform_combo.addItem(platform_key, platform_key)
-            except Exception:
-                pass
-        for platform_key in sorted(self.custom_platforms.keys()):
-            if self.border_platform_combo.findData(platform_key) == -1:
-                self.border_platform_combo.addItem(f"{platform_key} (Custom)", platform_key)
+                st = os.stat(path)
+            except OSError:
+                st = None
+            if st is not None:
+                size = label.contentsRect().size()
+                pixmap = scaled_preview_pixmap(path, st.st_mtime_ns, size.width(), size.height())
+                if not pixmap.isNull():
+                    label.setPixmap(pixmap)
+                    return
+        label.clear()
+
+    def _load_platforms_for_border_selector(self):
+        if self._config_platform_keys is None:
+            self._config_platform_keys = []
+            QThreadPool.globalInstance().start(ConfigPlatformsRunnable(self, self.config_path_value))
+        combo = self.border_platform_combo
+        config_keys = set(self._config_platform_keys)
+        combo.setUpdatesEnabled(False)
+        combo.blockSignals(True)
+        try:
+            combo.clear()
+            for platform_key in self._config_platform_keys:
+                combo.addItem(platform_key, platform_key)
+            for platform_key in sorted(self.custom_platforms.keys()):
+                if platform_key not in config_keys:
+                    combo.addItem(f"{platform_key} (Custom)", platform_key)
+        finally:
+            combo.blockSignals(False)
+            combo.setUpdatesEnabled(True)
+        self._on_border_platform_changed(combo.currentIndex())
+
+    def _on_config_platforms_loaded(self, platform_keys: list):
+        self._config_platform_keys = platform_keys
+        self._load_platforms_for_border_selector()
 
     def _on_border_platform_changed(self, index: int):
         if index < 0:
@@ -740,9 +976,8 @@ class OptionsDialog(QDialog):
         self._update_per_platform_border_preview()
 
     def _browse_per_platform_border(self):
-        current_path = self.per_platform_border_path.text()
-        start_dir = current_path if current_path and Path(current_path).exists() else str(Path.home())
-        path, _ = QFileDialog.getOpenFileName(self, "Select Custom Border for Platform", start_dir, "Images (*.png *.jpg *.jpeg *.bmp);;All Files (*)")
+        path = self._browse_file("border", "Select Custom Border for Platform", IMAGE_FILE_FILTER,
+                                 self.per_platform_border_path.text())
         if path:
             self.per_platform_border_path.setText(path)
             platform_key = self.border_platform_combo.currentData()
@@ -762,29 +997,33 @@ class OptionsDialog(QDialog):
             self._update_per_platform_border_preview()
 
     def _update_per_platform_border_preview(self):
-        path = self.per_platform_border_path.text()
-        if path and Path(path).exists():
-            pixmap = QPixmap(path)
-            if not pixmap.isNull():
-                self.per_platform_border_preview.setPixmap(pixmap)
-                return
-        self.per_platform_border_preview.clear()
+        self._set_border_preview(self.per_platform_border_preview, self.per_platform_border_path.text())
 
     def _load_custom_platforms_list(self):
-        self.custom_platforms_list.clear()
-        for platform_key, config in self.custom_platforms.items():
-            display_name = config.get("display_name", platform_key)
-            publisher = config.get("publisher", "")
-            year = config.get("year", "")
-            item_text = f"{platform_key} - {display_name}"
-            if publisher:
-                item_text += f" ({publisher}"
-                if year:
-                    item_text += f", {year}"
-                item_text += ")"
-            item = QListWidgetItem(item_text)
-            item.setData(Qt.UserRole, platform_key)
-            self.custom_platforms_list.addItem(item)
+        platform_list = self.custom_platforms_list
+        platform_list.setUpdatesEnabled(False)
+        platform_list.blockSignals(True)
+        try:
+            platform_list.clear()
+            for platform_key, config in self.custom_platforms.items():
+                platform_list.addItem(self._custom_platform_item(platform_key, config))
+        finally:
+            platform_list.blockSignals(False)
+            platform_list.setUpdatesEnabled(True)
+
+    def _custom_platform_item(self, platform_key: str, config: dict) -> QListWidgetItem:
+        display_name = config.get("display_name", platform_key)
+        publisher = config.get("publisher", "")
+        year = config.get("year", "")
+        item_text = f"{platform_key} - {display_name}"
+        if publisher:
+            item_text += f" ({publisher}"
+            if year:
+                item_text += f", {year}"
+            item_text += ")"
+        item = QListWidgetItem(item_text)
+        item.setData(Qt.UserRole, platform_key)
+        return item
 
     def _on_custom_platform_selected(self, item):
         platform_key = item.data(Qt.UserRole)
@@ -793,7 +1032,7 @@ class OptionsDialog(QDialog):
             self.new_platform_key.setText(platform_key)
             self.new_platform_name.setText(config.get("display_name", ""))
             self.new_platform_publisher.setText(config.get("publisher", ""))
-            self.new_platform_year.setValue(config.get("year", 2000))
+            self.new_platform_year.setText(str(config.get("year", 2000)))
             type_idx = self.new_platform_type.findText(config.get("type", "console"))
             if type_idx >= 0:
                 self.new_platform_type.setCurrentIndex(type_idx)
@@ -801,12 +1040,12 @@ class OptionsDialog(QDialog):
             self.new_platform_icon.setText(config.get("icon_file", ""))
 
     def _browse_new_platform_border(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Select Border Image", str(Path.home()), "Images (*.png *.jpg *.jpeg *.bmp);;All Files (*)")
+        path = self._browse_file("border", "Select Border Image", IMAGE_FILE_FILTER)
         if path:
             self.new_platform_border.setText(path)
 
     def _browse_new_platform_icon(self):
-        path, _ = QFileDialog.getOpenFileName(self, "Select Platform Icon", str(Path.home()), "Images (*.png *.jpg *.jpeg *.bmp);;All Files (*)")
+        path = self._browse_file("platform_icon", "Select Platform Icon", IMAGE_FILE_FILTER)
         if path:
             self.new_platform_icon.setText(path)
 
@@ -819,22 +1058,31 @@ class OptionsDialog(QDialog):
         self.custom_platforms[platform_key] = {
             "display_name": display_name,
             "publisher": self.new_platform_publisher.text().strip(),
-            "year": self.new_platform_year.value(),
+            "year": self._int_value(self.new_platform_year, 2000),
             "type": self.new_platform_type.currentText(),
             "border_file": self.new_platform_border.text().strip(),
             "icon_file": self.new_platform_icon.text().strip(),
             "custom": True
         }
-        self._load_custom_platforms_list()
-        self._load_platforms_for_border_selector()
+        item = self._custom_platform_item(platform_key, self.custom_platforms[platform_key])
+        row = self._custom_platform_row(platform_key)
+        if row >= 0:
+            self.custom_platforms_list.item(row).setText(item.text())
+        else:
+            self.custom_platforms_list.addItem(item)
+        if OUTPUT_TAB in self._tab_built:
+            self._insert_border_platform(platform_key)
+        self._clear_new_platform_form()
+        QMessageBox.information(self, "Success", f"Platform '{platform_key}' added.")
+
+    def _clear_new_platform_form(self):
         self.new_platform_key.clear()
         self.new_platform_name.clear()
         self.new_platform_publisher.clear()
-        self.new_platform_year.setValue(2000)
+        self.new_platform_year.setText("2000")
         self.new_platform_type.setCurrentIndex(0)
         self.new_platform_border.clear()
         self.new_platform_icon.clear()
-        QMessageBox.information(self, "Success", f"Platform '{platform_key}' added.")
 
     def _remove_custom_platform(self):
         current_item = self.custom_platforms_list.currentItem()
@@ -846,29 +1094,57 @@ class OptionsDialog(QDialog):
             reply = QMessageBox.question(self, "Confirm", f"Remove platform '{platform_key}'?", QMessageBox.Yes | QMessageBox.No)
             if reply == QMessageBox.Yes:
                 del self.custom_platforms[platform_key]
-                self._load_custom_platforms_list()
-                self._load_platforms_for_border_selector()
+                self.custom_platforms_list.takeItem(self.custom_platforms_list.row(current_item))
+                if OUTPUT_TAB in self._tab_built and platform_key not in self._config_platform_keys:
+                    index = self.border_platform_combo.findData(platform_key)
+                    if index >= 0:
+                        self.border_platform_combo.removeItem(index)
+
+    def _custom_platform_row(self, platform_key: str) -> int:
+        for row in range(self.custom_platforms_list.count()):
+            if self.custom_platforms_list.item(row).data(Qt.UserRole) == platform_key:
+                return row
+        return -1
+
+    def _insert_border_platform(self, platform_key: str):
+        """Add one custom platform to the border combo at its sorted place after the config platforms."""
+        config_keys = set(self._config_platform_keys)
+        if platform_key in config_keys or self.border_platform_combo.findData(platform_key) != -1:
+            return
+        custom_keys = sorted(key for key in self.custom_platforms if key not in config_keys)
+        index = len(self._config_platform_keys) + custom_keys.index(platform_key)
+        self.border_platform_combo.insertItem(index, f"{platform_key} (Custom)", platform_key)
 
     def _apply_and_accept(self):
         """Save API keys and accept dialog."""
+        if not self._api_keys_loaded:
+            self._populate_api_keys()
         key_manager = get_manager()
-        key_manager.set_key("steamgriddb", self.sgdb_key.text().strip())
-        key_manager.set_key("igdb_client_id", self.igdb_client_id.text().strip())
-        key_manager.set_key("igdb_client_secret", self.igdb_client_secret.text().strip())
+        for service, line_edit in self.api_key_edits.items():
+            key_manager.set_key(service, line_edit.text().strip())
         self.accept()
 
     # --- Getter Methods ---
+    # Tabs that were never opened have no widgets; their getters return the stored settings.
 
     def get_config_path(self):
         return self.config_path.text()
 
     def get_workers(self):
-        return self.workers.value()
+        if PROCESSING_TAB not in self._tab_built:
+            return self.workers_value
+        return self._int_value(self.workers, self.workers_value)
 
     def get_limit(self):
+        if PROCESSING_TAB not in self._tab_built:
+            return self.limit_value
         return self.limit.value()
 
     def get_source_order(self):
+        if SOURCES_TAB not in self._tab_built:
+            if self.source_priority_widget_ref:
+                return self.source_priority_widget_ref.get_source_order()
+            self._ensure_tab_built(SOURCES_TAB)
         return self.source_priority.get_source_order()
 
     def get_rom_directory_settings(self):
@@ -881,13 +1157,25 @@ class OptionsDialog(QDialog):
         }
 
     def get_hero_settings(self):
+        if SOURCES_TAB not in self._tab_built:
+            return {
+                "enabled": self.hero_settings.get("enabled", True),
+                "count": self.hero_settings.get("count", 1),
+                "save_with_icons": self.hero_settings.get("save_with_icons", True)
+            }
         return {
             "enabled": self.hero_enabled.isChecked(),
-            "count": self.hero_count.value(),
+            "count": self._int_value(self.hero_count, 1),
             "save_with_icons": self.hero_save_with_icons.isChecked()
         }
 
     def get_fallback_settings(self):
+        if SOURCES_TAB not in self._tab_built:
+            return {
+                "use_platform_icon_fallback": self.fallback_settings.get("use_platform_icon_fallback", False),
+                "skip_scraping_use_platform_icon": self.fallback_settings.get("skip_scraping_use_platform_icon", False),
+                "fallback_icons_path": self.fallback_settings.get("fallback_icons_path", "")
+            }
         return {
             "use_platform_icon_fallback": self.use_fallback.isChecked(),
             "skip_scraping_use_platform_icon": self.skip_scraping.isChecked(),
@@ -895,31 +1183,57 @@ class OptionsDialog(QDialog):
         }
 
     def get_screenshot_settings(self):
+        if SOURCES_TAB not in self._tab_built:
+            return {
+                "enabled": self.screenshot_settings.get("enabled", False),
+                "count": self.screenshot_settings.get("count", 3)
+            }
         return {
             "enabled": self.screenshot_enabled.isChecked(),
-            "count": self.screenshot_count.value()
+            "count": self._int_value(self.screenshot_count, 3)
         }
 
     def get_device_settings(self):
+        if OUTPUT_TAB not in self._tab_built:
+            return {
+                "enabled": self.device_settings.get("enabled", False),
+                "path": self.device_settings.get("path", "/sdcard/Android/media/com.iisulauncher/iiSULauncher/assets/media/roms/consoles")
+            }
         return {
             "enabled": self.copy_to_device.isChecked(),
             "path": self.device_path.text().strip()
         }
 
     def get_logo_settings(self):
+        if SOURCES_TAB not in self._tab_built:
+            return {
+                "scrape_logos": self.logo_settings.get("scrape_logos", True),
+                "fallback_to_boxart": self.logo_settings.get("fallback_to_boxart", True)
+            }
         return {
             "scrape_logos": self.scrape_logos.isChecked(),
             "fallback_to_boxart": self.logo_fallback_boxart.isChecked()
         }
 
     def get_export_settings(self):
+        if OUTPUT_TAB not in self._tab_built:
+            return {
+                "format": self.export_settings.get("format", "JPEG"),
+                "jpeg_quality": self.export_settings.get("jpeg_quality", 95)
+            }
         return {
             "format": self.export_format.currentText(),
-            "jpeg_quality": self.jpeg_quality.value()
+            "jpeg_quality": self._int_value(self.jpeg_quality, 95)
         }
 
     def get_custom_border_settings(self):
         per_platform = dict(self.custom_border_settings.get("per_platform", {}))
+        if OUTPUT_TAB not in self._tab_built:
+            return {
+                "enabled": self.custom_border_settings.get("enabled", False),
+                "path": self.custom_border_settings.get("path", ""),
+                "per_platform": per_platform
+            }
         return {
             "enabled": self.use_custom_border.isChecked(),
             "path": self.custom_border_path.text().strip(),
@@ -930,46 +1244,61 @@ class OptionsDialog(QDialog):
         return dict(self.custom_platforms)
 
     # --- Setter Methods ---
+    # Setters store the settings and only push them into widgets of tabs already built.
+
+    def set_hero_settings(self, settings: dict):
+        self.hero_settings = settings
+        if SOURCES_TAB in self._tab_built:
+            self.hero_enabled.setChecked(settings.get("enabled", True))
+            self.hero_count.setText(str(settings.get("count", 1)))
+            self.hero_save_with_icons.setChecked(settings.get("save_with_icons", True))
 
     def set_fallback_settings(self, settings: dict):
         self.fallback_settings = settings
-        self.use_fallback.setChecked(settings.get("use_platform_icon_fallback", False))
-        self.skip_scraping.setChecked(settings.get("skip_scraping_use_platform_icon", False))
-        self.fallback_icons_path.setText(settings.get("fallback_icons_path", ""))
+        if SOURCES_TAB in self._tab_built:
+            self.use_fallback.setChecked(settings.get("use_platform_icon_fallback", False))
+            self.skip_scraping.setChecked(settings.get("skip_scraping_use_platform_icon", False))
+            self.fallback_icons_path.setText(settings.get("fallback_icons_path", ""))
 
     def set_screenshot_settings(self, settings: dict):
         self.screenshot_settings = settings
-        self.screenshot_enabled.setChecked(settings.get("enabled", False))
-        self.screenshot_count.setValue(settings.get("count", 3))
+        if SOURCES_TAB in self._tab_built:
+            self.screenshot_enabled.setChecked(settings.get("enabled", False))
+            self.screenshot_count.setText(str(settings.get("count", 3)))
 
     def set_device_settings(self, settings: dict):
         self.device_settings = settings
-        self.copy_to_device.setChecked(settings.get("enabled", False))
-        self.device_path.setText(settings.get("path", "/sdcard/Android/media/com.iisulauncher/iiSULauncher/assets/media/roms/consoles"))
+        if OUTPUT_TAB in self._tab_built:
+            self.copy_to_device.setChecked(settings.get("enabled", False))
+            self.device_path.setText(settings.get("path", "/sdcard/Android/media/com.iisulauncher/iiSULauncher/assets/media/roms/consoles"))
 
     def set_logo_settings(self, settings: dict):
         self.logo_settings = settings
-        self.scrape_logos.setChecked(settings.get("scrape_logos", True))
-        self.logo_fallback_boxart.setChecked(settings.get("fallback_to_boxart", True))
+        if SOURCES_TAB in self._tab_built:
+            self.scrape_logos.setChecked(settings.get("scrape_logos", True))
+            self.logo_fallback_boxart.setChecked(settings.get("fallback_to_boxart", True))
 
     def set_export_settings(self, settings: dict):
         self.export_settings = settings
-        self.export_format.setCurrentText(settings.get("format", "JPEG"))
-        self.jpeg_quality.setValue(settings.get("jpeg_quality", 95))
-        self._on_export_format_changed(self.export_format.currentText())
+        if OUTPUT_TAB in self._tab_built:
+            self.export_format.setCurrentText(settings.get("format", "JPEG"))
+            self.jpeg_quality.setText(str(settings.get("jpeg_quality", 95)))
+            self._on_export_format_changed(self.export_format.currentText())
 
     def set_custom_border_settings(self, settings: dict):
         self.custom_border_settings = settings
+        if OUTPUT_TAB not in self._tab_built:
+            return
         self.use_custom_border.setChecked(settings.get("enabled", False))
         self.custom_border_path.setText(settings.get("path", ""))
         self._update_custom_border_preview()
         self._on_custom_border_toggled(self.use_custom_border.isChecked())
-        if hasattr(self, 'border_platform_combo') and self.border_platform_combo.count() > 0:
+        if self.border_platform_combo.count() > 0:
             self._on_border_platform_changed(self.border_platform_combo.currentIndex())
 
     def set_custom_platforms(self, platforms: dict):
         self.custom_platforms = dict(platforms) if platforms else {}
-        if hasattr(self, 'custom_platforms_list'):
+        if PLATFORMS_TAB in self._tab_built:
             self._load_custom_platforms_list()
-        if hasattr(self, 'border_platform_combo'):
+        if OUTPUT_TAB in self._tab_built:
             self._load_platforms_for_border_selector()
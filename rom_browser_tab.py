@@ -4,23 +4,27 @@ Browse ROMs from iiSU directory or manual folder selection and generate icons.
 """
 import sys
 import threading
+from collections import deque
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
-import yaml
-from PySide6.QtCore import Qt, Signal, QObject, QSize, Slot
-from PySide6.QtGui import QIcon, QPixmap
+from PySide6.QtCore import (
+    Qt, Signal, QObject, QSize, QTimer, QItemSelection, QItemSelectionModel,
+    QRunnable, QThreadPool
+)
+from PySide6.QtGui import QIcon, QImage, QImageReader, QPixmap
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
     QLabel, QPushButton, QListWidget, QListWidgetItem,
     QLineEdit, QProgressBar, QComboBox, QCheckBox,
     QFileDialog, QMessageBox, QTreeWidget, QTreeWidgetItem,
-    QFrame, QGroupBox, QScrollArea, QGridLayout, QSpinBox
+    QFrame, QGroupBox, QScrollArea, QSpinBox
 )
 
 from rom_parser import (
     ROMScanner, scan_generic_folder, get_available_drives,
     find_iisu_directory, detect_platform_from_folder, IISU_PLATFORM_FOLDERS,
+    FOLDER_TO_PLATFORM,
     scan_mtp_device, is_mtp_path,
     check_adb_available, get_adb_path, get_adb_devices, scan_adb_device,
     detect_region, REGION_DISPLAY_NAMES
@@ -47,15 +51,151 @@ class BackendCallbacks(QObject):
     current_item = Signal(str, str)  # title, platform
 
 
+class ScanCallbacks(QObject):
+    """Qt signals for a background ROM directory scan."""
+    status = Signal(str)
+    finished = Signal(object, str)  # results dict, error message ("" on success)
+
+
+class PreviewImageLoader(QRunnable):
+    """Decode and downscale a preview image on the thread pool."""
+
+    def __init__(self, grid: "PreviewGrid", index: int, path: str, size: int):
+        super().__init__()
+        self._grid = grid
+        self._index = index
+        self._path = path
+        self._size = size
+
+    def run(self):
+        image = QImage(self._path)
+        if not image.isNull():
+            image = image.scaled(self._size, self._size, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+        try:
+            self._grid.image_loaded.emit(self._index, self._path, image)
+        except RuntimeError:
+            pass  # Grid was deleted (e.g. popout closed) while loading
+
+
+class PreviewGrid(QWidget):
+    """
+    Grid of generated icon previews shown inside a QScrollArea.
+
+    Previews are laid out by index, and QLabels only exist for the rows in or
+    near the visible part of the scroll area, so a long batch doesn't keep a
+    widget and decoded pixmap alive for every icon it produced.
+    """
+
+    MARGIN_ROWS = 2  # Rows kept materialized above/below the viewport
+
+    image_loaded = Signal(int, str, QImage)  # index, path, scaled image
+
+    def __init__(self, scroll_area: QScrollArea, icon_size: int, columns: int,
+                 spacing: int, radius: int):
+        super().__init__()
+        self._scroll_area = scroll_area
+        self._icon_size = icon_size
+        self._columns = columns
+        self._spacing = spacing
+        self._label_style = f"border: 1px solid #3a3d42; border-radius: {radius}px;"
+        self.paths: List[str] = []
+        self._labels: Dict[int, QLabel] = {}
+
+        self.image_loaded.connect(self._on_image_loaded)
+
+        scroll_area.setWidget(self)
+        scroll_bar = scroll_area.verticalScrollBar()
+        scroll_bar.valueChanged.connect(self._update_visible)
+        scroll_bar.rangeChanged.connect(self._update_visible)
+
+    def add_path(self, path: str):
+        """Append a preview for the image at path."""
+        self.paths.append(path)
+        self._update_height()
+        self._update_visible()
+
+    def set_paths(self, paths: List[str]):
+        """Replace all previews."""
+        self.clear()
+        self.paths.extend(paths)
+        self._update_height()
+        self._update_visible()
+
+    def clear(self):
+        """Remove all previews."""
+        for label in self._labels.values():
+            label.deleteLater()
+        self._labels.clear()
+        self.paths.clear()
+        self._update_height()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self._update_visible()
+
+    def _update_height(self):
+        rows = -(-len(self.paths) // self._columns)
+        self.setMinimumHeight(rows * (self._icon_size + self._spacing) + self._spacing)
+
+    def _update_visible(self, *args):
+        """Create labels for rows near the viewport and drop the rest."""
+        cell = self._icon_size + self._spacing
+        top = self._scroll_area.verticalScrollBar().value()
+        bottom = top + self._scroll_area.viewport().height()
+        first_row = max(0, top // cell - self.MARGIN_ROWS)
+        last_row = bottom // cell + self.MARGIN_ROWS
+        first = first_row * self._columns
+        end = min(len(self.paths), (last_row + 1) * self._columns)
+
+        for index in [i for i in self._labels if not first <= i < end]:
+            self._labels.pop(index).deleteLater()
+
+        for index in range(first, end):
+            if index not in self._labels:
+                self._labels[index] = self._create_label(index)
+
+    def _create_label(self, index: int) -> QLabel:
+        path = self.paths[index]
+        label = QLabel(self)
+        label.setFixedSize(self._icon_size, self._icon_size)
+        label.setScaledContents(True)
+        label.setStyleSheet(self._label_style)
+        label.setToolTip(Path(path).stem)
+        # Decode off the GUI thread; the pixmap is set when it arrives
+        QThreadPool.globalInstance().start(
+            PreviewImageLoader(self, index, path, self._icon_size)
+        )
+
+        row, col = divmod(index, self._columns)
+        cell = self._icon_size + self._spacing
+        label.move(self._spacing + col * cell, self._spacing + row * cell)
+        label.show()
+        return label
+
+    def _on_image_loaded(self, index: int, path: str, image: QImage):
+        label = self._labels.get(index)
+        # The label may have scrolled away or the grid been cleared meanwhile
+        if label is None or self.paths[index] != path or image.isNull():
+            return
+        label.setPixmap(QPixmap.fromImage(image))
+
+
 class ROMBrowserTab(QWidget):
     """ROM Browser tab for scanning and processing ROMs from directories."""
 
+    # Emitted from the worker thread to show the artwork picker on the GUI thread
+    selection_requested = Signal(str, str, object, object)  # title, platform, options, result queue
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
         self._cancel_token = None
         self._worker_thread = None
         self._scanner = ROMScanner()
+        self._scan_thread = None
+        self._scan_callbacks = None
+        # (list item, lowercase title) for the games currently listed
+        self._game_items: List[Tuple[QListWidgetItem, str]] = []
 
         # Settings
         self.config_path = str(get_config_path())
@@ -67,6 +207,8 @@ class ROMBrowserTab(QWidget):
         self.device_settings = {"enabled": False, "path": "/sdcard/Android/media/com.iisulauncher/iiSULauncher/assets/media/roms/consoles"}  # Device copy settings
         self.logo_settings = {"scrape_logos": True, "fallback_to_boxart": True}  # Logo/title settings
 
+        self.selection_requested.connect(self._show_selection_dialog)
+
         self._setup_ui()
         self._load_settings()
 
@@ -162,7 +304,12 @@ class ROMBrowserTab(QWidget):
 
         self.search_input = QLineEdit()
         self.search_input.setPlaceholderText("Search games...")
-        self.search_input.textChanged.connect(self._filter_games)
+        # Debounce so typing a word filters once rather than per keystroke
+        self._filter_timer = QTimer(self)
+        self._filter_timer.setSingleShot(True)
+        self._filter_timer.setInterval(150)
+        self._filter_timer.timeout.connect(lambda: self._filter_games(self.search_input.text()))
+        self.search_input.textChanged.connect(lambda _text: self._filter_timer.start())
         search_row.addWidget(self.search_input, 1)
 
         self.btn_select_all = QPushButton("All")
@@ -294,10 +441,8 @@ class ROMBrowserTab(QWidget):
         self.preview_scroll_area.setMinimumHeight(120)
         self.preview_scroll_area.setMaximumHeight(180)
 
-        self.preview_widget = QWidget()
-        self.preview_grid = QGridLayout(self.preview_widget)
-        self.preview_grid.setSpacing(6)
-        self.preview_scroll_area.setWidget(self.preview_widget)
+        self.preview_grid = PreviewGrid(self.preview_scroll_area, icon_size=128,
+                                        columns=6, spacing=6, radius=6)
 
         preview_layout.addWidget(self.preview_scroll_area)
         layout.addWidget(self.preview_group)
@@ -305,9 +450,10 @@ class ROMBrowserTab(QWidget):
         # Track preview visibility and popout window
         self._preview_visible = True
         self._preview_popout_window = None
+        self._popout_preview_grid = None
 
-        self.preview_items = []
-        self._log_messages = []
+        # Last 1000 log lines; deque drops the oldest without copying the list
+        self._log_messages = deque(maxlen=1000)
 
     def _load_settings(self):
         """Load settings from config file."""
@@ -316,8 +462,7 @@ class ROMBrowserTab(QWidget):
             return
 
         try:
-            with open(cfg_path, "r", encoding="utf-8") as f:
-                cfg = yaml.safe_load(f) or {}
+            cfg = run_backend.load_yaml(cfg_path)
 
             rom_cfg = cfg.get("rom_directory", {})
             self.rom_path = rom_cfg.get("rom_path", "")
@@ -326,6 +471,10 @@ class ROMBrowserTab(QWidget):
             self.hero_enabled = hero_cfg.get("enabled", True)
             self.hero_count = hero_cfg.get("count", 1)
 
+            # Persist scan results alongside the backend's other caches
+            paths_cfg = cfg.get("paths", {}) or {}
+            self._scanner.index_dir = cfg_path.resolve().parent / paths_cfg.get("cache_dir", "./cache")
+
             # Update UI
             if self.rom_path:
                 self.path_input.setText(self.rom_path)
@@ -675,138 +824,168 @@ if ($device) {{
             )
             return
 
+        if self._scan_thread and self._scan_thread.is_alive():
+            return
+
+        if not is_mtp_path(path_str) and not Path(path_str).exists():
+            QMessageBox.warning(
+                self,
+                "Folder Not Found",
+                f"The selected folder does not exist or is not accessible:\n\n{path_str}\n\n"
+                "If using external storage, make sure the device is connected."
+            )
+            self.status_label.setText("Ready")
+            return
+
         self.status_label.setText("Scanning...")
         self.btn_refresh.setEnabled(False)
 
         # Clear previous data
         self.platform_tree.clear()
-        self.games_list.clear()
+        self._clear_games_list()
 
-        results = {}
+        # Directory and device scans can take a long time on USB/MTP/network
+        # storage, so run them off the GUI thread and post the results back
+        callbacks = ScanCallbacks()
+        callbacks.status.connect(self.status_label.setText)
+        callbacks.finished.connect(self._on_scan_finished)
+        self._scan_callbacks = callbacks
 
-        # Check if this is an MTP device path (Android/portable device)
-        if is_mtp_path(path_str):
-            # Parse MTP path - could be "This PC\Device Name\subfolder" or similar
-            # Try to extract device name and subfolder
-            cleaned_path = path_str.replace("This PC\\", "").replace("This PC/", "")
+        self._scan_thread = threading.Thread(
+            target=self._run_scan, args=(path_str, callbacks), daemon=True
+        )
+        self._scan_thread.start()
 
-            # Split by either forward or back slash
-            if "\\" in cleaned_path:
-                parts = cleaned_path.split("\\")
+    def _run_scan(self, path_str: str, callbacks: "ScanCallbacks"):
+        """Scan path_str for ROMs (worker thread) and emit the results."""
+        results = {}
+        error = ""
+
+        try:
+            # Check if this is an MTP device path (Android/portable device)
+            if is_mtp_path(path_str):
+                results, error = self._scan_portable_device(path_str, callbacks)
             else:
-                parts = cleaned_path.split("/")
-
-            if parts:
-                device_name = parts[0]
-                subfolder = "/".join(parts[1:]) if len(parts) > 1 else ""
-
-                # TRY ADB FIRST - it's up to 28x faster than MTP
-                adb_available = check_adb_available()
-                adb_devices = get_adb_devices() if adb_available else []
-
-                if adb_devices:
-                    # ADB is available and device(s) connected - use ADB!
-                    self.status_label.setText(f"Scanning via ADB (fast mode): {device_name}...")
-
-                    # Force UI update
-                    from PySide6.QtWidgets import QApplication
-                    QApplication.processEvents()
-
-                    # Convert MTP path to Android path
-                    # Common mapping: "Internal shared storage/Download/roms" -> "/sdcard/Download/roms"
-                    adb_path = subfolder.replace("Internal shared storage", "/sdcard").replace("Internal Storage", "/sdcard")
-                    if not adb_path.startswith("/"):
-                        adb_path = f"/sdcard/{adb_path}" if adb_path else "/sdcard/roms"
-
-                    # Use first device if only one, or let scan_adb_device auto-detect
-                    device_id = adb_devices[0][0] if len(adb_devices) == 1 else ""
-
-                    print(f"ADB scan: Using device {device_id or '(auto)'}, path: {adb_path}")
-                    results = scan_adb_device(device_id, adb_path)
-
-                    if results:
-                        # ADB scan successful!
-                        print(f"ADB scan successful: {len(results)} platforms found")
-                    else:
-                        # ADB scan failed - try MTP as fallback
-                        print("ADB scan returned no results, falling back to MTP...")
-                        self.status_label.setText(f"Scanning MTP device (fallback): {device_name}...")
-                        QApplication.processEvents()
-                        results = scan_mtp_device(device_name, subfolder)
+                # Standard filesystem path
+                path = Path(path_str)
+
+                # Try to detect platform from folder name, or scan as multi-platform structure
+                platform = detect_platform_from_folder(path.name)
+                if platform:
+                    # Single platform folder
+                    games = scan_generic_folder(path, platform)
+                    results = {platform: games}
                 else:
-                    # ADB not available - use MTP (slower)
-                    if adb_available:
-                        self.status_label.setText(f"Scanning MTP device: {device_name}... (ADB available but no device connected)")
-                    else:
-                        self.status_label.setText(f"Scanning MTP device: {device_name}... (install ADB for faster scans)")
-
-                    # Force UI update before long operation
-                    from PySide6.QtWidgets import QApplication
-                    QApplication.processEvents()
-
-                    results = scan_mtp_device(device_name, subfolder)
-
-                if not results:
-                    # Build helpful error message
-                    adb_tip = ""
-                    if not adb_available:
-                        adb_tip = (
-                            "\n\nTIP: Install ADB for much faster scanning:\n"
-                            "1. Download Android SDK Platform Tools\n"
-                            "2. Extract to C:\\adb\\ or add to PATH\n"
-                            "3. Enable USB Debugging on your device"
-                        )
-                    elif not adb_devices:
-                        adb_tip = (
-                            "\n\nTIP: ADB is installed but no device detected:\n"
-                            "1. Enable USB Debugging on your device\n"
-                            "2. Connect via USB (not just MTP)\n"
-                            "3. Authorize the USB debugging prompt"
-                        )
+                    # Multi-platform structure (like iiSU)
+                    self._scanner.set_iisu_path(path)
+                    results = self._scanner.scan(force_refresh=True)
+        except Exception as e:
+            print(f"ROM scan failed: {e}")
+            results = {}
+            error = f"Could not scan the selected folder.\n\n{path_str}\n\n{e}"
 
-                    QMessageBox.warning(
-                        self,
-                        "Scan Failed",
-                        f"Could not scan the portable device.\n\n"
-                        f"Device: {device_name}\n"
-                        f"Path: {subfolder}\n\n"
-                        "Possible causes:\n"
-                        "- Device is not connected or is locked\n"
-                        "- Path doesn't contain recognized platform folders\n"
-                        "- Scan timed out (device has too many files)\n\n"
-                        "Try 'Add Games Manually' button to enter titles directly."
-                        f"{adb_tip}"
-                    )
-                    self.btn_refresh.setEnabled(True)
-                    self.status_label.setText("Scan failed")
-                    return
+        callbacks.finished.emit(results, error)
+
+    def _scan_portable_device(self, path_str: str, callbacks: "ScanCallbacks") -> Tuple[Dict, str]:
+        """Scan an MTP device path, preferring ADB. Returns (results, error message)."""
+        # Parse MTP path - could be "This PC\Device Name\subfolder" or similar
+        # Try to extract device name and subfolder
+        cleaned_path = path_str.replace("This PC\\", "").replace("This PC/", "")
+
+        # Split by either forward or back slash
+        if "\\" in cleaned_path:
+            parts = cleaned_path.split("\\")
         else:
-            # Standard filesystem path
-            path = Path(path_str)
-            if not path.exists():
-                QMessageBox.warning(
-                    self,
-                    "Folder Not Found",
-                    f"The selected folder does not exist or is not accessible:\n\n{path_str}\n\n"
-                    "If using external storage, make sure the device is connected."
-                )
-                self.btn_refresh.setEnabled(True)
-                self.status_label.setText("Ready")
-                return
+            parts = cleaned_path.split("/")
+
+        if not parts:
+            return {}, ""
+
+        device_name = parts[0]
+        subfolder = "/".join(parts[1:]) if len(parts) > 1 else ""
+
+        # TRY ADB FIRST - it's up to 28x faster than MTP
+        adb_available = check_adb_available()
+        adb_devices = get_adb_devices() if adb_available else []
+
+        if adb_devices:
+            # ADB is available and device(s) connected - use ADB!
+            callbacks.status.emit(f"Scanning via ADB (fast mode): {device_name}...")
 
-            # Try to detect platform from folder name, or scan as multi-platform structure
-            platform = detect_platform_from_folder(path.name)
-            if platform:
-                # Single platform folder
-                games = scan_generic_folder(path, platform)
-                results = {platform: games}
+            # Convert MTP path to Android path
+            # Common mapping: "Internal shared storage/Download/roms" -> "/sdcard/Download/roms"
+            adb_path = subfolder.replace("Internal shared storage", "/sdcard").replace("Internal Storage", "/sdcard")
+            if not adb_path.startswith("/"):
+                adb_path = f"/sdcard/{adb_path}" if adb_path else "/sdcard/roms"
+
+            # Use first device if only one, or let scan_adb_device auto-detect
+            device_id = adb_devices[0][0] if len(adb_devices) == 1 else ""
+
+            print(f"ADB scan: Using device {device_id or '(auto)'}, path: {adb_path}")
+            results = scan_adb_device(device_id, adb_path)
+
+            if results:
+                # ADB scan successful!
+                print(f"ADB scan successful: {len(results)} platforms found")
             else:
-                # Multi-platform structure (like iiSU)
-                self._scanner.set_iisu_path(path)
-                results = self._scanner.scan(force_refresh=True)
+                # ADB scan failed - try MTP as fallback
+                print("ADB scan returned no results, falling back to MTP...")
+                callbacks.status.emit(f"Scanning MTP device (fallback): {device_name}...")
+                results = scan_mtp_device(device_name, subfolder)
+        else:
+            # ADB not available - use MTP (slower)
+            if adb_available:
+                callbacks.status.emit(f"Scanning MTP device: {device_name}... (ADB available but no device connected)")
+            else:
+                callbacks.status.emit(f"Scanning MTP device: {device_name}... (install ADB for faster scans)")
+
+            results = scan_mtp_device(device_name, subfolder)
+
+        if results:
+            return results, ""
+
+        # Build helpful error message
+        adb_tip = ""
+        if not adb_available:
+            adb_tip = (
+                "\n\nTIP: Install ADB for much faster scanning:\n"
+                "1. Download Android SDK Platform Tools\n"
+                "2. Extract to C:\\adb\\ or add to PATH\n"
+                "3. Enable USB Debugging on your device"
+            )
+        elif not adb_devices:
+            adb_tip = (
+                "\n\nTIP: ADB is installed but no device detected:\n"
+                "1. Enable USB Debugging on your device\n"
+                "2. Connect via USB (not just MTP)\n"
+                "3. Authorize the USB debugging prompt"
+            )
+
+        return {}, (
+            f"Could not scan the portable device.\n\n"
+            f"Device: {device_name}\n"
+            f"Path: {subfolder}\n\n"
+            "Possible causes:\n"
+            "- Device is not connected or is locked\n"
+            "- Path doesn't contain recognized platform folders\n"
+            "- Scan timed out (device has too many files)\n\n"
+            "Try 'Add Games Manually' button to enter titles directly."
+            f"{adb_tip}"
+        )
+
+    def _on_scan_finished(self, results: dict, error: str):
+        """Populate the platform tree once a background scan completes."""
+        self._scan_callbacks = None
+        self.btn_refresh.setEnabled(True)
+
+        if error:
+            QMessageBox.warning(self, "Scan Failed", error)
+            self.status_label.setText("Scan failed")
+            return
 
         # Populate platform tree
         total_games = 0
+        tree_items = []
         for platform_key in sorted(results.keys()):
             games = results[platform_key]
             if not games:
@@ -825,11 +1004,13 @@ if ($device) {{
             if icon_path.exists():
                 item.setIcon(0, QIcon(str(icon_path)))
 
-            self.platform_tree.addTopLevelItem(item)
+            tree_items.append(item)
+
+        # Insert in one call so the tree lays out once
+        self.platform_tree.addTopLevelItems(tree_items)
 
         self.platform_stats.setText(f"{len(results)} platforms, {total_games} games total")
         self.status_label.setText(f"Scanned {total_games} games across {len(results)} platforms")
-        self.btn_refresh.setEnabled(True)
 
         # Auto-select first platform if available
         if self.platform_tree.topLevelItemCount() > 0:
@@ -848,7 +1029,7 @@ if ($device) {{
         if not games:
             return
 
-        self.games_list.clear()
+        self._clear_games_list()
 
         # Get selected region filter
         region_filter = self.region_combo.currentData()
@@ -856,34 +1037,37 @@ if ($device) {{
         region_counts = {}
         filtered_count = 0
 
-        for title, path in games:
-            # Detect region from filename
-            filename = Path(path).name if path else title
-            detected_region = detect_region(filename, Path(path) if path else None, platform_key)
-            region_counts[detected_region] = region_counts.get(detected_region, 0) + 1
-
-            # Apply region filter
-            if region_filter != "any":
-                if detected_region != region_filter and detected_region != "World":
-                    # Skip games not matching filter (World matches any region)
-                    continue
-
-            filtered_count += 1
+        # Suspend repaints while the list is rebuilt
+        self.games_list.setUpdatesEnabled(False)
+        try:
+            for title, path, detected_region in self._get_platform_games(item):
+                region_counts[detected_region] = region_counts.get(detected_region, 0) + 1
 
-            # Display title with region
-            display_text = f"{title}"
-            if detected_region and detected_region != "Unknown":
-                display_text = f"{title} [{detected_region}]"
+                # Apply region filter
+                if region_filter != "any":
+                    if detected_region != region_filter and detected_region != "World":
+                        # Skip games not matching filter (World matches any region)
+                        continue
 
-            list_item = QListWidgetItem(display_text)
-            list_item.setData(Qt.UserRole, {
-                "title": title,
-                "path": str(path),
-                "platform": platform_key,
-                "region": detected_region
-            })
-            list_item.setSelected(True)
-            self.games_list.addItem(list_item)
+                filtered_count += 1
+
+                # Display title with region
+                display_text = f"{title}"
+                if detected_region and detected_region != "Unknown":
+                    display_text = f"{title} [{detected_region}]"
+
+                list_item = QListWidgetItem(display_text)
+                list_item.setData(Qt.UserRole, {
+                    "title": title,
+                    "path": path,
+                    "platform": platform_key,
+                    "region": detected_region
+                })
+                list_item.setSelected(True)
+                self.games_list.addItem(list_item)
+                self._game_items.append((list_item, title.lower()))
+        finally:
+            self.games_list.setUpdatesEnabled(True)
 
         # Build region stats
         region_stats = ", ".join(f"{k}: {v}" for k, v in sorted(region_counts.items()) if k != "Unknown")
@@ -892,6 +1076,34 @@ if ($device) {{
         else:
             self.games_info.setText(f"{len(games)} games in {platform_key}" + (f" ({region_stats})" if region_stats else ""))
 
+    def _get_platform_games(self, item) -> List[Tuple[str, str, str]]:
+        """
+        Return (title, path, region) for a platform tree item's games.
+
+        Region detection may read ROM headers, so the result is stored on the
+        tree item and reused when the platform or region filter is reselected.
+        """
+        entries = item.data(0, Qt.UserRole + 2)
+        if entries is not None:
+            return entries
+
+        platform_key = item.data(0, Qt.UserRole)
+        games = item.data(0, Qt.UserRole + 1)
+        entries = []
+        for title, path in games:
+            # Detect region from filename (and ROM header where supported)
+            filename = Path(path).name if path else title
+            detected_region = detect_region(filename, Path(path) if path else None, platform_key)
+            entries.append((title, str(path), detected_region))
+
+        item.setData(0, Qt.UserRole + 2, entries)
+        return entries
+
+    def _clear_games_list(self):
+        """Remove all games from the list."""
+        self.games_list.clear()
+        self._game_items.clear()
+
     def _on_region_changed(self, index):
         """Handle region filter change - refresh the current platform's games list."""
         current_item = self.platform_tree.currentItem()
@@ -902,33 +1114,41 @@ if ($device) {{
         """Filter games list by search text."""
         search_lower = text.lower()
 
-        for i in range(self.games_list.count()):
-            item = self.games_list.item(i)
-            data = item.data(Qt.UserRole)
-            title = data.get("title", "").lower()
-            item.setHidden(search_lower not in title)
+        for item, title_lower in self._game_items:
+            hidden = search_lower not in title_lower
+            # Only touch items whose visibility actually changes
+            if item.isHidden() != hidden:
+                item.setHidden(hidden)
 
     def _select_all_games(self):
         """Select all visible games."""
-        for i in range(self.games_list.count()):
-            item = self.games_list.item(i)
-            if not item.isHidden():
-                item.setSelected(True)
+        # Select runs of visible rows in one selection-model update rather
+        # than emitting a selection change per item
+        model = self.games_list.model()
+        selection = QItemSelection()
+        run_start = None
+        for row, (item, _) in enumerate(self._game_items):
+            if item.isHidden():
+                if run_start is not None:
+                    selection.select(model.index(run_start, 0), model.index(row - 1, 0))
+                    run_start = None
+            elif run_start is None:
+                run_start = row
+        if run_start is not None:
+            selection.select(model.index(run_start, 0), model.index(len(self._game_items) - 1, 0))
+
+        self.games_list.selectionModel().select(selection, QItemSelectionModel.Select)
 
     def _select_no_games(self):
         """Deselect all games."""
-        for i in range(self.games_list.count()):
-            self.games_list.item(i).setSelected(False)
+        self.games_list.clearSelection()
 
     def _get_selected_games(self) -> List[Dict]:
         """Get list of selected games with their data."""
-        selected = []
-        for i in range(self.games_list.count()):
-            item = self.games_list.item(i)
-            if item.isSelected():
-                data = item.data(Qt.UserRole)
-                selected.append(data)
-        return selected
+        # Ask the selection model for the selected rows instead of polling
+        # isSelected() on every item; sort to keep list order
+        rows = sorted(index.row() for index in self.games_list.selectionModel().selectedIndexes())
+        return [self.games_list.item(row).data(Qt.UserRole) for row in rows]
 
     def _start_processing(self):
         """Start processing selected games."""
@@ -1047,9 +1267,6 @@ if ($device) {{
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
         log_entry = f"[{timestamp}] {msg}"
         self._log_messages.append(log_entry)
-        # Keep last 1000 messages
-        if len(self._log_messages) > 1000:
-            self._log_messages = self._log_messages[-1000:]
         # Print to console as well
         print(log_entry)
 
@@ -1060,41 +1277,30 @@ if ($device) {{
         Called from worker thread, so must use thread-safe Qt mechanisms.
         Returns selected index, None if skipped, -1 if cancelled all.
         """
-        from artwork_picker_dialog import ArtworkPickerDialog
         from queue import Queue
-        from PySide6.QtCore import QMetaObject, Qt
 
         self._on_log(f"[INTERACTIVE] Request for {title} with {len(artwork_options)} options")
 
-        # Store data in instance variables so main thread can access them
-        self._dialog_title = title
-        self._dialog_platform = platform
-        self._dialog_options = artwork_options
-        self._dialog_result = Queue()
-
-        # Use QMetaObject.invokeMethod to run on main thread
-        QMetaObject.invokeMethod(
-            self,
-            "_show_selection_dialog_on_main_thread",
-            Qt.ConnectionType.BlockingQueuedConnection
-        )
+        # The request carries its own arguments and result queue, so nothing is
+        # shared through instance attributes; the signal is queued to the GUI thread
+        result_queue = Queue()
+        self.selection_requested.emit(title, platform, artwork_options, result_queue)
 
-        # Get result from queue
-        result = self._dialog_result.get()
+        # Block this worker until the dialog answers
+        result = result_queue.get()
         self._on_log(f"[INTERACTIVE] Got result: {result}")
         return result
 
-    @Slot()
-    def _show_selection_dialog_on_main_thread(self):
-        """Show dialog on main thread - called via invokeMethod."""
+    def _show_selection_dialog(self, title: str, platform: str, artwork_options, result_queue):
+        """Show the artwork picker on the main thread and post the choice to result_queue."""
         from artwork_picker_dialog import ArtworkPickerDialog
         try:
-            self._on_log(f"[INTERACTIVE] Showing dialog for {self._dialog_title}")
+            self._on_log(f"[INTERACTIVE] Showing dialog for {title}")
 
             dialog = ArtworkPickerDialog(
-                title=self._dialog_title,
-                platform=self._dialog_platform,
-                artwork_options=self._dialog_options,
+                title=title,
+                platform=platform,
+                artwork_options=artwork_options,
                 parent=self
             )
 
@@ -1103,13 +1309,13 @@ if ($device) {{
             selected = dialog.get_selected_index()
 
             self._on_log(f"[INTERACTIVE] Dialog result: exec={dialog_result}, selected={selected}")
-            self._dialog_result.put(selected)
+            result_queue.put(selected)
 
         except Exception as e:
             import traceback
             self._on_log(f"[ERROR] Dialog exception: {e}")
             self._on_log(f"[ERROR] Traceback: {traceback.format_exc()}")
-            self._dialog_result.put(None)
+            result_queue.put(None)
 
     def _on_finished(self, ok: bool, msg: str):
         """Handle processing completion."""
@@ -1127,30 +1333,19 @@ if ($device) {{
         if not path_obj.exists():
             return
 
-        label = QLabel()
-        label.setFixedSize(128, 128)  # Larger preview icons
-        label.setScaledContents(True)
-        label.setStyleSheet("border: 1px solid #3a3d42; border-radius: 6px;")
-
-        pixmap = QPixmap(path)
-        if not pixmap.isNull():
-            label.setPixmap(pixmap)
-            label.setToolTip(path_obj.stem)
+        # Only the header is read here; the grid decodes the image when its
+        # row scrolls into view
+        if not QImageReader(path).canRead():
+            return
 
-            row = len(self.preview_items) // 6  # 6 per row for larger icons
-            col = len(self.preview_items) % 6
-            self.preview_grid.addWidget(label, row, col)
-            self.preview_items.append(label)
+        self.preview_grid.add_path(path)
 
-            # Also add to popout window if open
-            self._add_preview_to_popout(path)
+        # Also add to popout window if open
+        self._add_preview_to_popout(path)
 
     def _clear_preview(self):
         """Clear preview grid."""
-        for item in self.preview_items:
-            self.preview_grid.removeWidget(item)
-            item.deleteLater()
-        self.preview_items.clear()
+        self.preview_grid.clear()
 
     def _open_output(self):
         """Open output directory."""
@@ -1162,8 +1357,7 @@ if ($device) {{
             return
 
         try:
-            with open(cfg_path, "r", encoding="utf-8") as f:
-                cfg = yaml.safe_load(f) or {}
+            cfg = run_backend.load_yaml(cfg_path)
 
             output_dir = Path(cfg.get("paths", {}).get("output_dir", "./output"))
             if not output_dir.exists():
@@ -1271,7 +1465,7 @@ if ($device) {{
 
             # Clear and populate the tree with the manual platform
             self.platform_tree.clear()
-            self.games_list.clear()
+            self._clear_games_list()
 
             item = QTreeWidgetItem([f"{platform_key} ({len(games)})"])
             item.setData(0, Qt.UserRole, platform_key)
@@ -1398,7 +1592,7 @@ if ($device) {{
 
             # Clear previous data
             self.platform_tree.clear()
-            self.games_list.clear()
+            self._clear_games_list()
 
             # Perform ADB scan of iiSU assets folder
             results = self._scan_iisu_assets_via_adb(device_id, assets_path)
@@ -1501,9 +1695,7 @@ if ($device) {{
             platforms = [p.strip() for p in result.stdout.strip().split('\n') if p.strip()]
             print(f"[DEBUG] Found platforms: {platforms}")
 
-            # Map lowercase folder names to standard platform keys
-            from rom_parser import FOLDER_TO_PLATFORM
-
+            # Map lowercase folder names to standard platform keys (FOLDER_TO_PLATFORM)
             for platform_folder in platforms:
                 platform_path = f"{assets_path}/{platform_folder}"
 
@@ -1780,15 +1972,13 @@ if ($device) {{
         self._popout_scroll_area = QScrollArea()
         self._popout_scroll_area.setWidgetResizable(True)
 
-        self._popout_preview_widget = QWidget()
-        self._popout_preview_grid = QGridLayout(self._popout_preview_widget)
-        self._popout_preview_grid.setSpacing(8)
-        self._popout_scroll_area.setWidget(self._popout_preview_widget)
+        # Larger icons, 4 per row in popout
+        self._popout_preview_grid = PreviewGrid(self._popout_scroll_area, icon_size=160,
+                                                columns=4, spacing=8, radius=8)
 
         popout_layout.addWidget(self._popout_scroll_area)
 
         # Copy existing previews to popout window
-        self._popout_preview_items = []
         self._sync_previews_to_popout()
 
         # Button row
@@ -1814,24 +2004,10 @@ if ($device) {{
 
     def _sync_previews_to_popout(self):
         """Sync preview items to the popout window."""
-        if not hasattr(self, '_popout_preview_grid'):
+        if not self._popout_preview_grid:
             return
 
-        # Copy all preview items to the popout
-        for i, preview_label in enumerate(self.preview_items):
-            pixmap = preview_label.pixmap()
-            if pixmap:
-                label = QLabel()
-                label.setFixedSize(160, 160)  # Larger in popout
-                label.setScaledContents(True)
-                label.setStyleSheet("border: 1px solid #3a3d42; border-radius: 8px;")
-                label.setPixmap(pixmap)
-                label.setToolTip(preview_label.toolTip())
-
-                row = i // 4  # 4 per row in popout
-                col = i % 4
-                self._popout_preview_grid.addWidget(label, row, col)
-                self._popout_preview_items.append(label)
+        self._popout_preview_grid.set_paths(self.preview_grid.paths)
 
     def _dock_preview(self):
         """Dock the preview back to inline view."""
@@ -1840,12 +2016,8 @@ if ($device) {{
 
     def _on_popout_closed(self):
         """Handle popout window being closed."""
-        # Clear popout items
-        if hasattr(self, '_popout_preview_items'):
-            for item in self._popout_preview_items:
-                item.deleteLater()
-            self._popout_preview_items = []
-
+        # Popout grid is deleted along with the window
+        self._popout_preview_grid = None
         self._preview_popout_window = None
 
         # Show inline preview again
@@ -1855,24 +2027,7 @@ if ($device) {{
 
     def _add_preview_to_popout(self, path: str):
         """Add a preview to the popout window if it's open."""
-        if not self._preview_popout_window or not hasattr(self, '_popout_preview_grid'):
-            return
-
-        path_obj = Path(path)
-        if not path_obj.exists():
+        if not self._preview_popout_window or not self._popout_preview_grid:
             return
 
-        label = QLabel()
-        label.setFixedSize(160, 160)
-        label.setScaledContents(True)
-        label.setStyleSheet("border: 1px solid #3a3d42; border-radius: 8px;")
-
-        pixmap = QPixmap(path)
-        if not pixmap.isNull():
-            label.setPixmap(pixmap)
-            label.setToolTip(path_obj.stem)
-
-            row = len(self._popout_preview_items) // 4
-            col = len(self._popout_preview_items) % 4
-            self._popout_preview_grid.addWidget(label, row, col)
-            self._popout_preview_items.append(label)
+        self._popout_preview_grid.add_path(path)
@@ -6,8 +6,12 @@ Supports iiSU ROM directory structure and manual folder selection.
 import os
 import re
 import sys
+import json
 import string
+import hashlib
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple, Any
 
@@ -137,11 +141,12 @@ IISU_PLATFORM_FOLDERS = {
 
 # Build reverse lookup from folder name to platform key
 def _build_folder_to_platform_map() -> Dict[str, str]:
-    mapping = {}
-    for platform_key, folder_names in IISU_PLATFORM_FOLDERS.items():
-        for folder_name in folder_names:
-            mapping[folder_name.lower()] = platform_key
-    return mapping
+    # Platform keys are interned so lookups hand back one shared string object
+    return {
+        folder_name.lower(): sys.intern(platform_key)
+        for platform_key, folder_names in IISU_PLATFORM_FOLDERS.items()
+        for folder_name in folder_names
+    }
 
 FOLDER_TO_PLATFORM = _build_folder_to_platform_map()
 
@@ -640,6 +645,13 @@ def is_non_rom_file(path: Path) -> bool:
     return False
 
 
+# Files that indicate a metadata-only folder
+_METADATA_ONLY_FILES = {
+    'systeminfo.txt', 'systeminfo', 'info.txt', 'readme.txt',
+    '.nomedia', 'thumbs.db', 'desktop.ini', '.ds_store'
+}
+
+
 def is_systeminfo_only_folder(folder_path: Path) -> bool:
     """
     Check if a folder only contains systeminfo or other non-ROM metadata files.
@@ -647,27 +659,26 @@ def is_systeminfo_only_folder(folder_path: Path) -> bool:
     """
     if not folder_path.is_dir():
         return False
+    return _is_metadata_only_dir(folder_path)
 
-    # Files that indicate a metadata-only folder
-    metadata_only_files = {
-        'systeminfo.txt', 'systeminfo', 'info.txt', 'readme.txt',
-        '.nomedia', 'thumbs.db', 'desktop.ini', '.ds_store'
-    }
 
+def _is_metadata_only_dir(folder_path) -> bool:
+    """is_systeminfo_only_folder() for a path already known to be a directory."""
     has_any_files = False
     has_non_metadata = False
 
     try:
-        for item in folder_path.iterdir():
-            if item.is_file():
-                has_any_files = True
-                if item.name.lower() not in metadata_only_files:
+        with os.scandir(folder_path) as it:
+            for entry in it:
+                if entry.is_file():
+                    has_any_files = True
+                    if entry.name.lower() not in _METADATA_ONLY_FILES:
+                        has_non_metadata = True
+                        break
+                elif entry.is_dir():
+                    # Has subdirectories - not a simple metadata folder
                     has_non_metadata = True
                     break
-            elif item.is_dir():
-                # Has subdirectories - not a simple metadata folder
-                has_non_metadata = True
-                break
     except PermissionError:
         return True  # Can't read, treat as non-game folder
 
@@ -675,10 +686,14 @@ def is_systeminfo_only_folder(folder_path: Path) -> bool:
     return has_any_files and not has_non_metadata
 
 
+@lru_cache(maxsize=1024)
 def detect_platform_from_folder(folder_name: str) -> Optional[str]:
     """
     Attempt to detect the platform key from a folder name.
     Returns platform key (e.g., 'NES', 'PS2') or None if not recognized.
+
+    Results are cached; unrecognized names otherwise fall through to a
+    substring scan of every known folder variant.
     """
     folder_lower = folder_name.lower().strip()
 
@@ -694,7 +709,35 @@ def detect_platform_from_folder(folder_name: str) -> Optional[str]:
     return None
 
 
-def scan_iisu_directory(root_path: Path) -> Dict[str, List[Tuple[str, Path]]]:
+# Upper bound on platform folders scanned in parallel by scan_iisu_directory
+SCAN_MAX_WORKERS = 8
+
+
+def _platform_fingerprint(platform_entry: os.DirEntry) -> Tuple[int, ...]:
+    """
+    Cheap change marker for a platform folder, compared before rescanning it.
+
+    (folder mtime, entry count, newest entry mtime): the folder's own mtime
+    catches adds/removes/renames, and the entries' mtimes catch changes inside
+    game folders (e.g. a ROM added to a folder that only held metadata).
+    """
+    count = 0
+    newest = 0
+    with os.scandir(platform_entry.path) as it:
+        for entry in it:
+            count += 1
+            try:
+                mtime = entry.stat(follow_symlinks=False).st_mtime_ns
+            except OSError:
+                continue
+            if mtime > newest:
+                newest = mtime
+    return (platform_entry.stat().st_mtime_ns, count, newest)
+
+
+def scan_iisu_directory(root_path: Path,
+                        platform_cache: Optional[Dict[str, Tuple[Tuple[int, ...], List[Tuple[str, Path]]]]] = None
+                        ) -> Dict[str, List[Tuple[str, Path]]]:
     """
     Scan an iiSU-style ROM directory structure.
 
@@ -710,6 +753,10 @@ def scan_iisu_directory(root_path: Path) -> Dict[str, List[Tuple[str, Path]]]:
     │   └── ...
     └── ...
 
+    If platform_cache is given (platform folder path -> (fingerprint, games)),
+    platform folders whose fingerprint is unchanged reuse the cached games,
+    and the cache is updated in place for the ones that were rescanned.
+
     Returns:
         Dict mapping platform_key -> List of (game_title, game_path) tuples
     """
@@ -719,20 +766,43 @@ def scan_iisu_directory(root_path: Path) -> Dict[str, List[Tuple[str, Path]]]:
         return results
 
     # Scan top-level folders (platforms)
-    for platform_folder in root_path.iterdir():
-        if not platform_folder.is_dir():
-            continue
+    with os.scandir(root_path) as it:
+        platform_entries = [entry for entry in it if entry.is_dir()]
+
+    platform_dirs = []
+    for entry in platform_entries:
+        platform_key = detect_platform_from_folder(entry.name)
+        if platform_key:
+            platform_dirs.append((entry, platform_key))
+
+    if platform_cache is not None:
+        # Forget folders that no longer exist
+        current = {entry.path for entry, _ in platform_dirs}
+        for stale in [path for path in platform_cache if path not in current]:
+            del platform_cache[stale]
+
+    if not platform_dirs:
+        return results
 
-        platform_key = detect_platform_from_folder(platform_folder.name)
-        if not platform_key:
-            continue
+    def scan_platform(entry: os.DirEntry, platform_key: str) -> List[Tuple[str, Path]]:
+        if platform_cache is None:
+            return scan_platform_folder(Path(entry.path), platform_key)
 
-        if platform_key not in results:
-            results[platform_key] = []
+        fingerprint = _platform_fingerprint(entry)
+        cached = platform_cache.get(entry.path)
+        if cached and cached[0] == fingerprint:
+            return cached[1]
+
+        games = scan_platform_folder(Path(entry.path), platform_key)
+        platform_cache[entry.path] = (fingerprint, games)
+        return games
 
-        # Scan the platform folder for games
-        games = scan_platform_folder(platform_folder, platform_key)
-        results[platform_key].extend(games)
+    # Platform folders are independent; scanning them concurrently keeps
+    # several directory listings in flight on slow or network storage
+    with ThreadPoolExecutor(max_workers=min(SCAN_MAX_WORKERS, len(platform_dirs))) as executor:
+        scanned = executor.map(lambda args: scan_platform(*args), platform_dirs)
+        for (_, platform_key), games in zip(platform_dirs, scanned):
+            results.setdefault(platform_key, []).extend(games)
 
     return results
 
@@ -750,33 +820,43 @@ def scan_platform_folder(platform_path: Path, platform_key: str) -> List[Tuple[s
     """
     games: List[Tuple[str, Path]] = []
     seen_titles: Set[str] = set()
-
-    platform_exts = ROM_EXTENSIONS.get(platform_key, get_all_rom_extensions())
-
-    for item in platform_path.iterdir():
-        if item.is_dir():
-            # Skip system/hidden folders
-            if item.name.startswith('.') or item.name.lower() in NON_ROM_FILES:
-                continue
-            # Skip folders that only contain systeminfo.txt or similar metadata
-            if is_systeminfo_only_folder(item):
-                continue
-            # Game folder - use folder name as title
-            game_title = clean_game_title(item.name)
-            if game_title and game_title.lower() not in seen_titles:
-                seen_titles.add(game_title.lower())
-                games.append((game_title, item))
-
-        elif item.is_file():
-            # Skip non-ROM files (system files, metadata, etc.)
-            if is_non_rom_file(item):
-                continue
-            # Check if it's a ROM file or archive
-            if item.suffix.lower() in platform_exts or is_archive_file(item):
-                game_title = clean_game_title(item.stem)
-                if game_title and game_title.lower() not in seen_titles:
-                    seen_titles.add(game_title.lower())
-                    games.append((game_title, item))
+    # Bound once; these run for every entry in the folder
+    append_game = games.append
+    seen_add = seen_titles.add
+
+    # Only build the all-extensions fallback when the platform has no entry
+    platform_exts = ROM_EXTENSIONS.get(platform_key) or get_all_rom_extensions()
+
+    with os.scandir(platform_path) as it:
+        for entry in it:
+            if entry.is_dir():
+                # Skip system/hidden folders
+                if entry.name.startswith('.') or entry.name.lower() in NON_ROM_FILES:
+                    continue
+                # Skip folders that only contain systeminfo.txt or similar metadata
+                if _is_metadata_only_dir(entry.path):
+                    continue
+                # Game folder - use folder name as title
+                game_title = clean_game_title(entry.name)
+                if game_title:
+                    title_key = game_title.lower()
+                    if title_key not in seen_titles:
+                        seen_add(title_key)
+                        append_game((game_title, Path(entry.path)))
+
+            elif entry.is_file():
+                item = Path(entry.path)
+                # Skip non-ROM files (system files, metadata, etc.)
+                if is_non_rom_file(item):
+                    continue
+                # Check if it's a ROM file or archive
+                if item.suffix.lower() in platform_exts or is_archive_file(item):
+                    game_title = clean_game_title(item.stem)
+                    if game_title:
+                        title_key = game_title.lower()
+                        if title_key not in seen_titles:
+                            seen_add(title_key)
+                            append_game((game_title, item))
 
     # Sort by title
     games.sort(key=lambda x: x[0].lower())
@@ -797,46 +877,59 @@ def scan_generic_folder(folder_path: Path, platform_key: Optional[str] = None) -
     """
     games: List[Tuple[str, Path]] = []
     seen_titles: Set[str] = set()
+    # Bound once; these run for every entry in the folder
+    append_game = games.append
+    seen_add = seen_titles.add
 
     if platform_key:
-        valid_exts = ROM_EXTENSIONS.get(platform_key, get_all_rom_extensions())
+        valid_exts = ROM_EXTENSIONS.get(platform_key) or get_all_rom_extensions()
     else:
         valid_exts = get_all_rom_extensions()
 
     if not folder_path.exists() or not folder_path.is_dir():
         return games
 
-    for item in folder_path.iterdir():
-        if item.is_dir():
-            # Skip system/hidden folders
-            if item.name.startswith('.') or item.name.lower() in NON_ROM_FILES:
-                continue
-            # Skip folders that only contain systeminfo.txt or similar metadata
-            if is_systeminfo_only_folder(item):
-                continue
-            # Check if folder contains ROMs (treat as game folder)
-            has_roms = False
-            for sub_item in item.iterdir():
-                if sub_item.is_file() and not is_non_rom_file(sub_item):
-                    if sub_item.suffix.lower() in valid_exts or is_archive_file(sub_item):
-                        has_roms = True
-                        break
-
-            if has_roms:
-                game_title = clean_game_title(item.name)
-                if game_title and game_title.lower() not in seen_titles:
-                    seen_titles.add(game_title.lower())
-                    games.append((game_title, item))
-
-        elif item.is_file():
-            # Skip non-ROM files (system files, metadata, etc.)
-            if is_non_rom_file(item):
-                continue
-            if item.suffix.lower() in valid_exts or is_archive_file(item):
-                game_title = clean_game_title(item.stem)
-                if game_title and game_title.lower() not in seen_titles:
-                    seen_titles.add(game_title.lower())
-                    games.append((game_title, item))
+    with os.scandir(folder_path) as it:
+        for entry in it:
+            if entry.is_dir():
+                # Skip system/hidden folders
+                if entry.name.startswith('.') or entry.name.lower() in NON_ROM_FILES:
+                    continue
+                # Skip folders that only contain systeminfo.txt or similar metadata
+                if _is_metadata_only_dir(entry.path):
+                    continue
+                # Check if folder contains ROMs (treat as game folder)
+                has_roms = False
+                with os.scandir(entry.path) as sub_it:
+                    for sub_entry in sub_it:
+                        if not sub_entry.is_file():
+                            continue
+                        sub_item = Path(sub_entry.path)
+                        if not is_non_rom_file(sub_item):
+                            if sub_item.suffix.lower() in valid_exts or is_archive_file(sub_item):
+                                has_roms = True
+                                break
+
+                if has_roms:
+                    game_title = clean_game_title(entry.name)
+                    if game_title:
+                        title_key = game_title.lower()
+                        if title_key not in seen_titles:
+                            seen_add(title_key)
+                            append_game((game_title, Path(entry.path)))
+
+            elif entry.is_file():
+                item = Path(entry.path)
+                # Skip non-ROM files (system files, metadata, etc.)
+                if is_non_rom_file(item):
+                    continue
+                if item.suffix.lower() in valid_exts or is_archive_file(item):
+                    game_title = clean_game_title(item.stem)
+                    if game_title:
+                        title_key = game_title.lower()
+                        if title_key not in seen_titles:
+                            seen_add(title_key)
+                            append_game((game_title, item))
 
     games.sort(key=lambda x: x[0].lower())
     return games
@@ -1488,10 +1581,14 @@ class ROMScanner:
     ROM Scanner class for managing ROM directory scanning with caching.
     """
 
-    def __init__(self, iisu_path: Optional[Path] = None):
+    def __init__(self, iisu_path: Optional[Path] = None, index_dir: Optional[Path] = None):
         self.iisu_path = iisu_path
+        # Directory for the persisted per-platform scan index (None = memory only)
+        self.index_dir = index_dir
         self._cache: Dict[str, List[Tuple[str, Path]]] = {}
         self._last_scan_time: Optional[float] = None
+        self._platform_cache: Dict[str, Tuple[Tuple[int, ...], List[Tuple[str, Path]]]] = {}
+        self._platform_cache_root: Optional[Path] = None
 
     def set_iisu_path(self, path: Optional[Path]):
         """Set the iiSU ROM directory path."""
@@ -1516,11 +1613,61 @@ class ROMScanner:
             return self._cache
 
         import time
-        self._cache = scan_iisu_directory(self.iisu_path)
+        if self._platform_cache_root != self.iisu_path:
+            self._platform_cache = self._load_index()
+            self._platform_cache_root = self.iisu_path
+
+        self._cache = scan_iisu_directory(self.iisu_path, self._platform_cache)
         self._last_scan_time = time.time()
+        self._save_index()
 
         return self._cache
 
+    def _index_path(self) -> Optional[Path]:
+        """Location of the persisted scan index for the current directory."""
+        if not self.index_dir or not self.iisu_path:
+            return None
+        key = hashlib.sha256(str(Path(self.iisu_path).absolute()).encode("utf-8")).hexdigest()
+        return Path(self.index_dir) / f"rom_index_{key[:16]}.json"
+
+    def _load_index(self) -> Dict[str, Tuple[Tuple[int, ...], List[Tuple[str, Path]]]]:
+        """Load the per-platform scan index saved by a previous session."""
+        index_path = self._index_path()
+        if not index_path or not index_path.exists():
+            return {}
+
+        try:
+            obj = json.loads(index_path.read_text(encoding="utf-8"))
+            return {
+                folder: (tuple(entry["fingerprint"]), [(title, Path(path)) for title, path in entry["games"]])
+                for folder, entry in obj.get("platforms", {}).items()
+            }
+        except Exception as e:
+            print(f"Ignoring unreadable ROM scan index {index_path}: {e}")
+            return {}
+
+    def _save_index(self):
+        """Persist the per-platform scan index so the next session can skip unchanged folders."""
+        index_path = self._index_path()
+        if not index_path:
+            return
+
+        obj = {
+            "root": str(self.iisu_path),
+            "platforms": {
+                folder: {
+                    "fingerprint": list(fingerprint),
+                    "games": [[title, str(path)] for title, path in games],
+                }
+                for folder, (fingerprint, games) in self._platform_cache.items()
+            },
+        }
+        try:
+            index_path.parent.mkdir(parents=True, exist_ok=True)
+            index_path.write_text(json.dumps(obj), encoding="utf-8")
+        except OSError as e:
+            print(f"Failed to save ROM scan index {index_path}: {e}")
+
     def get_platforms(self) -> List[str]:
         """Get list of available platforms from the scanned directory."""
         if not self._cache:
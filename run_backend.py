@@ -1,6 +1,7 @@
 import os
 import re
 import sys
+import copy
 import json
 import time
 import hashlib
@@ -11,8 +12,8 @@ import subprocess
 from io import BytesIO
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
-from collections import deque
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 import html
 from urllib.parse import unquote
 
@@ -20,6 +21,12 @@ import requests
 import yaml
 from PIL import Image, ImageOps, ImageChops, ImageFilter
 
+# Prefer libyaml's C loader/dumper when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
 
 def _get_subprocess_flags():
     """Get platform-specific subprocess flags to hide console on Windows."""
@@ -89,9 +96,54 @@ def safe_slug(s: str, limit: int = 180) -> str:
 def sha256_text(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
+# Parsed YAML per path, reused while the file's (mtime, size) is unchanged
+_yaml_cache: "OrderedDict[str, Tuple[int, int, dict]]" = OrderedDict()
+_yaml_cache_lock = threading.Lock()
+_YAML_CACHE_SIZE = 16
+
 def load_yaml(path: Path) -> dict:
+    """Load a YAML file, skipping the parse when the file hasn't changed.
+
+    Returns a deep copy so callers are free to modify the result.
+    """
+    path = Path(path)
+    st = path.stat()
+    key = str(path)
+
+    with _yaml_cache_lock:
+        cached = _yaml_cache.get(key)
+        if cached and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            _yaml_cache.move_to_end(key)
+            return copy.deepcopy(cached[2])
+
     with path.open("r", encoding="utf-8") as f:
-        return yaml.safe_load(f) or {}
+        data = yaml.load(f, Loader=_SafeLoader) or {}
+
+    with _yaml_cache_lock:
+        _yaml_cache[key] = (st.st_mtime_ns, st.st_size, data)
+        _yaml_cache.move_to_end(key)
+        while len(_yaml_cache) > _YAML_CACHE_SIZE:
+            _yaml_cache.popitem(last=False)
+    return copy.deepcopy(data)
+
+def save_yaml(path: Path, data: dict) -> None:
+    """Write a YAML file and seed the load_yaml cache so the next load skips the read.
+
+    The cache is seeded by parsing the dumped text, so it holds exactly what
+    load_yaml would read back from the file.
+    """
+    path = Path(path)
+    text = yaml.dump(data, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
+    with path.open("w", encoding="utf-8") as f:
+        f.write(text)
+    st = path.stat()
+    parsed = yaml.load(text, Loader=_SafeLoader) or {}
+
+    with _yaml_cache_lock:
+        _yaml_cache[str(path)] = (st.st_mtime_ns, st.st_size, parsed)
+        _yaml_cache.move_to_end(str(path))
+        while len(_yaml_cache) > _YAML_CACHE_SIZE:
+            _yaml_cache.popitem(last=False)
 
 def norm_key(s: str) -> str:
     return re.sub(r"[^a-z0-9]+", "", (s or "").lower())
@@ -324,6 +376,34 @@ def find_best_database_match(search_term: str, database_titles: List[str], max_r
         return [search_term]
 
 
+def _detachable_callbacks(callbacks, detached: threading.Event) -> Optional[Dict[str, Any]]:
+    """Dict-style view of callbacks that goes quiet once detached is set.
+
+    run_job returns on cancel without joining its workers; anything a worker
+    still running after that emits is dropped instead of reaching the next job.
+    """
+    if callbacks is None:
+        return None
+
+    def gate(fn):
+        def call(*args):
+            if not detached.is_set():
+                return fn(*args)
+            return None
+        return call
+
+    gated = {}
+    for name in ("log", "progress", "preview", "request_selection"):
+        if isinstance(callbacks, dict):
+            fn = callbacks.get(name)
+        elif name == "request_selection":
+            fn = getattr(callbacks, name, None)
+        else:
+            fn = getattr(getattr(callbacks, name, None), "emit", None)
+        if callable(fn):
+            gated[name] = gate(fn)
+    return gated
+
 def _emit_log(callbacks, msg: str):
     if callbacks is None:
         return
@@ -1329,15 +1409,42 @@ def corner_mask_from_border(border_rgba: Image.Image, threshold: int = 18, shrin
         hard = hard.filter(ImageFilter.GaussianBlur(radius=feather))
     return hard
 
-def compose_with_border(base_img: Image.Image, border_path: Path, out_size: int, centering: Tuple[float, float] = (0.5, 0.5)) -> Image.Image:
-    base = center_crop_to_square(base_img, out_size, centering=centering)
+# Resized border + corner mask per (border file, size, mtime); a batch reuses the
+# same few borders, and building the mask flood-fills the whole image in Python
+_border_cache: "OrderedDict[Tuple[str, int, int], Tuple[Image.Image, Image.Image]]" = OrderedDict()
+_border_cache_lock = threading.Lock()
+_BORDER_CACHE_SIZE = 8
+
+def load_border(border_path: Path, out_size: int) -> Tuple[Image.Image, Image.Image]:
+    """Return (border RGBA, corner mask) at out_size, cached while the file is unchanged.
+
+    The returned images are shared; callers must not modify them.
+    """
+    key = (str(border_path), out_size, Path(border_path).stat().st_mtime_ns)
+
+    with _border_cache_lock:
+        cached = _border_cache.get(key)
+        if cached:
+            _border_cache.move_to_end(key)
+            return cached
 
     border = Image.open(border_path)
     border = ImageOps.exif_transpose(border).convert("RGBA")
     if border.size != (out_size, out_size):
         border = border.resize((out_size, out_size), Image.LANCZOS)
-
     mask = corner_mask_from_border(border, threshold=18, shrink_px=8, feather=0.8)
+
+    with _border_cache_lock:
+        _border_cache[key] = (border, mask)
+        _border_cache.move_to_end(key)
+        while len(_border_cache) > _BORDER_CACHE_SIZE:
+            _border_cache.popitem(last=False)
+    return border, mask
+
+def compose_with_border(base_img: Image.Image, border_path: Path, out_size: int, centering: Tuple[float, float] = (0.5, 0.5)) -> Image.Image:
+    base = center_crop_to_square(base_img, out_size, centering=centering)
+
+    border, mask = load_border(border_path, out_size)
     base.putalpha(ImageChops.multiply(base.split()[-1], mask))
     return Image.alpha_composite(base, border)
 
@@ -3108,6 +3215,10 @@ def run_job(
     config_path = Path(config_path)
     root = config_path.resolve().parent
 
+    # Set when a cancel returns without joining the workers, silencing any that are still running
+    detached = threading.Event()
+    callbacks = _detachable_callbacks(callbacks, detached)
+
     try:
         cfg = load_yaml(config_path)
     except Exception as e:
@@ -3424,7 +3535,7 @@ def run_job(
     # Prefetch cache for interactive mode - stores artwork fetched in background
     prefetch_cache: Dict[str, List[Dict[str, Any]]] = {}
     prefetch_lock = threading.Lock()
-    prefetch_thread: Optional[threading.Thread] = None
+    prefetch_threads: Dict[str, threading.Thread] = {}  # cache_key -> in-flight prefetch
 
     def prefetch_artwork(platform_key: str, title: str, hints: List[str], cache_key: str):
         """Prefetch artwork in background and store in cache."""
@@ -3437,27 +3548,28 @@ def run_job(
 
     def start_prefetch(platform_key: str, title: str, hints: List[str]):
         """Start prefetching artwork for a game in the background."""
-        nonlocal prefetch_thread
         cache_key = f"{platform_key}:{title}"
         with prefetch_lock:
-            if cache_key in prefetch_cache:
-                return  # Already cached
-        prefetch_thread = threading.Thread(
-            target=prefetch_artwork,
-            args=(platform_key, title, hints, cache_key),
-            daemon=True
-        )
-        prefetch_thread.start()
+            if cache_key in prefetch_cache or cache_key in prefetch_threads:
+                return  # Already cached or being fetched
+            thread = threading.Thread(
+                target=prefetch_artwork,
+                args=(platform_key, title, hints, cache_key),
+                daemon=True
+            )
+            prefetch_threads[cache_key] = thread
+        thread.start()
 
     def get_prefetched_or_fetch(platform_key: str, title: str, hints: List[str]) -> List[Dict[str, Any]]:
         """Get prefetched artwork if available, otherwise fetch now."""
-        nonlocal prefetch_thread
         cache_key = f"{platform_key}:{title}"
 
-        # Check if prefetch is in progress for this game
-        if prefetch_thread is not None and prefetch_thread.is_alive():
-            # Wait for prefetch to complete (with timeout)
-            prefetch_thread.join(timeout=35)
+        # Wait only for this game's prefetch; the next game's prefetch keeps
+        # running in the background while the user picks artwork for this one
+        with prefetch_lock:
+            thread = prefetch_threads.pop(cache_key, None)
+        if thread is not None and thread.is_alive():
+            thread.join(timeout=35)
 
         # Check cache
         with prefetch_lock:
@@ -4181,16 +4293,20 @@ def run_job(
 
     max_workers = max(1, int(workers))
 
-    # For interactive mode, process sequentially but with prefetching
-    if interactive_mode:
-        _emit_log(callbacks, "[INTERACTIVE] Using sequential processing with prefetching")
+    # Interactive mode processes sequentially with prefetching. A single
+    # worker also runs on the calling thread, so its thread-local SteamGridDB
+    # session (and open connections) carry over between run_job calls, e.g.
+    # the ROM browser's one-title-per-call batches
+    if interactive_mode or max_workers == 1:
+        if interactive_mode:
+            _emit_log(callbacks, "[INTERACTIVE] Using sequential processing with prefetching")
         for i, (p, t, b, o, r) in enumerate(tasks):
             if cancel.is_cancelled:
                 _emit_log(callbacks, "[STOP] Cancelled by user.")
                 break
 
             # Start prefetching next game's artwork while processing current
-            if i + 1 < len(tasks):
+            if interactive_mode and i + 1 < len(tasks):
                 next_p, next_t, _, _, _ = tasks[i + 1]
                 next_hints = platform_hints_cfg.get(next_p, []) or []
                 start_prefetch(next_p, next_t, next_hints)
@@ -4210,31 +4326,39 @@ def run_job(
                 _emit_progress(callbacks, done, total)
     else:
         # Non-interactive mode: use parallel processing
-        with ThreadPoolExecutor(max_workers=max_workers) as ex:
-            futures = [ex.submit(work_item, p, t, b, o, r) for (p, t, b, o, r) in tasks]
+        ex = ThreadPoolExecutor(max_workers=max_workers)
+        try:
+            pending = {ex.submit(work_item, p, t, b, o, r) for (p, t, b, o, r) in tasks}
 
-            for fut in as_completed(futures):
-                if cancel.is_cancelled:
-                    _emit_log(callbacks, "[STOP] Cancelled by user. Cancelling remaining tasks...")
-                    # Cancel all pending futures
-                    for f in futures:
-                        f.cancel()
-                    # Shutdown executor immediately
-                    ex.shutdown(wait=False, cancel_futures=True)
-                    break
+            while pending:
+                # Wake up periodically so a cancel is seen even while every
+                # worker is still busy, instead of only when a task finishes
+                finished, pending = wait(pending, timeout=0.25, return_when=FIRST_COMPLETED)
 
-                ok = False
-                try:
-                    ok = fut.result(timeout=1.0)  # Add timeout to prevent hanging
-                except Exception:
+                for fut in finished:
                     ok = False
+                    try:
+                        ok = fut.result()
+                    except Exception:
+                        ok = False
 
-                if not ok:
-                    errors += 1
+                    if not ok:
+                        errors += 1
+
+                    with done_lock:
+                        done += 1
+                        _emit_progress(callbacks, done, total)
 
-                with done_lock:
-                    done += 1
-                    _emit_progress(callbacks, done, total)
+                if cancel.is_cancelled:
+                    _emit_log(callbacks, "[STOP] Cancelled by user. Cancelling remaining tasks...")
+                    break
+        finally:
+            # On cancel, drop queued tasks and return without joining the
+            # workers; running items stop at their next cancel check, and
+            # anything they emit until then is dropped
+            if cancel.is_cancelled:
+                detached.set()
+            ex.shutdown(wait=not cancel.is_cancelled, cancel_futures=True)
 
     if cancel.is_cancelled:
         return False, f"Cancelled. Completed {done}/{total} (errors={errors})."
@@ -6,13 +6,14 @@ import sys
 from pathlib import Path
 
 from PySide6.QtCore import Qt, QUrl, QSize
-from PySide6.QtGui import QIcon, QFontDatabase, QDesktopServices, QPixmap, QPainter, QColor, QBrush
+from PySide6.QtGui import QIcon, QFontDatabase, QDesktopServices, QPixmap, QPixmapCache, QPainter, QColor, QBrush
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QTabWidget, QWidget,
     QVBoxLayout, QHBoxLayout, QLabel, QPushButton
 )
 
 from app_paths import get_app_dir, get_logo_path, get_theme_path, get_fonts_dir, get_src_dir, get_config_path, verify_required_assets
+from run_backend import load_yaml, save_yaml
 
 
 class DotPatternWidget(QWidget):
@@ -107,6 +108,9 @@ class MainWindowWithTabs(QMainWindow):
         # Theme state (load from settings)
         self._dark_mode = self._load_theme_preference()
 
+        # Settings dialog, created on first open and reused afterwards
+        self._options_dialog = None
+
         # Set window icon if logo exists
         logo_path = get_logo_path()
         if logo_path.exists():
@@ -211,11 +215,9 @@ class MainWindowWithTabs(QMainWindow):
         """Load theme preference from config. Returns True for dark mode, False for light."""
         try:
             from pathlib import Path
-            import yaml
             cfg_path = Path(get_config_path())
             if cfg_path.exists():
-                with open(cfg_path, "r", encoding="utf-8") as f:
-                    cfg = yaml.safe_load(f) or {}
+                cfg = load_yaml(cfg_path)
                 return cfg.get("ui", {}).get("dark_mode", True)
         except Exception:
             pass
@@ -225,16 +227,13 @@ class MainWindowWithTabs(QMainWindow):
         """Save theme preference to config."""
         try:
             from pathlib import Path
-            import yaml
             cfg_path = Path(get_config_path())
             if cfg_path.exists():
-                with open(cfg_path, "r", encoding="utf-8") as f:
-                    cfg = yaml.safe_load(f) or {}
+                cfg = load_yaml(cfg_path)
                 if "ui" not in cfg:
                     cfg["ui"] = {}
                 cfg["ui"]["dark_mode"] = self._dark_mode
-                with open(cfg_path, "w", encoding="utf-8") as f:
-                    yaml.dump(cfg, f, default_flow_style=False, sort_keys=False)
+                save_yaml(cfg_path, cfg)
         except Exception as e:
             print(f"Failed to save theme preference: {e}")
 
@@ -396,7 +395,6 @@ class MainWindowWithTabs(QMainWindow):
     def _open_settings(self):
         """Open the settings dialog."""
         from options_dialog import OptionsDialog
-        import yaml
         from pathlib import Path
 
         # Get the current icon generator tab to access its settings
@@ -418,8 +416,7 @@ class MainWindowWithTabs(QMainWindow):
             try:
                 cfg_path = Path(icon_tab.config_path)
                 if cfg_path.exists():
-                    with open(cfg_path, "r", encoding="utf-8") as f:
-                        cfg = yaml.safe_load(f) or {}
+                    cfg = load_yaml(cfg_path)
                     rom_settings = cfg.get("rom_directory", {})
                     hero_settings = cfg.get("hero_images", {})
                     fallback_settings = cfg.get("fallback_icons", {})
@@ -441,21 +438,23 @@ class MainWindowWithTabs(QMainWindow):
             workers = processing_settings.get("workers", icon_tab.workers_value)
             limit = processing_settings.get("limit", icon_tab.limit_value)
 
-            dialog = OptionsDialog(
-                parent=self,
+            # Reuse the dialog between opens so its tabs aren't rebuilt every time
+            dialog_args = dict(
                 config_path=icon_tab.config_path,
                 workers=workers,
                 limit=limit,
                 source_priority_widget=icon_tab.source_priority,
                 rom_directory_settings=rom_settings
             )
+            if self._options_dialog is None:
+                self._options_dialog = OptionsDialog(parent=self, **dialog_args)
+            else:
+                self._options_dialog.refresh_state(**dialog_args)
+            dialog = self._options_dialog
 
             # Set hero settings if available
             if hero_settings:
-                dialog.hero_settings = hero_settings
-                dialog.hero_enabled.setChecked(hero_settings.get("enabled", True))
-                dialog.hero_count.setValue(hero_settings.get("count", 1))
-                dialog.hero_save_with_icons.setChecked(hero_settings.get("save_with_icons", True))
+                dialog.set_hero_settings(hero_settings)
 
             # Set fallback settings if available
             if fallback_settings:
@@ -551,7 +550,6 @@ class MainWindowWithTabs(QMainWindow):
                                   custom_border_settings=None, custom_platforms=None,
                                   processing_settings=None, export_settings=None):
         """Save all settings to config file for persistence between sessions."""
-        import yaml
         from pathlib import Path
 
         cfg_path = Path(config_path)
@@ -559,8 +557,7 @@ class MainWindowWithTabs(QMainWindow):
             return
 
         try:
-            with open(cfg_path, "r", encoding="utf-8") as f:
-                cfg = yaml.safe_load(f) or {}
+            cfg = load_yaml(cfg_path)
 
             # Core settings
             cfg["rom_directory"] = rom_settings
@@ -603,8 +600,7 @@ class MainWindowWithTabs(QMainWindow):
                         "custom": True
                     }
 
-            with open(cfg_path, "w", encoding="utf-8") as f:
-                yaml.dump(cfg, f, default_flow_style=False, sort_keys=False)
+            save_yaml(cfg_path, cfg)
 
         except Exception as e:
             print(f"Failed to save settings: {e}")
@@ -632,6 +628,9 @@ def main():
 
     app = QApplication(sys.argv)
 
+    # Room for decoded preview thumbnails (KB)
+    QPixmapCache.setCacheLimit(32 * 1024)
+
     # Check for missing required assets and warn user
     asset_check = verify_required_assets()
     if asset_check['missing']: